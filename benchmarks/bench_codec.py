@@ -0,0 +1,53 @@
+"""Разбор страниц выдачи api.hh.ru: json.loads полных ответов против codec.decode_vacancy_page.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_codec --size 100000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_api_pages
+from src import codec
+
+
+def measure(decode, bodies: list) -> tuple:
+    """Время разбора всех страниц и память, занимаемая результатом."""
+    gc.collect()
+    start = time.perf_counter()
+    pages = [decode(body) for body in bodies]
+    elapsed = time.perf_counter() - start
+    del pages
+
+    gc.collect()
+    tracemalloc.start()
+    pages = [decode(body) for body in bodies]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pages
+    return elapsed, memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="количество вакансий")
+    args = parser.parse_args()
+
+    bodies = [json.dumps(page, ensure_ascii=False).encode("utf-8") for page in generate_api_pages(args.size)]
+    print(f"Страниц: {len(bodies)}, объем ответов: {sum(map(len, bodies)) / 2**20:.1f} МБ")
+
+    report("json.loads (полные объекты)", *measure(json.loads, bodies))
+    for backend in codec.available_backends():
+        codec.set_backend(backend)
+        report(f"decode_vacancy_page [{backend}]", *measure(codec.decode_vacancy_page, bodies))
+
+
+def report(name: str, elapsed: float, memory: int) -> None:
+    print(f"{name:<32} время: {elapsed:.3f} с, память результата: {memory / 2**20:7.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
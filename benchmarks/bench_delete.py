@@ -0,0 +1,83 @@
+"""Удаление 10k из 100k вакансий: delete_vacancy_by_title в цикле против delete_many.
+
+Цикл перезаписывает (или дописывает) хранилище на каждое название, поэтому он измеряется
+на части названий (--loop-sample) и пересчитывается на все удаляемые вакансии.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_delete --size 100000 --delete 10000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.corpus import generate_records
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.jsonl_storage import JSONLVacancyStorage
+from src.sqlite_storage import SQLiteVacancyStorage
+
+STORAGES = {
+    "json": (JSONVacancyStorage, "vacancies.json"),
+    "jsonl": (JSONLVacancyStorage, "vacancies.jsonl"),
+    "sqlite": (SQLiteVacancyStorage, "vacancies.db"),
+}
+
+
+def open_filled(kind: str, directory: str, records: list):
+    storage_class, filename = STORAGES[kind]
+    path = os.path.join(directory, f"{len(os.listdir(directory))}_{filename}")
+    storage = storage_class(path)
+    storage.add_vacancies(records)
+    return storage
+
+
+def close(storage) -> None:
+    if isinstance(storage, SQLiteVacancyStorage):
+        storage.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="количество вакансий в хранилище")
+    parser.add_argument("--delete", type=int, default=10_000, help="количество удаляемых вакансий")
+    parser.add_argument("--loop-sample", type=int, default=20, help="сколько названий удалить циклом")
+    parser.add_argument("--storages", nargs="+", default=list(STORAGES), choices=list(STORAGES))
+    args = parser.parse_args()
+
+    # Уникальные названия: одно название - одна вакансия, как и один 'id'
+    records = [{**record, "title": f"{record['title']} #{record['id']}"} for record in generate_records(args.size)]
+    victims = random.Random(0).sample(records, args.delete)
+    titles = [record["title"] for record in victims]
+    ids = [record["id"] for record in victims]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in args.storages:
+            storage = open_filled(kind, directory, records)
+            start = time.perf_counter()
+            for title in titles[: args.loop_sample]:
+                storage.delete_vacancy_by_title(title)
+            loop = (time.perf_counter() - start) / args.loop_sample * args.delete
+            close(storage)
+
+            storage = open_filled(kind, directory, records)
+            start = time.perf_counter()
+            deleted = storage.delete_many(titles=titles)
+            by_titles = time.perf_counter() - start
+            close(storage)
+
+            storage = open_filled(kind, directory, records)
+            start = time.perf_counter()
+            storage.delete_many(ids=ids)
+            by_ids = time.perf_counter() - start
+            close(storage)
+
+            print(
+                f"{kind:<7} удалено {deleted}: цикл ~{loop:9.1f} с (по {args.loop_sample} названиям), "
+                f"delete_many(titles) {by_titles:6.2f} с, delete_many(ids) {by_ids:6.2f} с (x{loop / by_ids:,.0f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
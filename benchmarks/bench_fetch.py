@@ -0,0 +1,43 @@
+"""Сравнение последовательной и параллельной загрузки страниц с локального mock-сервера.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_fetch --found 2000 --latency 0.05 --workers 8
+"""
+
+import argparse
+import time
+
+from src.API_HH import HHVacancyAPI
+from tests.mock_hh_server import MockHHServer
+
+
+def measure(api: HHVacancyAPI, keyword: str) -> tuple:
+    """Время загрузки и количество полученных вакансий."""
+    start = time.perf_counter()
+    vacancies = api.get_vacancies(keyword)
+    return time.perf_counter() - start, len(vacancies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--found", type=int, default=2000, help="количество вакансий на сервере")
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка ответа сервера, сек")
+    parser.add_argument("--workers", type=int, default=8, help="размер пула потоков")
+    args = parser.parse_args()
+
+    with MockHHServer(found=args.found, latency=args.latency) as server:
+        sequential = HHVacancyAPI()
+        sequential.url = server.url
+        seq_time, seq_count = measure(sequential, "Python Developer")
+
+        concurrent = HHVacancyAPI(max_workers=args.workers)
+        concurrent.url = server.url
+        con_time, con_count = measure(concurrent, "Python Developer")
+
+    print(f"Последовательно:       {seq_time:.3f} с, вакансий: {seq_count}")
+    print(f"Параллельно ({args.workers} потоков): {con_time:.3f} с, вакансий: {con_count}")
+    print(f"Ускорение: x{seq_time / con_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
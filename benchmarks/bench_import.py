@@ -0,0 +1,50 @@
+"""Время импорта модулей src по данным python -X importtime.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_import --budget-ms 50
+
+Завершается с кодом 1, если импорт какого-либо модуля дольше бюджета.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict
+
+MODULES = ["src", "src.Vacancy", "src.Filtered_vacancy", "src.user_interaction", "src.cli"]
+
+
+def import_time_us(module: str) -> int:
+    """Суммарное время импорта модуля в микросекундах (лучшее из трех запусков)."""
+    best = None
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+        )
+        times: Dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+        total = times[module]
+        best = total if best is None else min(best, total)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=50, help="допустимое время импорта модуля, мс")
+    args = parser.parse_args()
+
+    exceeded = False
+    for module in MODULES:
+        elapsed_ms = import_time_us(module) / 1000
+        status = "ok" if elapsed_ms <= args.budget_ms else "превышен бюджет"
+        exceeded = exceeded or elapsed_ms > args.budget_ms
+        print(f"{module:<24} {elapsed_ms:8.1f} мс  {status}")
+    sys.exit(1 if exceeded else 0)
+
+
+if __name__ == "__main__":
+    main()
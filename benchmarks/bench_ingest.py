@@ -0,0 +1,58 @@
+"""Загрузка сохраненных ответов API в SQLite-хранилище при разном числе процессов.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_ingest --size 200000 --files 40 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import generate_api_pages
+from src.ingest import ingest_dumps, parse_dump
+from src.sqlite_storage import SQLiteVacancyStorage
+
+
+def write_dumps(directory: str, size: int, files: int) -> list:
+    """Раскладка страниц выдачи по files файлам, как при сохранении ответов по запросам."""
+    paths = [os.path.join(directory, f"dump_{i}.json") for i in range(files)]
+    shards: list = [[] for _ in range(files)]
+    for number, page in enumerate(generate_api_pages(size)):
+        shards[number % files].append(page)
+    for path, pages in zip(paths, shards):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(pages, file, ensure_ascii=False)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000, help="количество вакансий")
+    parser.add_argument("--files", type=int, default=40, help="количество файлов с ответами")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="числа процессов для сравнения")
+    args = parser.parse_args()
+
+    print(f"Ядер: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_dumps(directory, args.size, args.files)
+
+        start = time.perf_counter()
+        for path in paths:
+            parse_dump(path)
+        parse_time = time.perf_counter() - start
+        print(f"Только разбор в одном процессе: {parse_time:.2f} с ({args.size / parse_time:.0f} вакансий в секунду)")
+
+        for workers in args.workers:
+            storage = SQLiteVacancyStorage(os.path.join(directory, f"vacancies_{workers}.db"))
+            report = ingest_dumps(paths, storage, workers=workers)
+            storage.close()
+            print(
+                f"Процессов: {workers:>2}  время: {report['seconds']:6.2f} с, "
+                f"{report['records_per_second']:8.0f} вакансий в секунду, новых: {report['added']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Запись результатов в JSON: json.dump(indent=4) против потокового write_json.
+
+Каждый вариант запускается в отдельном процессе, чтобы пиковая память (RSS) не смешивалась.
+Данные - записи из data/vacancies.json, повторенные --copies раз.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_json_writer --copies 200
+"""
+
+import argparse
+import copy
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import load_template
+from src.json_writer import HAS_ZSTANDARD, write_json
+
+VARIANTS = {
+    "json.dump indent=4": None,
+    "write_json indent=4": {"indent": 4},
+    "write_json compact": {"indent": None},
+    "write_json compact utf-8": {"indent": None, "ensure_ascii": False},
+    "write_json compact gzip": {"indent": None, "compression": "gzip"},
+    "write_json compact zstd": {"indent": None, "compression": "zstd"},
+}
+
+
+def run_variant(name: str, copies: int, path: str) -> None:
+    """Запись в дочернем процессе; печатает время, размер файла и пиковый RSS."""
+    template = load_template()
+    # Отдельная копия каждой записи, как у записей, пришедших из API
+    records = (copy.deepcopy(record) for _ in range(copies) for record in template)
+    start = time.perf_counter()
+    options = VARIANTS[name]
+    if options is None:
+        data = list(records)
+        with open(path, "w") as file:
+            json.dump(data, file, indent=4)
+    else:
+        write_json(path, records, **options)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss в Linux - в килобайтах
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "size": os.path.getsize(path), "rss_mb": peak}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=200, help="сколько раз повторить записи data/vacancies.json")
+    parser.add_argument("--variant", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.copies, args.path)
+        return
+
+    print(f"Записей: {len(load_template()) * args.copies}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in VARIANTS:
+            if "zstd" in name and not HAS_ZSTANDARD:
+                print(f"{name:<26} пропущено: пакет zstandard не установлен")
+                continue
+            command = [sys.executable, "-m", "benchmarks.bench_json_writer", "--copies", str(args.copies)]
+            command += ["--variant", name, "--path", os.path.join(directory, "out.json")]
+            result = json.loads(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+            print(
+                f"{name:<26} время: {result['seconds']:.3f} с, размер: {result['size'] / 2**20:7.1f} МБ, "
+                f"пиковый RSS: {result['rss_mb']:6.1f} МБ"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Панель из 20 запросов к 100k вакансий: фильтры по очереди против QueryEngine (план, один проход, кэш).
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_query --size 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.corpus import generate_records
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.query import QueryEngine, VacancyQuery
+
+AREAS = [{"id": "1", "name": "Москва"}, {"id": "2", "name": "Санкт-Петербург"}, {"id": "88", "name": "Казань"}]
+
+
+def dashboard() -> list:
+    """Похожие запросы, как на панели: одни и те же условия в разных сочетаниях."""
+    base = VacancyQuery()
+    queries = []
+    for keyword in ("python", "django", "sql", "java*"):
+        for extra in (
+            base,
+            base.area("Москва"),
+            base.salary(minimum=100_000),
+            base.currency("RUR").salary(minimum=150_000, maximum=400_000),
+            base.title_contains("junior").area("Санкт-Петербург"),
+        ):
+            queries.append(extra.keywords(keyword))
+    return queries
+
+
+def unplanned(records: list, query: VacancyQuery) -> list:
+    """Прежний способ: отдельный проход на каждый запрос, условия в порядке объявления."""
+    predicates = sorted(query.predicates)
+    return [record for record in records if all(predicate.matches(record, {}) for predicate in predicates)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="количество вакансий")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    records = [{**record, "area": rng.choice(AREAS)} for record in generate_records(args.size)]
+    queries = dashboard()
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = JSONVacancyStorage(os.path.join(directory, "vacancies.json"))
+        storage.add_vacancies(records)
+        stored = storage.get_vacancies()
+
+        start = time.perf_counter()
+        expected = [unplanned(stored, query) for query in queries]
+        naive = time.perf_counter() - start
+
+        engine = QueryEngine(storage)
+        start = time.perf_counter()
+        planned = [engine.execute(query) for query in queries]
+        separate = time.perf_counter() - start
+        assert planned == expected
+
+        engine = QueryEngine(storage)
+        start = time.perf_counter()
+        batch = engine.execute_many(queries)
+        cold = time.perf_counter() - start
+        assert batch == expected
+
+        start = time.perf_counter()
+        engine.execute_many(queries)
+        warm = time.perf_counter() - start
+
+    print(f"{len(queries)} запросов к {args.size} вакансиям:")
+    print(f"  по очереди, условия без плана:      {naive:8.3f} с")
+    print(f"  по очереди, с планировщиком:        {separate:8.3f} с")
+    print(f"  execute_many, один проход:          {cold:8.3f} с")
+    print(f"  execute_many, результаты из кэша:   {warm * 1000:8.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Загрузка с mock-сервера с лимитом запросов: без планировщика и с адаптивным планировщиком.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_rate_limit --found 2000 --limit 10 --workers 8
+"""
+
+import argparse
+import time
+
+from src.API_HH import HHVacancyAPI
+from src.request_scheduler import RequestScheduler, TokenBucket
+from tests.mock_hh_server import MockHHServer
+
+
+def run(api: HHVacancyAPI, server: MockHHServer) -> None:
+    api.url = server.url
+    start = time.perf_counter()
+    vacancies = api.get_vacancies("Python Developer")
+    elapsed = time.perf_counter() - start
+    pages = len(api.fetched_pages)
+    print(
+        f"  вакансий: {len(vacancies)}, страниц: {pages}, неудачных страниц: {len(api.failed_pages)}, "
+        f"ответов 429: {server.throttled}, время: {elapsed:.1f} с, страниц в минуту: {pages / elapsed * 60:.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--found", type=int, default=2000, help="количество вакансий на сервере")
+    parser.add_argument("--limit", type=float, default=10, help="лимит сервера, запросов в секунду")
+    parser.add_argument("--workers", type=int, default=8, help="размер пула потоков")
+    args = parser.parse_args()
+
+    print(f"Лимит сервера: {args.limit * 60:.0f} запросов в минуту")
+    print("Без планировщика:")
+    with MockHHServer(found=args.found, rate_limit=args.limit) as server:
+        run(HHVacancyAPI(max_workers=args.workers), server)
+
+    print("С планировщиком:")
+    with MockHHServer(found=args.found, rate_limit=args.limit) as server:
+        scheduler = RequestScheduler(TokenBucket(rate=args.limit, capacity=1), max_retries=10)
+        run(HHVacancyAPI(max_workers=args.workers, scheduler=scheduler), server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Фильтрация, топ k и статистика по зарплатам: циклы по словарям против SalaryColumns (NumPy).
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_salary_columns --size 1000000
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.corpus import generate_records
+from src.Filtered_vacancy import match_criteria
+from src.ranking import salary_key, top_n
+from src.salary_columns import SalaryColumns
+
+
+def python_stats(records: list) -> dict:
+    """Медиана и квартили "от" по валютам обычным Python."""
+    by_currency: dict = {}
+    for record in records:
+        salary = record["salary"]
+        if salary and salary.get("from") is not None:
+            by_currency.setdefault(salary.get("currency"), []).append(salary["from"])
+    return {
+        currency: (statistics.median(values), statistics.quantiles(values, n=4))
+        for currency, values in by_currency.items()
+    }
+
+
+def timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="количество вакансий")
+    parser.add_argument("--repeat", type=int, default=3, help="число повторов каждой операции")
+    args = parser.parse_args()
+
+    records = list(generate_records(args.size))
+    start = time.perf_counter()
+    columns = SalaryColumns(records)
+    print(f"Построение колонок на {args.size}: {time.perf_counter() - start:.3f} с")
+
+    criteria = {"min_salary": 100_000, "max_salary": 300_000}
+    operations = [
+        (
+            "диапазон зарплат",
+            lambda: [record for record in records if match_criteria(record, criteria)],
+            lambda: columns.take(columns.filter_range(**criteria)),
+        ),
+        ("топ 100", lambda: top_n(records, 100, salary_key()), lambda: columns.take(columns.top_k(100))),
+        ("статистика по валютам", lambda: python_stats(records), lambda: columns.stats()),
+    ]
+    for name, python_func, numpy_func in operations:
+        python_time = timed(python_func, args.repeat)
+        numpy_time = timed(numpy_func, args.repeat)
+        print(f"{name:<22} Python: {python_time * 1000:8.1f} мс, NumPy: {numpy_time * 1000:8.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
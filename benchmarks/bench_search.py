@@ -0,0 +1,54 @@
+"""Полнотекстовый поиск: линейный просмотр описаний против VacancySearchIndex.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_search --size 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_records
+from src.search_index import VacancySearchIndex
+
+QUERIES = ("python", "python django", "sql", "опыт работы")
+
+
+def linear_search(records: list, query: str) -> list:
+    """Прежний способ: подстроки в описании, все слова запроса должны встретиться."""
+    words = query.lower().split()
+    return [
+        record
+        for record in records
+        if record["description"] and all(word in record["description"].lower() for word in words)
+    ]
+
+
+def best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="количество вакансий")
+    parser.add_argument("--repeat", type=int, default=5, help="число повторов каждого запроса")
+    args = parser.parse_args()
+
+    records = list(generate_records(args.size))
+    start = time.perf_counter()
+    index = VacancySearchIndex(records)
+    print(f"Построение индекса на {args.size}: {time.perf_counter() - start:.3f} с")
+
+    for query in QUERIES:
+        linear = best_time(lambda: linear_search(records, query), args.repeat)
+        indexed = best_time(lambda: index.search(query), args.repeat)
+        found = len(index.search(query))
+        print(f"{query!r:<16} найдено {found:>7}: линейно {linear * 1000:8.1f} мс, индекс {indexed * 1000:8.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Открытие 1M вакансий: JSON-файл хранилища против бинарного снимка (mmap).
+
+Каждый вариант открывается в отдельном процессе (холодный старт интерпретатора; файл при этом
+уже в страничном кэше ОС): измеряются открытие, первые запросы и пиковая память (RSS).
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_snapshot --size 1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_records
+from src.Filtered_vacancy import JSONVacancyStorage, match_criteria
+from src.snapshot import VacancySnapshot, write_snapshot
+
+VARIANTS = ("json.load", "JSONVacancyStorage", "VacancySnapshot")
+
+
+def run_variant(name: str, directory: str, size: int) -> None:
+    """Открытие в дочернем процессе; печатает время открытия, запросов и пиковый RSS."""
+    vacancy_id = str(10_000_000 + size // 2)
+    start = time.perf_counter()
+    if name == "json.load":
+        with open(os.path.join(directory, "vacancies.json"), "r", encoding="utf-8") as file:
+            records = json.load(file)
+        opened = time.perf_counter()
+        found = next(record for record in records if record["id"] == vacancy_id)
+        selected = [record for record in records if match_criteria(record, {"min_salary": 300_000})]
+    elif name == "JSONVacancyStorage":
+        storage = JSONVacancyStorage(os.path.join(directory, "vacancies.json"))
+        opened = time.perf_counter()
+        found = storage.get_vacancy(vacancy_id)
+        selected = storage.get_vacancies(min_salary=300_000)
+    else:
+        snapshot = VacancySnapshot(os.path.join(directory, "vacancies.snap"))
+        opened = time.perf_counter()
+        found = snapshot[size // 2]
+        selected = snapshot.get_vacancies(min_salary=300_000)
+    finished = time.perf_counter()
+    assert found["id"] == vacancy_id
+    # ru_maxrss в Linux - в килобайтах
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result = {"open": opened - start, "queries": finished - opened, "selected": len(selected), "rss_mb": peak}
+    result.update(rss_parts())
+    print(json.dumps(result))
+
+
+def rss_parts() -> dict:
+    """Текущий RSS по частям (Linux): анонимная память процесса и страницы отображенных файлов.
+
+    Страницы файла, отображенного через mmap, - это страничный кэш ОС: они общие для всех
+    процессов, открывших снимок, и освобождаются системой без записи в swap.
+    """
+    parts = {}
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                name, _, value = line.partition(":")
+                if name in ("RssAnon", "RssFile"):
+                    parts[name] = int(value.split()[0]) / 1024
+    except FileNotFoundError:
+        pass
+    return parts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="количество вакансий")
+    parser.add_argument("--variant", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--directory", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.directory, args.size)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = JSONVacancyStorage(os.path.join(directory, "vacancies.json"))
+        storage.add_vacancies(generate_records(args.size))
+        start = time.perf_counter()
+        write_snapshot(os.path.join(directory, "vacancies.snap"), storage)
+        print(f"Снимок {args.size} вакансий записан за {time.perf_counter() - start:.2f} с")
+        for filename in ("vacancies.json", "vacancies.snap"):
+            print(f"{filename:<16} {os.path.getsize(os.path.join(directory, filename)) / 2**20:8.1f} МБ")
+        del storage
+
+        for name in VARIANTS:
+            command = [sys.executable, "-m", "benchmarks.bench_snapshot", "--size", str(args.size)]
+            command += ["--variant", name, "--directory", directory]
+            result = json.loads(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+            print(
+                f"{name:<20} открытие: {result['open'] * 1000:9.1f} мс, "
+                f"поиск по id и фильтр по зарплате: {result['queries'] * 1000:8.1f} мс "
+                f"({result['selected']} найдено), пиковый RSS: {result['rss_mb']:7.1f} МБ"
+            )
+            if "RssAnon" in result:
+                print(
+                    f"{'':<20} сейчас: анонимная память {result['RssAnon']:.1f} МБ, файлы {result['RssFile']:.1f} МБ"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Поиск вакансий в SQLiteVacancyStorage и JSONVacancyStorage.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_sqlite --size 1000000 --json-size 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import generate_records, generate_vacancies
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.sqlite_storage import SQLiteVacancyStorage
+
+
+def timed(func, repeat: int = 5) -> tuple:
+    """Лучшее время из repeat запусков и результат."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_queries(name: str, storage, lookup_id: str, repeat: int) -> None:
+    queries = [
+        ("по названию", lambda: storage.get_vacancies(title="Аналитик")),
+        ("min_salary >= 700000", lambda: storage.get_vacancies(min_salary=700000)),
+        ("диапазон зарплат", lambda: storage.get_vacancies(min_salary=600000, max_salary=650000)),
+    ]
+    if hasattr(storage, "get_vacancy"):
+        queries.insert(0, ("по id", lambda: storage.get_vacancy(lookup_id)))
+    print(f"{name}:")
+    for label, query in queries:
+        elapsed, result = timed(query, repeat)
+        found = len(result) if isinstance(result, list) else int(result is not None)
+        print(f"  {label:<22} {elapsed * 1000:10.2f} мс, найдено: {found}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="размер хранилища SQLite")
+    parser.add_argument("--json-size", type=int, default=100_000, help="размер JSON-хранилища для сравнения")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = SQLiteVacancyStorage(os.path.join(directory, "vacancies.db"))
+        start = time.perf_counter()
+        storage.add_records(generate_records(args.size))
+        print(f"Загрузка {args.size} записей в SQLite: {time.perf_counter() - start:.1f} с")
+        run_queries(f"SQLite, {args.size} записей", storage, str(10_000_000 + args.size // 2), repeat=5)
+        storage.close()
+
+        if args.json_size:
+            json_storage = JSONVacancyStorage(os.path.join(directory, "vacancies.json"))
+            json_storage.add_vacancies(generate_vacancies(args.json_size))
+            run_queries(f"JSON, {args.json_size} записей", json_storage, "", repeat=1)
+
+
+if __name__ == "__main__":
+    main()
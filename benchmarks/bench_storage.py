@@ -0,0 +1,59 @@
+"""Запись вакансий в JSONVacancyStorage и JSONLVacancyStorage.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_storage --sizes 10000 100000 --legacy-limit 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import generate_vacancies
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.jsonl_storage import JSONLVacancyStorage
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def add_one_by_one(storage, vacancies) -> None:
+    for vacancy in vacancies:
+        storage.add_vacancy(vacancy)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="размеры корпусов")
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=1000,
+        help="максимальный размер для JSONVacancyStorage.add_vacancy в цикле (квадратичная сложность)",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        vacancies = list(generate_vacancies(size))
+        print(f"{size} вакансий:")
+        with tempfile.TemporaryDirectory() as directory:
+            cases = [
+                ("JSON, add_vacancy в цикле", JSONVacancyStorage, add_one_by_one, size <= args.legacy_limit),
+                ("JSON, add_vacancies", JSONVacancyStorage, JSONVacancyStorage.add_vacancies, True),
+                ("JSONL, add_vacancy в цикле", JSONLVacancyStorage, add_one_by_one, True),
+                ("JSONL, add_vacancies", JSONLVacancyStorage, JSONLVacancyStorage.add_vacancies, True),
+            ]
+            for i, (name, storage_class, add, enabled) in enumerate(cases):
+                if not enabled:
+                    print(f"  {name:<28} пропущено (размер больше --legacy-limit)")
+                    continue
+                storage = storage_class(os.path.join(directory, f"case_{i}"))
+                elapsed = timed(add, storage, vacancies)
+                print(f"  {name:<28} {elapsed:8.3f} с, {size / elapsed:10.0f} записей/с")
+
+
+if __name__ == "__main__":
+    main()
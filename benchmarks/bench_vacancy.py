@@ -0,0 +1,84 @@
+"""Память и время сортировки Vacancy по сравнению с прежней реализацией на __dict__.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_vacancy --size 100000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any
+
+from src.Vacancy import Vacancy, extract_salary_amount
+
+
+class LegacyVacancy:
+    """Прежняя реализация: атрибуты в __dict__, разбор строки зарплаты при каждом сравнении."""
+
+    def __init__(self, id: str, title: str, link: str, salary: Any, description: str) -> None:
+        self.id = id
+        self.title = title
+        self.link = link
+        self.salary = salary
+        self.description = description
+
+    def __lt__(self, other):
+        if self.salary == "Зарплата не указана":
+            return False
+        elif other.salary == "Зарплата не указана":
+            return True
+        else:
+            return extract_salary_amount(self.salary) < extract_salary_amount(other.salary)
+
+
+def make_salaries(size: int) -> tuple:
+    """Зарплаты в виде строк "от N" (для сравнения) и словарей HH (как в ответе API)."""
+    rng = random.Random(0)
+    amounts = [rng.randrange(30_000, 500_000) for _ in range(size)]
+    strings = [f"от {amount}" for amount in amounts]
+    dicts = [{"from": amount, "to": None, "currency": "RUR", "gross": False} for amount in amounts]
+    return strings, dicts
+
+
+def build(cls, salaries: list) -> list:
+    return [
+        cls(id=str(i), title="Python Developer", link="https://hh.ru/vacancy/", salary=salary, description="")
+        for i, salary in enumerate(salaries)
+    ]
+
+
+def measure_memory(cls, salaries: list) -> int:
+    """Память, занимаемая вакансиями, без учета самих значений зарплаты."""
+    gc.collect()
+    tracemalloc.start()
+    vacancies = build(cls, salaries)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del vacancies
+    return memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="количество вакансий")
+    args = parser.parse_args()
+
+    strings, dicts = make_salaries(args.size)
+    for name, cls in (("До (LegacyVacancy)", LegacyVacancy), ("После (Vacancy)", Vacancy)):
+        memory = measure_memory(cls, dicts)
+        start = time.perf_counter()
+        vacancies = build(cls, strings)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        sorted(vacancies)
+        sort_time = time.perf_counter() - start
+        print(
+            f"{name:<20} память на {args.size}: {memory / 2**20:6.1f} МБ, "
+            f"создание: {build_time:.3f} с, сортировка: {sort_time:.3f} с"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Синтетические корпуса вакансий по образцу data/vacancies.json."""
+
+import os
+import random
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+
+from src import codec
+from src.Vacancy import Vacancy
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "vacancies.json")
+
+
+def load_template() -> List[Dict[str, Any]]:
+    """Записи из data/vacancies.json, на основе которых строятся синтетические вакансии.
+
+    Файл в репозитории обрезан на середине записи, поэтому записи читаются по одной
+    до первой недописанной.
+    """
+    with open(TEMPLATE_PATH, "rb") as file:
+        return codec.loads_array_prefix(file.read())
+
+
+def generate_records(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Генерация count записей в формате хранилища с уникальными 'id'."""
+    template = load_template()
+    rng = random.Random(seed)
+    for i in range(count):
+        record = template[rng.randrange(len(template))]
+        salary = record["salary"]
+        if salary is not None:
+            scale = rng.uniform(0.5, 1.5)
+            salary = {
+                "from": int(salary["from"] * scale) if salary.get("from") else None,
+                "to": int(salary["to"] * scale) if salary.get("to") else None,
+                "currency": salary.get("currency"),
+                "gross": salary.get("gross"),
+            }
+        yield {
+            "id": str(10_000_000 + i),
+            "title": record["title"],
+            "link": f"https://hh.ru/vacancy/{10_000_000 + i}",
+            "salary": salary,
+            "description": record["description"],
+        }
+
+
+def generate_vacancies(count: int, seed: int = 0) -> Iterator[Vacancy]:
+    """Генерация count объектов Vacancy."""
+    for record in generate_records(count, seed):
+        yield Vacancy(**record)
+
+
+def api_item(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Запись хранилища в виде полного элемента выдачи api.hh.ru (со всеми служебными полями)."""
+    vacancy_id = record["id"]
+    return {
+        "id": vacancy_id,
+        "premium": False,
+        "name": record["title"],
+        "department": None,
+        "has_test": False,
+        "response_letter_required": False,
+        "area": {"id": "1", "name": "Москва", "url": "https://api.hh.ru/areas/1"},
+        "salary": record["salary"],
+        "type": {"id": "open", "name": "Открытая"},
+        "address": None,
+        "response_url": None,
+        "sort_point_distance": None,
+        "published_at": "2024-07-26T12:02:46+0300",
+        "created_at": "2024-07-26T12:02:46+0300",
+        "archived": False,
+        "apply_alternate_url": f"https://hh.ru/applicant/vacancy_response?vacancyId={vacancy_id}",
+        "insider_interview": None,
+        "url": f"https://api.hh.ru/vacancies/{vacancy_id}?host=hh.ru",
+        "alternate_url": record["link"],
+        "relations": [],
+        "employer": {
+            "id": "1740",
+            "name": "Яндекс",
+            "url": "https://api.hh.ru/employers/1740",
+            "alternate_url": "https://hh.ru/employer/1740",
+            "logo_urls": {
+                "original": "https://hhcdn.ru/employer-logo-original/1740.png",
+                "90": "https://hhcdn.ru/employer-logo/90/1740.png",
+                "240": "https://hhcdn.ru/employer-logo/240/1740.png",
+            },
+            "vacancies_url": "https://api.hh.ru/vacancies?employer_id=1740",
+            "accredited_it_employer": True,
+            "trusted": True,
+        },
+        "snippet": {
+            "requirement": record["description"],
+            "responsibility": "Разработка и поддержка сервисов, участие в код-ревью.",
+        },
+        "contacts": None,
+        "schedule": {"id": "fullDay", "name": "Полный день"},
+        "working_days": [],
+        "working_time_intervals": [],
+        "working_time_modes": [],
+        "accept_temporary": False,
+        "professional_roles": [{"id": "96", "name": "Программист, разработчик"}],
+        "accept_incomplete_resumes": False,
+        "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+        "employment": {"id": "full", "name": "Полная занятость"},
+        "adv_response_url": None,
+        "is_adv_vacancy": False,
+        "adv_context": None,
+    }
+
+
+def generate_api_pages(count: int, per_page: int = 100, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Генерация страниц выдачи api.hh.ru с count вакансиями в сумме."""
+    pages = (count + per_page - 1) // per_page
+    records = generate_records(count, seed)
+    for page in range(pages):
+        items = [api_item(record) for record in islice(records, per_page)]
+        yield {"items": items, "found": count, "pages": pages, "page": page, "per_page": per_page}
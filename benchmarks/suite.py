@@ -0,0 +1,310 @@
+"""Набор бенчмарков горячих путей: загрузка, хранилища, ранжирование и поиск, с базовой линией.
+
+Корпуса по 1k/100k/1M вакансий генерируются по образцу data/vacancies.json, загрузка
+измеряется на локальном mock-сервере api.hh.ru.
+
+Запуск из корня проекта:
+    python -m benchmarks.suite --sizes 1000 100000 --save-baseline
+    python -m benchmarks.suite --sizes 1000 100000 --compare --threshold 0.25
+
+С --compare завершается с кодом 1, если какой-либо случай медленнее базовой линии больше чем на threshold.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from benchmarks.corpus import api_item, generate_records
+from src.API_HH import HHVacancyAPI
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.jsonl_storage import JSONLVacancyStorage
+from src.search_index import VacancySearchIndex
+from src.sqlite_storage import SQLiteVacancyStorage
+from src.user_interaction import UserInteraction
+from src.Vacancy import Vacancy
+from tests.mock_hh_server import MockHHServer
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "baseline.json")
+
+# Случай: функция подготовки по размеру корпуса, которая выдает (yield) измеряемую функцию
+# и после измерения освобождает ресурсы; max_size - наибольший разумный размер для случая.
+# Случай, который меняет свои данные, выдает пару (функция, сброс): сброс возвращает данные
+# в исходное состояние перед каждым вызовом и в измерение не входит
+Timed = Union[Callable[[], Any], Tuple[Callable[[], Any], Callable[[], Any]]]
+Setup = Callable[[int], Iterator[Timed]]
+CASES: Dict[str, Tuple[Setup, Optional[int]]] = {}
+
+# Глубина выдачи api.hh.ru: не больше 2000 вакансий на запрос
+HH_MAX_FOUND = 2000
+
+
+def case(name: str, max_size: Optional[int] = None) -> Callable[[Setup], Setup]:
+    """Регистрация случая в наборе."""
+
+    def register(setup: Setup) -> Setup:
+        CASES[name] = (setup, max_size)
+        return setup
+
+    return register
+
+
+@lru_cache(maxsize=None)
+def records(size: int) -> Tuple[Dict[str, Any], ...]:
+    """Корпус в формате хранилища (общий для всех случаев одного размера)."""
+    return tuple(generate_records(size))
+
+
+@lru_cache(maxsize=None)
+def api_items(size: int) -> Tuple[Dict[str, Any], ...]:
+    """Корпус в формате ответа api.hh.ru."""
+    return tuple(api_item(record) for record in records(size))
+
+
+@contextlib.contextmanager
+def temp_path(filename: str) -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, filename)
+
+
+@case("fetch.sequential", max_size=HH_MAX_FOUND)
+def fetch_sequential(size: int) -> Iterator[Callable[[], Any]]:
+    with MockHHServer(found=size) as server:
+        api = HHVacancyAPI()
+        api.url = server.url
+        yield lambda: api.get_vacancies("Python")
+
+
+@case("fetch.concurrent", max_size=HH_MAX_FOUND)
+def fetch_concurrent(size: int) -> Iterator[Callable[[], Any]]:
+    with MockHHServer(found=size) as server:
+        api = HHVacancyAPI(max_workers=4)
+        api.url = server.url
+        yield lambda: api.get_vacancies("Python")
+
+
+@case("storage.json.load")
+def json_load(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.json") as path:
+        JSONVacancyStorage(path).add_vacancies(records(size))
+        # Новый объект хранилища каждый раз читает файл с диска
+        yield lambda: JSONVacancyStorage(path).get_vacancies()
+
+
+@case("storage.json.get_by_title")
+def json_get_by_title(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.json") as path:
+        storage = JSONVacancyStorage(path)
+        storage.add_vacancies(records(size))
+        yield lambda: storage.get_vacancies(title="Аналитик")
+
+
+@case("storage.json.get_by_salary")
+def json_get_by_salary(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.json") as path:
+        storage = JSONVacancyStorage(path)
+        storage.add_vacancies(records(size))
+        yield lambda: storage.get_vacancies(min_salary=100_000, max_salary=300_000)
+
+
+@case("storage.json.add_vacancy", max_size=100_000)
+def json_add_vacancy(size: int) -> Iterator[Timed]:
+    with temp_path("vacancies.json") as path:
+        JSONVacancyStorage(path).add_vacancies(records(size))
+        pristine = f"{path}.pristine"
+        shutil.copyfile(path, pristine)
+        vacancy = Vacancy(**records(1)[0])
+        current: List[JSONVacancyStorage] = []
+
+        def reset() -> None:
+            # Файл из size записей и хранилище с уже прочитанным файлом, как после add_vacancies
+            shutil.copyfile(pristine, path)
+            current[:] = [JSONVacancyStorage(path)]
+
+        yield lambda: current[0].add_vacancy(vacancy), reset
+
+
+@case("storage.json.upsert_unchanged")
+def json_upsert_unchanged(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.json") as path:
+        storage = JSONVacancyStorage(path)
+        storage.add_vacancies(records(size))
+        yield lambda: storage.upsert_vacancies(records(size))
+
+
+@case("storage.sqlite.upsert_unchanged", max_size=100_000)
+def sqlite_upsert_unchanged(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.db") as path:
+        storage = SQLiteVacancyStorage(path)
+        storage.add_records(records(size))
+        yield lambda: storage.upsert_vacancies(records(size))
+        storage.close()
+
+
+@case("storage.jsonl.add_vacancy")
+def jsonl_add_vacancy(size: int) -> Iterator[Timed]:
+    with temp_path("vacancies.jsonl") as path:
+        storage = JSONLVacancyStorage(path)
+        storage.add_vacancies(records(size))
+        initial_size = os.path.getsize(path)
+        vacancy = Vacancy(**records(1)[0])
+        # Сброс отрезает дописанные строки: каждый вызов пишет в журнал из size записей
+        yield lambda: storage.add_vacancy(vacancy), lambda: os.truncate(path, initial_size)
+
+
+@case("storage.sqlite.get_by_salary")
+def sqlite_get_by_salary(size: int) -> Iterator[Callable[[], Any]]:
+    with temp_path("vacancies.db") as path:
+        storage = SQLiteVacancyStorage(path)
+        storage.add_records(records(size))
+        yield lambda: storage.get_vacancies(min_salary=100_000, max_salary=300_000)
+        storage.close()
+
+
+@case("ranking.select_top_vacancies")
+def ranking_top(size: int) -> Iterator[Callable[[], Any]]:
+    items = api_items(size)
+    yield lambda: UserInteraction.select_top_vacancies(items, 10)
+
+
+@case("ranking.vacancy_sort")
+def vacancy_sort(size: int) -> Iterator[Callable[[], Any]]:
+    vacancies = [Vacancy(**record) for record in records(size)]
+    yield lambda: sorted(vacancies)
+
+
+@case("search.by_description")
+def search_linear(size: int) -> Iterator[Callable[[], Any]]:
+    items = list(api_items(size))
+
+    def search() -> Any:
+        # Вывод найденных вакансий - часть измеряемой работы, но не должен попадать в консоль
+        with contextlib.redirect_stdout(io.StringIO()):
+            return UserInteraction.search_vacancies_by_description(items, "django")
+
+    yield search
+
+
+@case("search.index")
+def search_index(size: int) -> Iterator[Callable[[], Any]]:
+    index = VacancySearchIndex(records(size))
+    yield lambda: index.search("python django")
+
+
+def measure(func: Callable[[], Any], repeat: int, reset: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Лучшее и медианное время одного вызова, как в timeit: число вызовов подбирается автоматически.
+
+    С reset каждый из repeat вызовов измеряется отдельно после сброса данных.
+    """
+    if reset is not None:
+        times = []
+        for _ in range(repeat):
+            reset()
+            start = timeit.default_timer()
+            func()
+            times.append(timeit.default_timer() - start)
+        return {"best": min(times), "median": statistics.median(times), "number": 1, "repeat": repeat}
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(times), "median": statistics.median(times), "number": number, "repeat": repeat}
+
+
+def run(sizes: List[int], repeat: int, pattern: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name, (setup, max_size) in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            steps = setup(size)
+            timed = next(steps)
+            func, reset = timed if isinstance(timed, tuple) else (timed, None)
+            result = measure(func, repeat, reset)
+            for _ in steps:
+                pass
+            key = f"{name}[{size}]"
+            results[key] = result
+            print(f"{key:<42} {format_time(result['best']):>10}  (медиана {format_time(result['median'])})")
+    return results
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} мкс"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} мс"
+    return f"{seconds:.3f} с"
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float, min_delta: float
+) -> List[str]:
+    """Случаи, медленнее базовой линии больше чем на threshold (и больше чем на min_delta секунд)."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = result["best"] / base["best"]
+        if ratio > 1 + threshold and result["best"] - base["best"] > min_delta:
+            regressions.append(f"{key}: {format_time(base['best'])} -> {format_time(result['best'])} (x{ratio:.2f})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000], help="размеры корпусов")
+    parser.add_argument("--repeat", type=int, default=5, help="число повторов измерения")
+    parser.add_argument("-k", dest="pattern", help="только случаи, в имени которых есть эта строка")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="файл базовой линии")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как базовую линию")
+    parser.add_argument("--compare", action="store_true", help="сравнить с базовой линией")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустимое замедление, доля (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="замедления меньше этого не учитываются")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.pattern)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        meta = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        }
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({"meta": meta, "results": results}, file, ensure_ascii=False, indent=4)
+        print(f"Базовая линия сохранена: {args.baseline}")
+
+    if args.compare:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as file:
+                baseline = json.load(file)["results"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            print(f"Базовая линия не загружена: {e}")
+            sys.exit(2)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print("Замедление относительно базовой линии:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("Замедлений относительно базовой линии нет")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from src.user_interaction import UserInteraction
+from src.cli import main
 
 if __name__ == "__main__":
-    UserInteraction.user_interaction()
+    main()
@@ -1,7 +1,17 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Coroutine, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src import codec, instrumentation
+from src.request_scheduler import RequestScheduler
+from src.response_cache import HTTPResponseCache
 
 
 class VacancyAPI(ABC):
@@ -13,33 +23,351 @@ class VacancyAPI(ABC):
         pass
 
 
+def iter_unique_by_id(vacancies: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Пропуск повторяющихся вакансий по 'id' с сохранением порядка."""
+    seen = set()
+    for vacancy in vacancies:
+        vacancy_id = vacancy.get("id")
+        if vacancy_id is not None:
+            if vacancy_id in seen:
+                continue
+            seen.add(vacancy_id)
+        yield vacancy
+
+
+def _page_items(data: codec.HHVacancyPage) -> List[Dict[str, Any]]:
+    """Вакансии страницы выдачи как словари - в таком виде их возвращают методы клиента."""
+    return cast(List[Dict[str, Any]], data.get("items", []))
+
+
+def unique_by_id(vacancies: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Удаление повторяющихся вакансий по 'id' с сохранением порядка."""
+    return list(iter_unique_by_id(vacancies))
+
+
 class HHVacancyAPI(VacancyAPI):
     """Класс для работы с API HeadHunter."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 1,
+        cache: Optional[HTTPResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("Параметр 'max_workers' должен быть целым числом больше 0")
         self.url = "https://api.hh.ru/vacancies"
         self.headers = {"User-Agent": "HH-User-Agent"}
-        self.params = {"text": "", "page": 0, "per_page": 20}
+        self.params: Dict[str, Any] = {"text": "", "page": 0, "per_page": 20}
+        # Количество страниц, загружаемых одновременно (1 - последовательная загрузка)
+        self.max_workers = max_workers
+        # Дисковый кэш ответов; None - каждый запрос идет в сеть
+        self.cache = cache
+        # Планировщик с ограничением частоты и повторами; None - одна попытка на страницу
+        self.scheduler = scheduler
+        # Страницы последнего запроса: загруженные и те, что не удалось загрузить
+        self.fetched_pages: Dict[int, List[Dict[str, Any]]] = {}
+        self.failed_pages: List[int] = []
 
-    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
-        """Получение списка вакансий по ключевому слову."""
+        # Одна keep-alive сессия с пулом соединений на все запросы
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get(self, request_params: Dict[str, str], headers: Optional[Dict[str, str]] = None) -> Any:
+        """Отправка запроса напрямую или через планировщик с повторами.
+
+        Без планировщика сетевая ошибка (requests.ConnectionError, requests.Timeout) передается
+        вызывающему коду, а не превращается в молча пропущенную страницу.
+        """
+        if self.scheduler is None:
+            return self.session.get(self.url, params=request_params, headers=headers)
+        return self.scheduler.get(self.session, self.url, params=request_params, headers=headers)
+
+    def _fetch_page(self, page: int, keyword: Optional[str] = None) -> Optional[codec.HHVacancyPage]:
+        """Загрузка одной страницы выдачи. Возвращает None при ошибке ответа."""
+        with instrumentation.span("api.fetch_page"):
+            data = self._load_page(page, keyword)
+        if data is not None:
+            instrumentation.count("api.pages_fetched")
+        return data
+
+    def _load_page(self, page: int, keyword: Optional[str]) -> Optional[codec.HHVacancyPage]:
+        request_params = {k: (str(v) if v is not None else "") for k, v in self.params.items()}
+        request_params["page"] = str(page)
+        if keyword is not None:
+            request_params["text"] = keyword
+
+        if self.cache is None:
+            response = self._get(request_params)
+            if response is None or response.status_code != 200:
+                return None
+            instrumentation.count("api.bytes_downloaded", len(response.content))
+            return codec.decode_vacancy_page(response.content)
+
+        key = self.cache.make_key(self.url, request_params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit(entry)
+            instrumentation.count("api.cache_hits")
+            return codec.decode_vacancy_page(entry["body"])
+
+        start = time.perf_counter()
+        response = self._get(request_params, self.cache.conditional_headers(entry))
+        if response is None:
+            return None
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry)
+            self.cache.record_hit(entry, revalidated=True)
+            instrumentation.count("api.cache_hits")
+            return codec.decode_vacancy_page(entry["body"])
+        if response.status_code != 200:
+            return None
+        self.cache.record_download(len(response.content), time.perf_counter() - start)
+        instrumentation.count("api.bytes_downloaded", len(response.content))
+        self.cache.store(
+            key, self.url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        return codec.decode_vacancy_page(response.content)
+
+    def _prepare(self, keyword: str, date_from: Optional[str]) -> None:
+        """Подготовка параметров нового запроса."""
         self.params["text"] = keyword
-        vacancies = []
+        self._set_date_from(date_from)
 
         if not isinstance(self.params["page"], int) or not isinstance(self.params["per_page"], int):
             raise ValueError("Параметры 'page' и 'per_page' должны быть целыми числами")
+        self.fetched_pages = {}
+        self.failed_pages = []
 
-        while True:
-            request_params = {k: (str(v) if v is not None else "") for k, v in self.params.items()}
-            response = requests.get(self.url, headers=self.headers, params=request_params)
-            if response.status_code == 200:
-                items = response.json().get("items", [])
-                if not items:
-                    break
-                vacancies.extend(items)
-                if len(items) < self.params["per_page"]:
-                    break
-                self.params["page"] += 1
+    def _set_date_from(self, date_from: Optional[str]) -> None:
+        if date_from:
+            self.params["date_from"] = date_from
+        else:
+            self.params.pop("date_from", None)
+
+    def get_vacancies(self, keyword: str, date_from: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Получение списка вакансий по ключевому слову.
+
+        date_from - дата в формате ISO 8601: будут получены только вакансии, опубликованные начиная с нее.
+        Страницы, которые не удалось загрузить, попадают в failed_pages и догружаются через resume().
+        """
+        self._prepare(keyword, date_from)
+        for page, items in self._iter_pages(self.params["page"]):
+            self.fetched_pages[page] = items
+        return self._collect()
+
+    def iter_vacancies(self, keyword: str, date_from: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Потоковое получение вакансий: элементы отдаются по мере загрузки страниц.
+
+        В отличие от get_vacancies страницы не накапливаются в памяти; неудавшиеся страницы
+        так же попадают в failed_pages.
+        """
+        self._prepare(keyword, date_from)
+        return iter_unique_by_id(item for _, items in self._iter_pages(self.params["page"]) for item in items)
+
+    def resume(self) -> List[Dict[str, Any]]:
+        """Повторная загрузка только неудавшихся страниц последнего запроса."""
+        failed_pages, self.failed_pages = self.failed_pages, []
+        if self.max_workers > 1:
+            first_page = self.params["page"]
+            if first_page in failed_pages:
+                pages = self._iter_concurrent(first_page)
             else:
+                pages = self._iter_page_list(failed_pages)
+        else:
+            pages = (result for page in failed_pages for result in self._iter_sequential(page))
+        for page, items in pages:
+            self.fetched_pages[page] = items
+        return self._collect()
+
+    def _collect(self, fetched_pages: Optional[Dict[int, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+        """Объединение загруженных страниц (по умолчанию - fetched_pages) в порядке их номеров."""
+        pages = self.fetched_pages if fetched_pages is None else fetched_pages
+        return unique_by_id(item for page in sorted(pages) for item in pages[page])
+
+    def _iter_pages(self, first_page: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        if self.max_workers > 1:
+            return self._iter_concurrent(first_page)
+        return self._iter_sequential(first_page)
+
+    def _iter_sequential(self, page: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Последовательная загрузка страниц до первой неполной страницы."""
+        while True:
+            data = self._fetch_page(page)
+            if data is None:
+                self.failed_pages.append(page)
+                break
+            items = _page_items(data)
+            if not items:
+                break
+            yield page, items
+            if len(items) < self.params["per_page"]:
                 break
-        return vacancies
+            page += 1
+
+    def _iter_concurrent(self, first_page: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Параллельная загрузка страниц по метаданным 'pages' первой страницы."""
+        data = self._fetch_page(first_page)
+        if data is None:
+            self.failed_pages.append(first_page)
+            return
+
+        yield first_page, _page_items(data)
+        total_pages = data.get("pages", first_page + 1)
+        yield from self._iter_page_list(range(first_page + 1, total_pages))
+
+    def _iter_page_list(self, pages: Iterable[int]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Загрузка указанных страниц в пуле потоков с отдачей в порядке номеров.
+
+        Заранее запрашивается не больше 2 * max_workers страниц, поэтому медленный
+        потребитель не приводит к накоплению всей выдачи в памяти.
+        """
+        pages = iter(pages)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            window = deque(
+                (page, executor.submit(self._fetch_page, page)) for page in islice(pages, 2 * self.max_workers)
+            )
+            while window:
+                page, future = window.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    window.append((next_page, executor.submit(self._fetch_page, next_page)))
+                page_data = future.result()
+                if page_data is None:
+                    self.failed_pages.append(page)
+                else:
+                    yield page, _page_items(page_data)
+
+
+def _run_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Выполнение корутины в новом цикле событий из синхронного кода.
+
+    Внутри работающего цикла asyncio.run невозможен, поэтому вызывается понятная ошибка.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    coroutine.close()
+    raise RuntimeError(
+        "Синхронные методы AsyncHHVacancyAPI нельзя вызывать из асинхронного кода: "
+        "используйте await aget_vacancies(...) или await aget_vacancies_many(...)"
+    )
+
+
+class AsyncHHVacancyAPI(HHVacancyAPI):
+    """Асинхронный клиент API HeadHunter для одновременного поиска по многим запросам.
+
+    Синхронные обертки get_vacancies и get_vacancies_many запускают собственный цикл событий,
+    поэтому вызываются только из синхронного кода; в асинхронном коде нужны aget_* методы.
+    Неудавшиеся страницы попадают в failed_keyword_pages ({запрос: страницы}, для одного запроса -
+    еще и в failed_pages) и догружаются через resume()/resume_many() или aresume()/aresume_many().
+    """
+
+    def __init__(self, max_connections: int = 10):
+        super().__init__(max_workers=max_connections)
+        self.max_connections = max_connections
+        # Страницы последнего запроса по каждому ключевому слову: загруженные и неудавшиеся
+        self.keyword_pages: Dict[str, Dict[int, List[Dict[str, Any]]]] = {}
+        self.failed_keyword_pages: Dict[str, List[int]] = {}
+
+    async def _fetch_page_async(
+        self, semaphore: asyncio.Semaphore, keyword: str, page: int
+    ) -> Optional[codec.HHVacancyPage]:
+        """Загрузка страницы в пуле потоков; семафор ограничивает число одновременных соединений."""
+        async with semaphore:
+            return await asyncio.to_thread(self._fetch_page, page, keyword)
+
+    async def _load_pages_async(self, semaphore: asyncio.Semaphore, keyword: str, pages: List[int]) -> None:
+        """Загрузка страниц запроса в keyword_pages; неудавшиеся страницы попадают в failed_keyword_pages.
+
+        Если среди страниц есть первая, остальные определяются по ее метаданным 'pages'.
+        """
+        fetched = self.keyword_pages.setdefault(keyword, {})
+        failed = self.failed_keyword_pages.setdefault(keyword, [])
+        first_page = self.params["page"]
+        if first_page in pages:
+            data = await self._fetch_page_async(semaphore, keyword, first_page)
+            if data is None:
+                failed.append(first_page)
+                return
+            fetched[first_page] = _page_items(data)
+            pages = list(range(first_page + 1, data.get("pages", first_page + 1)))
+
+        results = await asyncio.gather(*(self._fetch_page_async(semaphore, keyword, page) for page in pages))
+        for page, page_data in zip(pages, results):
+            if page_data is None:
+                failed.append(page)
+            else:
+                fetched[page] = _page_items(page_data)
+        failed.sort()
+
+    def _finish(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Результаты по запросам; для одного запроса failed_pages и fetched_pages заполняются как в HHVacancyAPI."""
+        self.failed_keyword_pages = {keyword: pages for keyword, pages in self.failed_keyword_pages.items() if pages}
+        if len(self.keyword_pages) == 1:
+            keyword = next(iter(self.keyword_pages))
+            self.fetched_pages = self.keyword_pages[keyword]
+            self.failed_pages = self.failed_keyword_pages.get(keyword, [])
+        return {keyword: self._collect(pages) for keyword, pages in self.keyword_pages.items()}
+
+    async def aget_vacancies(self, keyword: str, date_from: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Асинхронное получение списка вакансий по ключевому слову (date_from - как в HHVacancyAPI)."""
+        results = await self.aget_vacancies_many([keyword], date_from)
+        return results[keyword]
+
+    async def aget_vacancies_many(
+        self, keywords: Iterable[str], date_from: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Асинхронное получение вакансий по списку запросов: {запрос: вакансии}."""
+        if not isinstance(self.params["page"], int) or not isinstance(self.params["per_page"], int):
+            raise ValueError("Параметры 'page' и 'per_page' должны быть целыми числами")
+        self._set_date_from(date_from)
+
+        self.keyword_pages = {}
+        self.failed_keyword_pages = {}
+        self.fetched_pages = {}
+        self.failed_pages = []
+        semaphore = asyncio.Semaphore(self.max_connections)
+        first_page = self.params["page"]
+        await asyncio.gather(
+            *(self._load_pages_async(semaphore, keyword, [first_page]) for keyword in dict.fromkeys(keywords))
+        )
+        return self._finish()
+
+    async def aresume_many(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Повторная загрузка только неудавшихся страниц последнего запроса: {запрос: все вакансии}."""
+        failed_keyword_pages, self.failed_keyword_pages = self.failed_keyword_pages, {}
+        semaphore = asyncio.Semaphore(self.max_connections)
+        await asyncio.gather(
+            *(self._load_pages_async(semaphore, keyword, pages) for keyword, pages in failed_keyword_pages.items())
+        )
+        return self._finish()
+
+    async def aresume(self) -> List[Dict[str, Any]]:
+        """Асинхронный resume() для запроса по одному ключевому слову."""
+        if len(self.keyword_pages) > 1:
+            raise ValueError("Последний запрос был по нескольким ключевым словам: используйте aresume_many()")
+        results = await self.aresume_many()
+        return next(iter(results.values()), [])
+
+    def get_vacancies(self, keyword: str, date_from: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Получение списка вакансий по ключевому слову (синхронная обертка)."""
+        return cast(List[Dict[str, Any]], _run_sync(self.aget_vacancies(keyword, date_from)))
+
+    def get_vacancies_many(
+        self, keywords: Iterable[str], date_from: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Получение вакансий по списку запросов (синхронная обертка)."""
+        return cast(Dict[str, List[Dict[str, Any]]], _run_sync(self.aget_vacancies_many(keywords, date_from)))
+
+    def resume(self) -> List[Dict[str, Any]]:
+        """Повторная загрузка неудавшихся страниц запроса по одному ключевому слову (синхронная обертка)."""
+        return cast(List[Dict[str, Any]], _run_sync(self.aresume()))
+
+    def resume_many(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Повторная загрузка неудавшихся страниц запроса по нескольким ключевым словам (синхронная обертка)."""
+        return cast(Dict[str, List[Dict[str, Any]]], _run_sync(self.aresume_many()))
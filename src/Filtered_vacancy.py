@@ -1,20 +1,133 @@
+import hashlib
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
 
-from src.API_HH import HHVacancyAPI
+from src import codec, instrumentation
+from src.currency import CurrencyConverter, default_converter, rates_path
+from src.json_writer import write_json
 from src.Vacancy import Vacancy
 
+if TYPE_CHECKING:
+    from src.salary_columns import SalaryColumns
+
+
+def vacancy_to_dict(vacancy: Any) -> Dict[str, Any]:
+    """Представление вакансии в виде словаря для хранения в файле.
+
+    Словарь в формате хранилища (например, подготовленный в src.ingest) возвращается как есть.
+    """
+    if isinstance(vacancy, dict):
+        return vacancy
+    return cast(Dict[str, Any], vacancy.to_dict())
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """Хеш содержимого записи: одинаков для равных словарей независимо от порядка ключей."""
+    data = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def match_criteria(
+    vacancy: Dict[str, Any], criteria: Dict[str, Any], converter: Optional[CurrencyConverter] = None
+) -> bool:
+    """Проверка вакансии на соответствие критериям: title, min_salary, max_salary.
+
+    С converter границы зарплаты сравниваются после пересчета в базовую валюту.
+    """
+    if "title" in criteria and vacancy.get("title") != criteria["title"]:
+        return False
+    salary = vacancy.get("salary") or {}
+    multiplier = converter.multiplier(salary.get("currency")) if converter is not None else 1
+    if "min_salary" in criteria:
+        vacancy_salary_from = salary.get("from", 0)
+        if vacancy_salary_from is None or vacancy_salary_from * multiplier < criteria["min_salary"]:
+            return False
+    if "max_salary" in criteria:
+        vacancy_salary_to = salary.get("to", float("inf"))
+        if vacancy_salary_to is None or vacancy_salary_to * multiplier > criteria["max_salary"]:
+            return False
+    return True
+
+
+def record_filter(
+    predicate: Optional[Callable[[Dict[str, Any]], bool]],
+    criteria: Dict[str, Any],
+    converter: Optional[CurrencyConverter] = None,
+) -> Callable[[Dict[str, Any]], bool]:
+    """Проверка записи для delete_where: критерии match_criteria и predicate одновременно.
+
+    Без условий вызывает ValueError, чтобы случайный вызов без аргументов не удалил все записи.
+    """
+    if predicate is None and not criteria:
+        raise ValueError("Не указаны условия удаления: predicate или критерии title, min_salary, max_salary")
+    if not criteria:
+        return predicate  # type: ignore[return-value]
+    if predicate is None:
+        return lambda vacancy: match_criteria(vacancy, criteria, converter)
+    return lambda vacancy: match_criteria(vacancy, criteria, converter) and predicate(vacancy)
+
 
 class VacancyStorage(ABC):
-    """Абстрактный класс для работы с файлами хранения вакансий."""
+    """Абстрактный класс для работы с файлами хранения вакансий.
+
+    Подписчики, зарегистрированные через add_listener, получают события об изменениях:
+    ("add", добавленные или замененные записи), ("delete", удаленные записи) и
+    ("reload", все записи) - после чтения файла, измененного извне.
+
+    Критерии min_salary/max_salary сравниваются с зарплатами, пересчитанными в базовую валюту
+    по converter (по умолчанию - по файлу курсов currency_rates.json в каталоге файла хранилища, если он есть).
+    """
+
+    # Файл хранилища; файл курсов по умолчанию ищется в том же каталоге
+    filename: str
+
+    def __init__(self, converter: Optional[CurrencyConverter] = None) -> None:
+        self._listeners: List[Callable[[str, List[Dict[str, Any]]], None]] = []
+        self._converter = converter
+
+    @property
+    def converter(self) -> Optional[CurrencyConverter]:
+        """Курсы для критериев min_salary/max_salary: заданные при создании или из файла курсов."""
+        if self._converter is not None:
+            return self._converter
+        return default_converter(rates_path(os.path.dirname(self.filename)))
+
+    def add_listener(self, listener: Callable[[str, List[Dict[str, Any]]], None]) -> None:
+        """Подписка на изменения хранилища."""
+        self._listeners.append(listener)
+
+    def _notify(self, event: str, records: List[Dict[str, Any]]) -> None:
+        for listener in self._listeners:
+            listener(event, records)
+
+    def refresh(self) -> None:
+        """Проверка, не изменено ли хранилище извне (другим процессом или объектом).
+
+        При изменении подписчики получают событие "reload". Хранилища без такой проверки ничего не делают.
+        """
 
     @abstractmethod
     def add_vacancy(self, vacancy: Any) -> None:
         """Добавление вакансии в файл."""
         pass
 
+    def add_vacancies(self, vacancies: Iterable[Any]) -> None:
+        """Добавление нескольких вакансий в файл."""
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+
+    @abstractmethod
+    def upsert_vacancies(self, vacancies: Iterable[Any]) -> Dict[str, int]:
+        """Добавление новых и замена измененных вакансий по 'id'.
+
+        Вакансии, содержимое которых не изменилось, не перезаписываются: хранилища, которые
+        держат записи в памяти, сравнивают их напрямую, остальные - по content_hash.
+        Возвращает количество: {"added": ..., "updated": ..., "unchanged": ...}.
+        """
+        pass
+
     @abstractmethod
     def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
         """Получение данных из файла по указанным критериям."""
@@ -25,122 +138,263 @@ class VacancyStorage(ABC):
         """Удаление информации о вакансии из файла по названию."""
         pass
 
+    def delete_many(self, ids: Optional[Iterable[Any]] = None, titles: Optional[Iterable[str]] = None) -> int:
+        """Удаление вакансий с любым из указанных 'id' или названий за один проход.
+
+        Возвращает количество удаленных вакансий.
+        """
+        ids = set(ids or ())
+        titles = set(titles or ())
+        if not ids and not titles:
+            return 0
+        return self.delete_where(lambda vacancy: vacancy.get("id") in ids or vacancy.get("title") in titles)
+
+    @abstractmethod
+    def delete_where(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, **criteria: Any) -> int:
+        """Удаление вакансий, подходящих под критерии (title, min_salary, max_salary) и predicate.
+
+        Выполняется за один проход с одной записью изменений. Возвращает количество удаленных вакансий.
+        """
+        pass
+
 
 class JSONVacancyStorage(VacancyStorage):
-    """Класс для работы с JSON-файлом для хранения вакансий."""
+    """Класс для работы с JSON-файлом для хранения вакансий.
+
+    Разобранное содержимое файла хранится в памяти вместе со словарями по 'id' и названию.
+    Файл перечитывается, только если изменились его mtime или размер (например, его записал
+    другой процесс); собственные записи обновляют кэш без повторного чтения.
+    Возвращаемые словари принадлежат кэшу и не должны изменяться вызывающим кодом.
+    """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, converter: Optional[CurrencyConverter] = None):
+        super().__init__(converter)
         # Обновляем путь к файлу, чтобы сохранять его в директорию 'data'
         self.filename = os.path.join("../data", filename)
+        self.stats = {"disk_loads": 0, "cache_hits": 0, "writes": 0}
+        self._records: Optional[List[Dict[str, Any]]] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._by_id: Dict[Any, Dict[str, Any]] = {}
+        self._by_title: Dict[Any, List[Dict[str, Any]]] = {}
+        self._columns: Optional["SalaryColumns"] = None
+
         if not os.path.exists("../data"):
             os.makedirs("../data")
         if not os.path.exists(self.filename):
-            with open(self.filename, "w") as file:
-                json.dump([], file)
+            self._dump([])
         else:
             # Проверяем, что файл не пустой и имеет правильный формат
             try:
-                with open(self.filename, "r") as file:
-                    json.load(file)
+                self._load(strict=True)
             except json.JSONDecodeError:
-                with open(self.filename, "w") as file:
-                    json.dump([], file)
+                self._dump([])
 
-    def add_vacancy(self, vacancy: Any) -> None:
-        """Добавление вакансии в JSON-файл."""
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
         try:
-            with open(self.filename, "r") as file:
-                vacancies = json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
-            vacancies = []
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _set_cache(self, records: List[Dict[str, Any]], signature: Optional[Tuple[int, int]]) -> None:
+        self._records = records
+        self._signature = signature
+        self._by_id = {}
+        self._by_title = {}
+        self._columns = None
+        for record in records:
+            self._by_id[record.get("id")] = record
+            self._by_title.setdefault(record.get("title"), []).append(record)
 
-        vacancies.append(vacancy.__dict__)
+    def refresh(self) -> None:
+        """Перечитывание файла, если изменились его mtime или размер."""
+        self._load()
 
+    def _load(self, strict: bool = False) -> List[Dict[str, Any]]:
+        """Записи хранилища: из кэша, если файл не менялся, иначе с диска."""
+        signature = self._file_signature()
+        if signature is None:
+            self._set_cache([], None)
+            return []
+        if self._records is not None and signature == self._signature:
+            self.stats["cache_hits"] += 1
+            instrumentation.count("storage.cache_hits")
+            return self._records
+
+        self.stats["disk_loads"] += 1
+        instrumentation.count("storage.file_loads")
         try:
-            with open(self.filename, "w") as file:
-                json.dump(vacancies, file, indent=4)
+            with instrumentation.span("storage.json.load"), open(self.filename, "rb") as file:
+                records = cast(List[Dict[str, Any]], codec.loads(file.read()))
+        except json.JSONDecodeError:
+            if strict:
+                raise
+            records = []
+        self._set_cache(records, signature)
+        self._notify("reload", records)
+        return records
+
+    def _dump(self, records: List[Dict[str, Any]]) -> bool:
+        """Запись всех вакансий в файл и обновление кэша. Возвращает False при ошибке записи."""
+        try:
+            write_json(self.filename, records)
         except IOError as e:
             print(f"Ошибка при записи в файл: {e}")
+            self._records = None
+            return False
+        self.stats["writes"] += 1
+        self._set_cache(records, self._file_signature())
+        return True
+
+    def add_vacancy(self, vacancy: Any) -> None:
+        """Добавление вакансии в JSON-файл."""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Any]) -> None:
+        """Добавление нескольких вакансий в JSON-файл за одну перезапись."""
+        records = [vacancy_to_dict(vacancy) for vacancy in vacancies]
+        if self._dump(self._load() + records):
+            self._notify("add", records)
+
+    def upsert_vacancies(self, vacancies: Iterable[Any]) -> Dict[str, int]:
+        """Добавление новых и замена измененных вакансий по 'id' за одну перезапись файла.
+
+        Если ни одна вакансия не добавлена и не изменилась, файл не перезаписывается.
+        Повторы одного 'id', оставшиеся в файле от прежних запусков, при перезаписи
+        сводятся к одной записи на месте первой, с содержимым последней.
+        """
+        stored = self._load()
+        result = {"added": 0, "updated": 0, "unchanged": 0}
+        changed: Dict[Any, Dict[str, Any]] = {}
+        for vacancy in vacancies:
+            record = vacancy_to_dict(vacancy)
+            vacancy_id = record["id"]
+            # Записи хранилища уже в памяти: сравнение словарей дешевле хеширования обеих сторон
+            previous = changed.get(vacancy_id, self._by_id.get(vacancy_id))
+            if previous == record:
+                result["unchanged"] += 1
+                continue
+            result["added" if previous is None else "updated"] += 1
+            changed[vacancy_id] = record
+
+        if not changed and len(self._by_id) == len(stored):
+            return result
+
+        records = []
+        written = set()
+        for record in stored:
+            vacancy_id = record.get("id")
+            if vacancy_id in written:
+                # Повтор 'id': запись уже стоит на месте первого вхождения
+                continue
+            written.add(vacancy_id)
+            records.append(changed.get(vacancy_id) or self._by_id[vacancy_id])
+        records.extend(record for vacancy_id, record in changed.items() if vacancy_id not in written)
+
+        if self._dump(records):
+            self._notify("add", list(changed.values()))
+        return result
 
     def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
         """Получение данных из JSON-файла по указанным критериям."""
-        try:
-            with open(self.filename, "r") as file:
-                vacancies = json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        vacancies = self._load()
+        converter = self.converter
+        if "title" in criteria:
+            vacancies = self._by_title.get(criteria["title"], [])
+        elif "min_salary" in criteria or "max_salary" in criteria:
+            columns = self.salary_columns()
+            if columns is not None:
+                factors = converter.row_factors(columns) if converter is not None else None
+                rows = columns.filter_range(criteria.get("min_salary"), criteria.get("max_salary"), factors)
+                return columns.take(rows)
+        instrumentation.count("storage.records_scanned", len(vacancies))
+        return [vacancy for vacancy in vacancies if match_criteria(vacancy, criteria, converter)]
 
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            match = True
-            if "title" in criteria and vacancy.get("title") != criteria["title"]:
-                match = False
-            if "min_salary" in criteria:
-                min_salary = criteria["min_salary"]
-                vacancy_salary_from = vacancy.get("salary", {}).get("from", 0)
-                if vacancy_salary_from is None or vacancy_salary_from < min_salary:
-                    match = False
-            if "max_salary" in criteria:
-                max_salary = criteria["max_salary"]
-                vacancy_salary_to = vacancy.get("salary", {}).get("to", float("inf"))
-                if vacancy_salary_to is None or vacancy_salary_to > max_salary:
-                    match = False
-            if match:
-                filtered_vacancies.append(vacancy)
-
-        return filtered_vacancies
+    def salary_columns(self) -> Optional["SalaryColumns"]:
+        """Колоночное представление зарплат текущих записей или None, если NumPy не установлен.
+
+        Строится при первом обращении и сбрасывается при любом изменении записей.
+        """
+        from src.salary_columns import SalaryColumns, numpy_available
+
+        if not numpy_available():
+            return None
+        records = self._load()
+        if self._columns is None:
+            self._columns = SalaryColumns(records)
+        return self._columns
+
+    def get_vacancy(self, vacancy_id: Any) -> Optional[Dict[str, Any]]:
+        """Получение вакансии по 'id'."""
+        self._load()
+        return self._by_id.get(vacancy_id)
 
     def delete_vacancy_by_title(self, title: str) -> None:
         """Удаление вакансии из JSON-файла по названию."""
-        try:
-            with open(self.filename, "r") as file:
-                vacancies = json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
+        vacancies = self._load()
+        if title not in self._by_title:
             return
 
         # Фильтрация вакансий, исключая те, у которых название совпадает с указанным
-        vacancies_to_keep = [vacancy for vacancy in vacancies if vacancy.get("title") != title]
+        removed = self._by_title[title]
+        if self._dump([vacancy for vacancy in vacancies if vacancy.get("title") != title]):
+            self._notify("delete", removed)
 
-        try:
-            with open(self.filename, "w") as file:
-                json.dump(vacancies_to_keep, file, indent=4)
-        except IOError as e:
-            print(f"Ошибка при записи в файл: {e}")
+    def delete_where(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, **criteria: Any) -> int:
+        """Удаление подходящих вакансий одной перезаписью файла."""
+        matches = record_filter(predicate, criteria, self.converter)
+        kept: List[Dict[str, Any]] = []
+        removed: List[Dict[str, Any]] = []
+        for vacancy in self._load():
+            (removed if matches(vacancy) else kept).append(vacancy)
+        if not removed or not self._dump(kept):
+            return 0
+        self._notify("delete", removed)
+        return len(removed)
 
 
-def save_to_json_file(data, filename: Any) -> None:
-    """Сохранение данных в JSON-файл."""
-    file_path = os.path.join("../data", filename)
-    try:
-        with open(file_path, "w") as file:
-            json.dump(data, file, indent=4)
-    except IOError as e:
-        print(f"Ошибка при записи в файл: {e}")
-
+def ingest_vacancies(
+    storage: VacancyStorage,
+    items: Iterable[Dict[str, Any]],
+    batch_size: int = 100,
+    on_vacancy: Optional[Callable[[Vacancy], None]] = None,
+) -> Dict[str, int]:
+    """Потоковая запись вакансий из API в хранилище пачками по batch_size через upsert_vacancies.
 
-hh_api = HHVacancyAPI()
-vacancies_data = hh_api.get_vacancies("Python Developer")
+    items может быть генератором (например, HHVacancyAPI.iter_vacancies): вакансии
+    обрабатываются по мере загрузки страниц, в памяти держится не больше одной пачки.
+    Вакансии, уже сохраненные с тем же 'id', заменяются, поэтому повторный запуск не создает повторов.
+    Возвращает количество: {"fetched": ..., "added": ..., "updated": ..., "unchanged": ...}.
+    """
+    result = {"fetched": 0, "added": 0, "updated": 0, "unchanged": 0}
+    batch = []
+    for item in items:
+        vacancy = Vacancy.from_api(item)
+        if on_vacancy is not None:
+            on_vacancy(vacancy)
+        batch.append(vacancy)
+        result["fetched"] += 1
+        if len(batch) >= batch_size:
+            _upsert_batch(storage, batch, result)
+            batch = []
+    if batch:
+        _upsert_batch(storage, batch, result)
+    return result
 
-# Создаем и сохраняем вакансии
-json_storage = JSONVacancyStorage("vacancies.json")
 
-for vacancy_data in vacancies_data:
-    vacancy = Vacancy(
-        id=vacancy_data["id"],
-        title=vacancy_data["name"],
-        link=vacancy_data["alternate_url"],
-        salary=vacancy_data["salary"],
-        description=vacancy_data["snippet"]["requirement"],
-    )
-    json_storage.add_vacancy(vacancy)
+def _upsert_batch(storage: VacancyStorage, batch: List[Vacancy], result: Dict[str, int]) -> None:
+    for key, value in storage.upsert_vacancies(batch).items():
+        result[key] += value
 
-# Получаем вакансии по критерию
-filtered_vacancies = json_storage.get_vacancies(title="Python Developer")
-save_to_json_file(filtered_vacancies, "filtered_vacancies.json")
 
-# Удаление вакансии по названию
-json_storage.delete_vacancy_by_title("Middle React developer [CMDB]")
+def save_to_json_file(data, filename: Any, indent: Optional[int] = 4, compression: Optional[str] = None) -> None:
+    """Сохранение данных в JSON-файл.
 
-# Проверка, что вакансия удалена
-remaining_vacancies = json_storage.get_vacancies()
-save_to_json_file(remaining_vacancies, "remaining_vacancies.json")
+    data может быть итератором записей: он записывается потоково, без сборки в список.
+    indent=None - компактная запись, compression - "gzip" или "zstd" (см. json_writer.write_json).
+    """
+    file_path = os.path.join("../data", filename)
+    try:
+        write_json(file_path, data, indent=indent, compression=compression)
+    except IOError as e:
+        print(f"Ошибка при записи в файл: {e}")
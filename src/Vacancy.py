@@ -1,6 +1,10 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from src.API_HH import HHVacancyAPI
+# Поля зарплаты в ответе api.hh.ru (как в codec.HHSalary; codec не импортируется ради времени импорта)
+SALARY_FIELDS = ("from", "to", "currency", "gross")
+
+# Ключ сортировки вакансии без указанной зарплаты
+NO_SALARY = float("inf")
 
 
 def extract_salary_amount(salary: Any) -> float:
@@ -12,50 +16,123 @@ def extract_salary_amount(salary: Any) -> float:
     return 0
 
 
+def normalize_salary(salary: Any) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """Приведение зарплаты (словарь HH, строка "от N"/"до N" или None) к (от, до, валюта)."""
+    if isinstance(salary, dict):
+        return salary.get("from"), salary.get("to"), salary.get("currency")
+    if isinstance(salary, str):
+        salary_from = salary_to = None
+        words = salary.split()
+        for word, value in zip(words, words[1:]):
+            if value.isdigit():
+                if word == "от":
+                    salary_from = int(value)
+                elif word == "до":
+                    salary_to = int(value)
+        return salary_from, salary_to, None
+    return None, None, None
+
+
+def salary_from_api(salary: Any) -> Any:
+    """Зарплата из ответа api.hh.ru: словарь - только с полями from/to/currency/gross, иначе как есть."""
+    if not isinstance(salary, dict):
+        return salary
+    return {field: salary[field] for field in SALARY_FIELDS if field in salary}
+
+
+def area_from_api(area: Any) -> Optional[Dict[str, Any]]:
+    """Регион вакансии из ответа api.hh.ru: только 'id' и 'name' (без ссылки 'url')."""
+    if not isinstance(area, dict):
+        return None
+    return {"id": area.get("id"), "name": area.get("name")}
+
+
 class Vacancy:
-    """Класс для работы с вакансиями."""
+    """Класс для работы с вакансиями.
+
+    Зарплата разбирается один раз в конструкторе в числовые поля salary_from/salary_to/currency
+    и ключ сортировки sort_key, поэтому сравнение вакансий - это сравнение чисел.
+    Вакансии без указанной зарплаты (sort_key = NO_SALARY) считаются больше любых других, как и раньше.
+    area - регион {"id", "name"} или None, если он неизвестен.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "link",
+        "salary",
+        "description",
+        "area",
+        "salary_from",
+        "salary_to",
+        "currency",
+        "sort_key",
+    )
 
-    def __init__(self, id: str, title: str, link: str, salary: Any, description: str) -> None:
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        link: str,
+        salary: Any,
+        description: Optional[str],
+        area: Optional[Dict[str, Any]] = None,
+    ) -> None:
         self.id = id
         self.title = title
         self.link = link
         self.salary = salary
         self.description = description
+        self.area = area
+        self.salary_from, self.salary_to, self.currency = normalize_salary(salary)
+        if self.salary_from is not None:
+            self.sort_key: Union[int, float] = self.salary_from
+        elif self.salary_to is not None:
+            self.sort_key = self.salary_to
+        else:
+            self.sort_key = NO_SALARY
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]) -> "Vacancy":
+        """Создание вакансии из элемента ответа api.hh.ru."""
+        return cls(
+            id=item["id"],
+            title=item["name"],
+            link=item["alternate_url"],
+            salary=salary_from_api(item.get("salary")),
+            description=(item.get("snippet") or {}).get("requirement"),
+            area=area_from_api(item.get("area")),
+        )
+
+    @classmethod
+    def from_api_many(cls, items: Iterable[Dict[str, Any]]) -> List["Vacancy"]:
+        """Создание списка вакансий из элементов ответа api.hh.ru."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Представление вакансии в виде словаря для хранения в файле ('area' - только если регион известен)."""
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "link": self.link,
+            "salary": self.salary,
+            "description": self.description,
+        }
+        if self.area is not None:
+            data["area"] = self.area
+        return data
 
     def __lt__(self, other):
         """Сравнение вакансий по зарплате."""
-        if self.salary == "Зарплата не указана":
-            return False
-        elif other.salary == "Зарплата не указана":
-            return True
-        else:
-            return extract_salary_amount(self.salary) < extract_salary_amount(other.salary)
+        return self.sort_key < other.sort_key
 
     def __gt__(self, other):
         """Сравнение вакансий по зарплате."""
-        if self.salary == "Зарплата не указана":
-            return True
-        elif other.salary == "Зарплата не указана":
-            return False
-        else:
-            return extract_salary_amount(self.salary) > extract_salary_amount(other.salary)
+        return self.sort_key > other.sort_key
 
     def __eq__(self, other):
         """Сравнение вакансий по зарплате."""
-        if self.salary == "Зарплата не указана" or other.salary == "Зарплата не указана":
+        if self.sort_key == NO_SALARY or other.sort_key == NO_SALARY:
             return False
-        else:
-            return extract_salary_amount(self.salary) == extract_salary_amount(other.salary)
-
-
-hh_api = HHVacancyAPI()
-vacancies = hh_api.get_vacancies("keyword")
-
-for vacancy_data in vacancies:
-    vacancy = Vacancy(
-        id=vacancy_data["id"],
-        title=vacancy_data["name"],
-        link=vacancy_data["alternate_url"],
-        salary=vacancy_data["salary"],
-        description=vacancy_data["snippet"]["requirement"],
-    )
+        return self.sort_key == other.sort_key
@@ -0,0 +1,237 @@
+import argparse
+import glob
+import logging
+import os
+from typing import Callable, List, Optional
+
+
+def data_path(args: argparse.Namespace, filename: str) -> str:
+    """Абсолютный путь к файлу в каталоге данных."""
+    return os.path.abspath(os.path.join(args.data_dir, filename))
+
+
+def report_failed_pages(failed_pages: List[int], keyword: str) -> None:
+    """Сообщение о страницах, которые не удалось загрузить даже с повторами."""
+    print(f"{keyword}: не удалось загрузить страницы {failed_pages}, результаты неполные")
+
+
+def run_search(args: argparse.Namespace) -> None:
+    """Интерактивный поиск вакансий."""
+    from src.user_interaction import UserInteraction
+
+    UserInteraction.user_interaction()
+
+
+def run_storage_demo(args: argparse.Namespace) -> None:
+    """Загрузка вакансий в JSON-хранилище, выборка по названию и удаление."""
+    from src.API_HH import HHVacancyAPI
+    from src.Filtered_vacancy import JSONVacancyStorage, ingest_vacancies, save_to_json_file
+    from src.request_scheduler import default_scheduler
+
+    hh_api = HHVacancyAPI(scheduler=default_scheduler())
+
+    # Создаем и сохраняем вакансии по мере загрузки страниц
+    json_storage = JSONVacancyStorage(data_path(args, "vacancies.json"))
+    result = ingest_vacancies(
+        json_storage,
+        hh_api.iter_vacancies(args.keyword),
+        on_vacancy=lambda vacancy: print(f"Получена вакансия: {vacancy.title}"),
+    )
+    print(
+        f"Получено {result['fetched']}, новых {result['added']}, обновлено {result['updated']}, "
+        f"без изменений {result['unchanged']}"
+    )
+    if hh_api.failed_pages:
+        report_failed_pages(hh_api.failed_pages, args.keyword)
+
+    # Получаем вакансии по критерию
+    filtered_vacancies = json_storage.get_vacancies(title=args.keyword)
+    save_to_json_file(filtered_vacancies, data_path(args, "filtered_vacancies.json"))
+
+    # Удаление вакансии по названию
+    if args.delete_title:
+        json_storage.delete_vacancy_by_title(args.delete_title)
+
+    # Проверка, что вакансия удалена
+    remaining_vacancies = json_storage.get_vacancies()
+    save_to_json_file(remaining_vacancies, data_path(args, "remaining_vacancies.json"))
+    if hh_api.failed_pages:
+        raise SystemExit(1)
+
+
+def run_sync(args: argparse.Namespace) -> None:
+    """Инкрементальная синхронизация хранилища по ключевым словам."""
+    from src.API_HH import HHVacancyAPI
+    from src.Filtered_vacancy import JSONVacancyStorage
+    from src.incremental_sync import IncrementalSync
+    from src.request_scheduler import default_scheduler
+
+    sync = IncrementalSync(
+        HHVacancyAPI(scheduler=default_scheduler()),
+        JSONVacancyStorage(data_path(args, "vacancies.json")),
+        data_path(args, "sync_state.json"),
+    )
+    incomplete = False
+    for keyword in args.keywords:
+        result = sync.sync(keyword)
+        print(
+            f"{keyword}: получено {result['fetched']}, новых {result['added']}, обновлено {result['updated']}, "
+            f"без изменений {result['unchanged']}"
+        )
+        if result["failed_pages"]:
+            report_failed_pages(result["failed_pages"], keyword)
+            incomplete = True
+    if incomplete:
+        raise SystemExit(1)
+
+
+def run_migrate_sqlite(args: argparse.Namespace) -> None:
+    """Перенос JSON-файлов из каталога данных в SQLite."""
+    from src.sqlite_storage import SQLiteVacancyStorage, migrate_json_to_sqlite
+
+    storage = SQLiteVacancyStorage(data_path(args, "vacancies.db"))
+    paths = sorted(glob.glob(data_path(args, "*.json")))
+    report = migrate_json_to_sqlite(paths, storage)
+    storage.close()
+    print(
+        f"Перенесено файлов: {report['migrated']}, пропущено: {report['skipped']}, "
+        f"вакансий в хранилище: {report['count']}"
+    )
+    if report["skipped"]:
+        raise SystemExit(1)
+
+
+def run_ingest(args: argparse.Namespace) -> None:
+    """Загрузка сохраненных ответов API из файлов в хранилище в несколько процессов."""
+    from src.ingest import ingest_dumps
+
+    storage = open_storage(args.storage, args)
+    report = ingest_dumps(args.paths, storage, workers=args.workers)
+    if args.storage == "sqlite":
+        storage.close()
+    print(
+        f"Файлов: {report['files']}, вакансий: {report['parsed']}, повторов: {report['duplicates']}, "
+        f"некорректных: {report['invalid']}, новых: {report['added']}, обновлено: {report['updated']}, "
+        f"без изменений: {report['unchanged']} "
+        f"за {report['seconds']:.2f} с ({report['records_per_second']:.0f} в секунду)"
+    )
+
+
+def run_snapshot(args: argparse.Namespace) -> None:
+    """Запись бинарного снимка хранилища для быстрого открытия через mmap."""
+    from src.snapshot import write_snapshot
+
+    storage = open_storage(args.storage, args)
+    path = data_path(args, "vacancies.snap")
+    try:
+        count = write_snapshot(path, storage)
+    except IOError as e:
+        print(f"Ошибка при записи в файл: {e}")
+        return
+    finally:
+        if args.storage == "sqlite":
+            storage.close()
+    print(f"Снимок {path}: вакансий {count}")
+
+
+def open_storage(kind: str, args: argparse.Namespace):
+    """Хранилище вакансий выбранного типа в каталоге данных."""
+    if kind == "json":
+        from src.Filtered_vacancy import JSONVacancyStorage
+
+        return JSONVacancyStorage(data_path(args, "vacancies.json"))
+    if kind == "jsonl":
+        from src.jsonl_storage import JSONLVacancyStorage
+
+        return JSONLVacancyStorage(data_path(args, "vacancies.jsonl"))
+    from src.sqlite_storage import SQLiteVacancyStorage
+
+    return SQLiteVacancyStorage(data_path(args, "vacancies.db"))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src", description="Анализ вакансий с HH.ru")
+    parser.add_argument("--profile", metavar="PATH", help="профилировать команду (cProfile) и сохранить статистику")
+    parser.add_argument(
+        "--metrics",
+        metavar="SINK",
+        action="append",
+        help="включить измерения и выводить их: log, jsonl:путь или prometheus:путь (можно несколько раз)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    search = subparsers.add_parser("search", help="интерактивный поиск вакансий (по умолчанию)")
+    search.set_defaults(handler=run_search)
+
+    demo = subparsers.add_parser("storage-demo", help="загрузка, выборка и удаление вакансий в JSON-хранилище")
+    demo.add_argument("--keyword", default="Python Developer", help="поисковый запрос")
+    demo.add_argument("--delete-title", default="Middle React developer [CMDB]", help="название для удаления")
+    demo.add_argument("--data-dir", default="data", help="каталог для файлов хранилища")
+    demo.set_defaults(handler=run_storage_demo)
+
+    sync = subparsers.add_parser("sync", help="загрузка только новых вакансий с прошлого запуска")
+    sync.add_argument("keywords", nargs="+", help="поисковые запросы")
+    sync.add_argument("--data-dir", default="data", help="каталог для файлов хранилища")
+    sync.set_defaults(handler=run_sync)
+
+    migrate = subparsers.add_parser("migrate-sqlite", help="перенос JSON-файлов из каталога данных в SQLite")
+    migrate.add_argument("--data-dir", default="data", help="каталог с JSON-файлами")
+    migrate.set_defaults(handler=run_migrate_sqlite)
+
+    ingest = subparsers.add_parser("ingest", help="загрузка сохраненных ответов API из файлов в хранилище")
+    ingest.add_argument("paths", nargs="+", help="JSON-файлы со страницами выдачи api.hh.ru")
+    ingest.add_argument("--workers", type=int, default=None, help="число процессов (по умолчанию - по числу ядер)")
+    ingest.add_argument("--storage", choices=("sqlite", "jsonl", "json"), default="sqlite", help="тип хранилища")
+    ingest.add_argument("--data-dir", default="data", help="каталог для файлов хранилища")
+    ingest.set_defaults(handler=run_ingest)
+
+    snapshot = subparsers.add_parser("snapshot", help="запись бинарного снимка хранилища (vacancies.snap)")
+    snapshot.add_argument("--storage", choices=("json", "jsonl", "sqlite"), default="json", help="тип хранилища")
+    snapshot.add_argument("--data-dir", default="data", help="каталог для файлов хранилища")
+    snapshot.set_defaults(handler=run_snapshot)
+
+    return parser
+
+
+def run_profiled(handler: Callable[[argparse.Namespace], None], args: argparse.Namespace) -> None:
+    """Выполнение команды под cProfile: статистика сохраняется в args.profile, 20 самых дорогих вызовов выводятся."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(handler, args)
+    finally:
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Точка входа командной строки."""
+    args = build_parser().parse_args(argv)
+    handler = getattr(args, "handler", run_search)
+
+    sinks = []
+    if args.metrics:
+        from src import instrumentation
+
+        try:
+            sinks = [instrumentation.make_sink(spec) for spec in args.metrics]
+        except ValueError as e:
+            build_parser().error(str(e))
+        if any(isinstance(sink, instrumentation.LogSink) for sink in sinks):
+            logging.basicConfig(level=logging.INFO, format="%(message)s")
+        instrumentation.enable(*sinks)
+
+    try:
+        if args.profile:
+            run_profiled(handler, args)
+        else:
+            handler(args)
+    finally:
+        if sinks:
+            instrumentation.flush()
+            instrumentation.disable()
+            for sink in sinks:
+                if isinstance(sink, instrumentation.JSONLinesSink):
+                    sink.close()
@@ -0,0 +1,225 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, TypedDict, Union, cast
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # orjson - необязательная зависимость
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:  # msgspec - необязательная зависимость
+    HAS_MSGSPEC = False
+
+
+# Ключ "from" - зарезервированное слово, поэтому тип объявлен функциональным синтаксисом.
+# int | float: суммы должны остаться целыми, как в исходном JSON
+HHSalary = TypedDict(
+    "HHSalary",
+    {
+        "from": Union[int, float, None],
+        "to": Union[int, float, None],
+        "currency": Optional[str],
+        "gross": Optional[bool],
+    },
+    total=False,
+)
+
+
+class HHSnippet(TypedDict, total=False):
+    """Фрагменты описания вакансии."""
+
+    requirement: Optional[str]
+    responsibility: Optional[str]
+
+
+class HHArea(TypedDict, total=False):
+    """Регион вакансии."""
+
+    id: str
+    name: str
+
+
+class HHVacancyItem(TypedDict, total=False):
+    """Вакансия из выдачи api.hh.ru - только поля, которые использует проект."""
+
+    id: str
+    name: str
+    alternate_url: str
+    salary: Optional[HHSalary]
+    snippet: Optional[HHSnippet]
+    area: Optional[HHArea]
+    published_at: Optional[str]
+
+
+class HHVacancyPage(TypedDict, total=False):
+    """Страница выдачи /vacancies."""
+
+    items: List[HHVacancyItem]
+    found: int
+    pages: int
+    page: int
+    per_page: int
+
+
+ITEM_FIELDS = tuple(HHVacancyItem.__annotations__)
+SALARY_FIELDS = tuple(HHSalary.__annotations__)
+SNIPPET_FIELDS = tuple(HHSnippet.__annotations__)
+AREA_FIELDS = tuple(HHArea.__annotations__)
+PAGE_FIELDS = tuple(field for field in HHVacancyPage.__annotations__ if field != "items")
+
+
+def _project(data: Optional[Dict[str, Any]], fields: tuple) -> Optional[Dict[str, Any]]:
+    if data is None:
+        return None
+    return {field: data[field] for field in fields if field in data}
+
+
+def project_item(item: Dict[str, Any]) -> HHVacancyItem:
+    """Вакансия, в которой оставлены только поля HHVacancyItem."""
+    result = {field: item[field] for field in ITEM_FIELDS if field in item}
+    if "salary" in result:
+        result["salary"] = _project(result["salary"], SALARY_FIELDS)
+    if "snippet" in result:
+        result["snippet"] = _project(result["snippet"], SNIPPET_FIELDS)
+    if "area" in result:
+        result["area"] = _project(result["area"], AREA_FIELDS)
+    return result  # type: ignore[return-value]
+
+
+def project_page(data: Dict[str, Any]) -> HHVacancyPage:
+    """Страница выдачи, в которой оставлены только поля HHVacancyPage."""
+    page = {field: data[field] for field in PAGE_FIELDS if field in data}
+    if "items" in data:
+        page["items"] = [project_item(item) for item in data["items"]]
+    return page  # type: ignore[return-value]
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _orjson_loads(data: Union[bytes, str]) -> Any:
+    # orjson.JSONDecodeError наследуется от json.JSONDecodeError
+    return orjson.loads(data)
+
+
+def _orjson_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode("utf-8")
+
+
+def _as_json_error(error: Exception, data: Union[bytes, str]) -> json.JSONDecodeError:
+    return json.JSONDecodeError(str(error), data if isinstance(data, str) else "", 0)
+
+
+if HAS_MSGSPEC:
+    _msgspec_decoder = msgspec.json.Decoder()
+    _msgspec_page_decoder = msgspec.json.Decoder(HHVacancyPage)
+    _msgspec_encoder = msgspec.json.Encoder()
+
+
+def _msgspec_loads(data: Union[bytes, str]) -> Any:
+    try:
+        return _msgspec_decoder.decode(data)
+    except msgspec.DecodeError as e:
+        raise _as_json_error(e, data) from e
+
+
+def _msgspec_dumps(value: Any) -> str:
+    return cast(str, _msgspec_encoder.encode(value).decode("utf-8"))
+
+
+def _msgspec_decode_page(data: Union[bytes, str]) -> HHVacancyPage:
+    # Декодер по схеме сразу пропускает лишние поля, не создавая для них объектов
+    try:
+        return cast(HHVacancyPage, _msgspec_page_decoder.decode(data))
+    except msgspec.ValidationError:
+        # Ответ с неожиданными типами полей разбирается без схемы
+        return project_page(_msgspec_loads(data))
+    except msgspec.DecodeError as e:
+        raise _as_json_error(e, data) from e
+
+
+_BACKENDS: Dict[str, Dict[str, Callable[..., Any]]] = {"json": {"loads": _stdlib_loads, "dumps": _stdlib_dumps}}
+if HAS_ORJSON:
+    _BACKENDS["orjson"] = {"loads": _orjson_loads, "dumps": _orjson_dumps}
+if HAS_MSGSPEC:
+    _BACKENDS["msgspec"] = {"loads": _msgspec_loads, "dumps": _msgspec_dumps, "decode_page": _msgspec_decode_page}
+
+
+def available_backends() -> List[str]:
+    """Установленные библиотеки JSON, от самой быстрой."""
+    return [name for name in ("msgspec", "orjson", "json") if name in _BACKENDS]
+
+
+_backend = available_backends()[0]
+
+
+def get_backend() -> str:
+    """Текущая библиотека JSON."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Выбор библиотеки JSON: "msgspec", "orjson" или "json"."""
+    global _backend
+    if name not in _BACKENDS:
+        raise ValueError(f"Библиотека JSON '{name}' недоступна, установлены: {available_backends()}")
+    _backend = name
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Разбор JSON из bytes или str. При ошибке - json.JSONDecodeError для любой библиотеки."""
+    return _BACKENDS[_backend]["loads"](data)
+
+
+def dumps(value: Any) -> str:
+    """Компактная запись JSON без экранирования не-ASCII символов."""
+    return cast(str, _BACKENDS[_backend]["dumps"](value))
+
+
+def loads_array_prefix(data: Union[bytes, str]) -> List[Any]:
+    """Полные элементы JSON-массива, в том числе обрезанного на середине элемента.
+
+    Элементы разбираются по одному до первого недописанного, поэтому из файла, запись
+    которого прервалась, читается все, что успело записаться. Если данные не начинаются
+    с массива - json.JSONDecodeError.
+    """
+    text = data.decode("utf-8") if isinstance(data, bytes) else data
+    position = len(text) - len(text.lstrip())
+    if not text.startswith("[", position):
+        raise json.JSONDecodeError("Ожидался массив JSON", text, position)
+    position += 1
+    decoder = json.JSONDecoder()
+    items = []
+    while True:
+        while position < len(text) and text[position] in " \t\r\n,":
+            position += 1
+        if position >= len(text) or text[position] == "]":
+            break
+        try:
+            item, position = decoder.raw_decode(text, position)
+        except json.JSONDecodeError:
+            break
+        items.append(item)
+    return items
+
+
+def decode_vacancy_page(data: Union[bytes, str]) -> HHVacancyPage:
+    """Разбор страницы выдачи api.hh.ru с отбрасыванием полей, которые проект не использует.
+
+    Полный ответ содержит десятки полей на вакансию (работодатель, адрес, график и т.д.);
+    в памяти остаются только поля HHVacancyItem.
+    """
+    decode_page = _BACKENDS[_backend].get("decode_page")
+    if decode_page is not None:
+        return cast(HHVacancyPage, decode_page(data))
+    return project_page(loads(data))
@@ -0,0 +1,121 @@
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+from src.ranking import SalaryKey, salary_key
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from src.salary_columns import SalaryColumns
+
+# Файл с курсами валют относительно базовой в каталоге данных (формат: {"base": "RUR", "rates": {код: курс}})
+RATES_FILENAME = "currency_rates.json"
+DEFAULT_RATES_PATH = os.path.join("data", RATES_FILENAME)
+
+# Загруженные таблицы курсов: путь -> (mtime_ns, конвертер)
+_loaded: Dict[str, Tuple[int, "CurrencyConverter"]] = {}
+# Файлы курсов, о недоступности которых уже выведено предупреждение
+_warned: Set[str] = set()
+
+
+class CurrencyConverter:
+    """Пересчет зарплат в базовую валюту по таблице курсов.
+
+    Курсы заданы как в справочнике api.hh.ru: сколько единиц валюты стоит одна единица базовой,
+    поэтому сумма в базовой валюте - это сумма / курс. Множители 1 / курс считаются один раз
+    при создании, так что пересчет записи - одно умножение.
+    Зарплата без валюты считается указанной в базовой; неизвестная валюта оставляется как есть.
+    """
+
+    def __init__(self, rates: Dict[str, float], base: str = "RUR") -> None:
+        for code, rate in rates.items():
+            if not rate or rate <= 0:
+                raise ValueError(f"Некорректный курс валюты {code}: {rate}")
+        self.base = base
+        self.rates = dict(rates)
+        self.rates.setdefault(base, 1.0)
+        self.multipliers = {code: 1 / rate for code, rate in self.rates.items()}
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RATES_PATH) -> "CurrencyConverter":
+        """Загрузка таблицы курсов из JSON-файла; повторно файл читается, только если он изменился."""
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _loaded.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        converter = cls(data["rates"], data.get("base", "RUR"))
+        _loaded[path] = (mtime, converter)
+        return converter
+
+    def multiplier(self, currency: Optional[str]) -> float:
+        """Множитель для пересчета суммы в базовую валюту."""
+        if currency is None:
+            return 1.0
+        return self.multipliers.get(currency, 1.0)
+
+    def to_base(self, amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+        """Сумма в базовой валюте."""
+        if amount is None:
+            return None
+        return amount * self.multiplier(currency)
+
+    def normalize_salary(self, salary: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Зарплата HH с границами, пересчитанными в базовую валюту."""
+        if not salary:
+            return salary
+        multiplier = self.multiplier(salary.get("currency"))
+        return {
+            **salary,
+            "from": salary["from"] * multiplier if salary.get("from") is not None else salary.get("from"),
+            "to": salary["to"] * multiplier if salary.get("to") is not None else salary.get("to"),
+            "currency": self.base,
+        }
+
+    def salary_key(self, field: str = "from") -> SalaryKey:
+        """Функция-ключ для ranking.top_n по сумме в базовой валюте."""
+        return salary_key(field, rates=self.multipliers)
+
+    def row_factors(self, columns: "SalaryColumns") -> "np.ndarray":
+        """Множители для каждой строки SalaryColumns (для amounts в top_k/stats и factors в filter_range)."""
+        import numpy as np
+
+        factors = np.array([self.multiplier(code) for code in columns.currencies] + [1.0])
+        # Код -1 (валюта не указана) попадает на последний элемент, множитель 1
+        return factors[columns.currency]
+
+    def column_amounts(self, columns: "SalaryColumns", field: str = "from") -> "np.ndarray":
+        """Суммы столбца SalaryColumns в базовой валюте."""
+        amounts: "np.ndarray" = columns.amount(field) * self.row_factors(columns)
+        return amounts
+
+
+def rates_path(data_dir: str) -> str:
+    """Файл курсов в каталоге данных."""
+    return os.path.join(data_dir, RATES_FILENAME)
+
+
+def default_converter(path: str = DEFAULT_RATES_PATH) -> Optional[CurrencyConverter]:
+    """Конвертер по файлу курсов или None, если файл не загружен.
+
+    О недоступном файле предупреждение выводится один раз, а не при каждом обращении.
+    """
+    try:
+        return CurrencyConverter.from_file(path)
+    except (OSError, ValueError, KeyError) as e:
+        path = os.path.abspath(path)
+        if path not in _warned:
+            _warned.add(path)
+            print(f"Курсы валют не загружены, зарплаты сравниваются без пересчета: {e}")
+        return None
+
+
+def default_salary_key(field: str = "from", path: str = DEFAULT_RATES_PATH) -> SalaryKey:
+    """Ключ ранжирования в базовой валюте, если есть файл курсов, иначе по суммам как есть."""
+    converter = default_converter(path)
+    if converter is None:
+        return salary_key(field)
+    return converter.salary_key(field)
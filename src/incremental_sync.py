@@ -0,0 +1,84 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, cast
+
+from src.API_HH import HHVacancyAPI
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.Vacancy import Vacancy
+
+# Формат дат api.hh.ru, например "2024-07-26T12:02:46+0300"
+HH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """Разбор даты публикации вакансии. Возвращает None для пустой или некорректной даты."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, HH_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+class IncrementalSync:
+    """Инкрементальная синхронизация: загрузка только вакансий, опубликованных с прошлого запуска."""
+
+    def __init__(self, api: HHVacancyAPI, storage: JSONVacancyStorage, state_file: str) -> None:
+        self.api = api
+        self.storage = storage
+        # Файл с отметками последней синхронизации: {ключевое слово: published_at}
+        self.state_file = state_file
+
+    def load_state(self) -> Dict[str, str]:
+        """Чтение отметок последней синхронизации."""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as file:
+                return cast(Dict[str, str], json.load(file))
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def save_state(self, state: Dict[str, str]) -> None:
+        """Атомарная запись отметок синхронизации."""
+        tmp_path = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(state, file, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.state_file)
+        except IOError as e:
+            print(f"Ошибка при записи в файл: {e}")
+
+    @staticmethod
+    def latest_published_at(items: List[Dict[str, Any]], current: Optional[str]) -> Optional[str]:
+        """Наибольшая дата публикации среди полученных вакансий и текущей отметки."""
+        latest, latest_raw = parse_published_at(current), current
+        for item in items:
+            published = parse_published_at(item.get("published_at"))
+            if published is not None and (latest is None or published > latest):
+                latest, latest_raw = published, item["published_at"]
+        return latest_raw
+
+    def sync(self, keyword: str) -> Dict[str, Any]:
+        """Загрузка новых и измененных вакансий по запросу и слияние их с хранилищем по 'id'.
+
+        Неудавшиеся страницы догружаются один раз через api.resume(). Если и после этого
+        часть страниц не загружена, полученные вакансии сохраняются, но отметка синхронизации
+        не сдвигается (иначе вакансии с пропущенных страниц больше не попали бы в выборку),
+        а номера страниц возвращаются в 'failed_pages'.
+        """
+        state = self.load_state()
+        since = state.get(keyword)
+
+        items = self.api.get_vacancies(keyword, date_from=since)
+        if self.api.failed_pages:
+            items = self.api.resume()
+        failed_pages = list(self.api.failed_pages)
+        vacancies = Vacancy.from_api_many(items)
+        result = self.storage.upsert_vacancies(vacancies)
+
+        latest = self.latest_published_at(items, since)
+        if latest and not failed_pages:
+            state[keyword] = latest
+            self.save_state(state)
+
+        return {"fetched": len(items), **result, "failed_pages": failed_pages}
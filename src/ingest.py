@@ -0,0 +1,137 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src import codec
+from src.Filtered_vacancy import VacancyStorage
+from src.Vacancy import Vacancy
+
+
+def iter_dump_items(data: Any) -> Iterator[Dict[str, Any]]:
+    """Вакансии из сохраненного ответа api.hh.ru: страницы {"items": [...]}, списка страниц или списка вакансий.
+
+    Данные другой структуры (число, строка, "items" не список) - ValueError.
+    """
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        raise ValueError("ожидалась страница выдачи или список страниц/вакансий")
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        if "items" in entry:
+            if not isinstance(entry["items"], list):
+                raise ValueError("поле 'items' должно быть списком")
+            yield from entry["items"]
+        elif "id" in entry and "name" in entry:
+            yield entry
+
+
+def normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Вакансия API в формате хранилища - через Vacancy.from_api, как в ingest_vacancies и IncrementalSync.
+
+    Поэтому одна и та же вакансия, загруженная из файла и из API, записывается одинаково
+    и при повторной загрузке считается неизмененной.
+    """
+    return Vacancy.from_api(item).to_dict()
+
+
+def parse_dump(path: str) -> Tuple[List[Dict[str, Any]], int, int, Optional[str]]:
+    """Разбор одного файла: записи без повторов по 'id', число повторов, число некорректных
+    элементов (без обязательных полей) и ошибка чтения файла.
+
+    Выполняется в дочернем процессе, поэтому возвращает только простые данные, а не печатает ошибки.
+    """
+    records = []
+    seen = set()
+    duplicates = 0
+    invalid = 0
+    try:
+        with open(path, "rb") as file:
+            data = codec.loads(file.read())
+        # Файл неожиданной структуры пропускается целиком, как и файл с некорректным JSON
+        for item in iter_dump_items(data):
+            try:
+                record = normalize_item(item)
+            except (KeyError, TypeError):
+                invalid += 1
+                continue
+            if record["id"] in seen:
+                duplicates += 1
+                continue
+            seen.add(record["id"])
+            records.append(record)
+    except (ValueError, OSError) as e:
+        return [], 0, 0, f"Файл {path} пропущен: {e}"
+    return records, duplicates, invalid, None
+
+
+def ingest_dumps(
+    paths: Sequence[str],
+    storage: VacancyStorage,
+    workers: Optional[int] = None,
+    batch_size: int = 10000,
+) -> Dict[str, Any]:
+    """Загрузка сохраненных ответов API в хранилище.
+
+    Файлы разбираются в пуле из workers процессов (по умолчанию - по числу ядер, 1 - без пула),
+    результаты сливаются в порядке файлов: из повторяющихся по 'id' вакансий остается первая.
+    Запись в хранилище идет пачками по batch_size через upsert_vacancies: вакансии, уже
+    сохраненные с тем же содержимым, не перезаписываются.
+    Возвращает отчет: files, parsed, duplicates, invalid (элементы без обязательных полей), added, updated,
+    unchanged, seconds, records_per_second.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    report: Dict[str, float] = {
+        "files": len(paths),
+        "parsed": 0,
+        "duplicates": 0,
+        "invalid": 0,
+        "added": 0,
+        "updated": 0,
+        "unchanged": 0,
+    }
+    seen = set()
+    batch: List[Dict[str, Any]] = []
+
+    for records, duplicates, invalid, error in _map(parse_dump, paths, workers):
+        if error is not None:
+            print(error)
+        report["parsed"] += len(records) + duplicates + invalid
+        report["duplicates"] += duplicates
+        report["invalid"] += invalid
+        for record in records:
+            if record["id"] in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(record["id"])
+            batch.append(record)
+            if len(batch) >= batch_size:
+                _store(storage, batch, report)
+                batch = []
+    if batch:
+        _store(storage, batch, report)
+
+    report["seconds"] = time.perf_counter() - start
+    report["records_per_second"] = report["parsed"] / report["seconds"] if report["seconds"] else 0.0
+    return report
+
+
+def _store(storage: VacancyStorage, batch: List[Dict[str, Any]], report: Dict[str, Any]) -> None:
+    for key, value in storage.upsert_vacancies(batch).items():
+        report[key] += value
+
+
+def _map(func: Any, paths: Sequence[str], workers: int) -> Iterable[Any]:
+    if workers <= 1 or len(paths) <= 1:
+        return map(func, paths)
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(paths)))
+    return _executor_map(executor, func, paths)
+
+
+def _executor_map(executor: ProcessPoolExecutor, func: Any, paths: Sequence[str]) -> Iterator[Any]:
+    # Результаты забираются по мере готовности в порядке файлов; пул закрывается после последнего
+    with executor:
+        yield from executor.map(func, paths)
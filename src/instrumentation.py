@@ -0,0 +1,183 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Включено ли измерение: пока выключено, span и count сразу возвращаются
+_enabled = False
+_lock = threading.Lock()
+_sinks: List["Sink"] = []
+_counters: Dict[str, float] = {}
+_spans: Dict[str, Dict[str, float]] = {}
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Sink:
+    """Получатель измерений: emit - для каждого завершенного участка, flush - для итоговой сводки."""
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        pass
+
+    def flush(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
+
+class LogSink(Sink):
+    """Вывод измерений в logging (logger src.instrumentation)."""
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        self.level = level
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        logger.log(self.level, "%s: %.3f мс", event["span"], event["seconds"] * 1000)
+
+    def flush(self, snapshot: Dict[str, Any]) -> None:
+        for name, value in sorted(snapshot["counters"].items()):
+            logger.log(self.level, "%s = %s", name, value)
+        for name, span in sorted(snapshot["spans"].items()):
+            logger.log(self.level, "%s: %d раз, всего %.3f с", name, span["count"], span["total"])
+
+
+class JSONLinesSink(Sink):
+    """Запись каждого участка и итоговой сводки строками JSON в файл."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        self._write(event)
+
+    def flush(self, snapshot: Dict[str, Any]) -> None:
+        self._write({"summary": snapshot, "time": time.time()})
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class PrometheusTextSink(Sink):
+    """Сводка в текстовом формате Prometheus (для node_exporter textfile collector).
+
+    Файл перезаписывается атомарно при каждом flush; отдельные участки не пишутся.
+    """
+
+    def __init__(self, path: str, prefix: str = "hh_vacancy") -> None:
+        self.path = path
+        self.prefix = prefix
+
+    def render(self, snapshot: Dict[str, Any]) -> str:
+        lines = [f"# TYPE {self.prefix}_counter_total counter"]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f'{self.prefix}_counter_total{{name="{name}"}} {value}')
+        lines.append(f"# TYPE {self.prefix}_span_seconds summary")
+        for name, span in sorted(snapshot["spans"].items()):
+            lines.append(f'{self.prefix}_span_seconds_count{{span="{name}"}} {span["count"]}')
+            lines.append(f'{self.prefix}_span_seconds_sum{{span="{name}"}} {span["total"]}')
+        return "\n".join(lines) + "\n"
+
+    def flush(self, snapshot: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(self.render(snapshot))
+            os.replace(tmp_path, self.path)
+        except IOError as e:
+            print(f"Ошибка при записи в файл: {e}")
+
+
+def make_sink(spec: str) -> Sink:
+    """Получатель по описанию: "log", "jsonl:путь" или "prometheus:путь"."""
+    kind, _, path = spec.partition(":")
+    if kind == "log":
+        return LogSink()
+    if kind == "jsonl" and path:
+        return JSONLinesSink(path)
+    if kind == "prometheus" and path:
+        return PrometheusTextSink(path)
+    raise ValueError(f"Неизвестный получатель измерений: {spec!r} (ожидается log, jsonl:путь или prometheus:путь)")
+
+
+def enable(*sinks: Sink) -> None:
+    """Включение измерений с выводом в sinks; накопленные значения сбрасываются."""
+    global _enabled
+    with _lock:
+        _sinks[:] = sinks
+        _counters.clear()
+        _spans.clear()
+        _enabled = True
+
+
+def disable() -> None:
+    """Выключение измерений со сбросом накопленных значений (итоговую сводку нужно получить раньше - flush)."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        _sinks.clear()
+        _counters.clear()
+        _spans.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def count(name: str, value: float = 1) -> None:
+    """Увеличение счетчика name на value."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def span(name: str) -> ContextManager[Any]:
+    """Измерение времени участка кода: with span("storage.json.load"): ..."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _timed(name)
+
+
+@contextlib.contextmanager
+def _timed(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        with _lock:
+            stats = _spans.get(name)
+            if stats is None:
+                stats = _spans[name] = {"count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            sinks = list(_sinks)
+        event = {"span": name, "seconds": seconds, "time": time.time()}
+        for sink in sinks:
+            sink.emit(event)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Текущие значения: {"counters": {...}, "spans": {имя: {"count", "total", "max"}}}."""
+    with _lock:
+        return {"counters": dict(_counters), "spans": {name: dict(stats) for name, stats in _spans.items()}}
+
+
+def flush() -> Optional[Dict[str, Any]]:
+    """Передача итоговой сводки всем получателям. Возвращает сводку или None, если измерения выключены."""
+    if not _enabled:
+        return None
+    summary = snapshot()
+    for sink in list(_sinks):
+        sink.flush(summary)
+    return summary
@@ -0,0 +1,152 @@
+import gzip
+import json
+import os
+from functools import lru_cache
+from typing import IO, Any, Iterator, List, Optional, cast
+
+try:
+    import zstandard
+
+    HAS_ZSTANDARD = True
+except ImportError:  # zstandard - необязательная зависимость
+    HAS_ZSTANDARD = False
+
+COMPRESSIONS = (None, "gzip", "zstd")
+# Размер блока, которым текст передается в файл (и компрессору)
+BUFFER_SIZE = 1 << 16
+
+
+def iter_json_chunks(
+    value: Any, indent: Optional[int] = 4, ensure_ascii: bool = True, level: int = 0
+) -> Iterator[str]:
+    """Части JSON-текста значения - в точности как json.dump(value, indent=indent).
+
+    Словари, списки и итераторы (например, генераторы вакансий) на верхних уровнях выдаются
+    поэлементно, поэтому итератор не собирается в список. Элементы списков кодируются целиком.
+    indent=None - компактная запись без пробелов.
+    """
+    if level == 0 and not _has_iterators(value):
+        # Данные уже в памяти: быстрее отдать их стандартному кодировщику целиком
+        yield from _encoder(indent, ensure_ascii).iterencode(value)
+        return
+    if isinstance(value, dict):
+        items = iter(value.items())
+        opening, closing = "{", "}"
+    elif isinstance(value, (list, tuple, Iterator)):
+        items = iter(value)
+        opening, closing = "[", "]"
+    else:
+        yield _dumps(value, indent, ensure_ascii, level)
+        return
+
+    if indent is None:
+        separator, newline, closing_newline = ",", "", ""
+    else:
+        newline = "\n" + " " * (indent * (level + 1))
+        separator = "," + newline
+        closing_newline = "\n" + " " * (indent * level)
+    key_separator = ":" if indent is None else ": "
+
+    yield opening
+    first = True
+    for item in items:
+        yield newline if first else separator
+        first = False
+        if closing == "}":
+            key, item = item
+            yield json.dumps(str(key), ensure_ascii=ensure_ascii) + key_separator
+            if isinstance(item, (dict, list, tuple, Iterator)):
+                yield from iter_json_chunks(item, indent, ensure_ascii, level + 1)
+                continue
+        elif isinstance(item, Iterator):
+            yield from iter_json_chunks(item, indent, ensure_ascii, level + 1)
+            continue
+        yield _dumps(item, indent, ensure_ascii, level + 1)
+    if not first:
+        yield closing_newline
+    yield closing
+
+
+def _has_iterators(value: Any) -> bool:
+    if isinstance(value, Iterator):
+        return True
+    if isinstance(value, dict):
+        return any(isinstance(item, Iterator) for item in value.values())
+    return False
+
+
+def _buffered(chunks: Iterator[str], size: int) -> Iterator[str]:
+    """Склейка мелких частей в блоки около size символов: меньше вызовов write и сжатия."""
+    buffer: List[str] = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+@lru_cache(maxsize=None)
+def _encoder(indent: Optional[int], ensure_ascii: bool) -> json.JSONEncoder:
+    separators = (",", ":") if indent is None else None
+    return json.JSONEncoder(ensure_ascii=ensure_ascii, indent=indent, separators=separators)
+
+
+def _dumps(value: Any, indent: Optional[int], ensure_ascii: bool, level: int) -> str:
+    text = _encoder(indent, ensure_ascii).encode(value)
+    if indent is None or not level:
+        return text
+    # Переводы строк внутри JSON-строк экранированы, поэтому "\n" встречается только между элементами
+    return text.replace("\n", "\n" + " " * (indent * level))
+
+
+def _open(path: str, compression: Optional[str]) -> IO[str]:
+    if compression is None:
+        return open(path, "w", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+    if not HAS_ZSTANDARD:
+        raise ImportError("Для сжатия zstd нужен пакет zstandard: pip install zstandard")
+    return cast(IO[str], zstandard.open(path, "wt", encoding="utf-8"))
+
+
+def _fsync(path: str) -> None:
+    """Сброс содержимого уже закрытого файла на диск."""
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_json(
+    path: str,
+    data: Any,
+    indent: Optional[int] = 4,
+    ensure_ascii: bool = True,
+    compression: Optional[str] = None,
+) -> None:
+    """Потоковая атомарная запись JSON в файл.
+
+    Данные пишутся во временный файл рядом с path, сбрасываются на диск (fsync) и переименовываются
+    только после успешной записи, поэтому при сбое на месте path остается прежний файл, а не обрезанный.
+    compression - None, "gzip" или "zstd" (нужен пакет zstandard).
+    Ошибки записи (OSError) пробрасываются вызывающему коду.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Параметр 'compression' должен быть одним из {COMPRESSIONS}")
+    tmp_path = f"{path}.tmp"
+    try:
+        with _open(tmp_path, compression) as file:
+            file.writelines(_buffered(iter_json_chunks(data, indent, ensure_ascii), BUFFER_SIZE))
+        # Без fsync после сбоя питания переименование может оказаться на диске раньше данных, и на месте
+        # path останется пустой файл; сжатые потоки дописывают концовку только при закрытии, поэтому после него
+        _fsync(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
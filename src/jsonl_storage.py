@@ -0,0 +1,162 @@
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src import codec
+from src.currency import CurrencyConverter
+from src.Filtered_vacancy import VacancyStorage, match_criteria, record_filter, vacancy_to_dict
+
+# Пометка удаленной записи в журнале: {"id": ..., "_deleted": true}
+DELETED = "_deleted"
+
+
+class JSONLVacancyStorage(VacancyStorage):
+    """Хранилище вакансий в формате JSON Lines с дозаписью в конец файла.
+
+    Каждая запись - одна строка. Добавление дописывает строку, не перечитывая файл;
+    удаление дописывает пометку-tombstone. Актуальное состояние восстанавливается
+    чтением журнала по порядку (последняя запись с тем же 'id' побеждает), а compact()
+    переписывает файл, оставляя только актуальные записи.
+    """
+
+    def __init__(self, filename: str, converter: Optional[CurrencyConverter] = None):
+        super().__init__(converter)
+        self.filename = os.path.join("../data", filename)
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        if not os.path.exists(self.filename):
+            open(self.filename, "w").close()
+        self._signature = self._file_signature()
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> None:
+        """Событие "reload" для подписчиков, если файл изменен не этим объектом (по mtime и размеру)."""
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._signature = signature
+            if self._listeners:
+                self._notify("reload", list(self._load().values()))
+
+    def _append(self, records: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> None:
+        """Дозапись записей в конец файла кусками по chunk_size строк."""
+        # Изменения, сделанные извне до этой записи, не должны остаться незамеченными
+        self.refresh()
+        try:
+            with open(self.filename, "a", encoding="utf-8") as file:
+                # Недописанная последняя строка не должна склеиться с новой записью
+                lines = [""] if not self._ends_with_newline() else []
+                for record in records:
+                    lines.append(codec.dumps(record))
+                    if len(lines) >= chunk_size:
+                        file.write("\n".join(lines) + "\n")
+                        lines = []
+                if any(lines):
+                    file.write("\n".join(lines) + "\n")
+        except IOError as e:
+            print(f"Ошибка при записи в файл: {e}")
+        self._signature = self._file_signature()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.filename, "rb") as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:
+                return True
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def _load(self) -> Dict[Any, Dict[str, Any]]:
+        """Восстановление актуальных записей по журналу."""
+        records: Dict[Any, Dict[str, Any]] = {}
+        try:
+            with open(self.filename, "rb") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = codec.loads(line)
+                    except json.JSONDecodeError:
+                        # Недописанная строка после аварийного завершения
+                        continue
+                    if record.get(DELETED):
+                        records.pop(record.get("id"), None)
+                    else:
+                        records[record.get("id")] = record
+        except FileNotFoundError:
+            pass
+        return records
+
+    def add_vacancy(self, vacancy: Any) -> None:
+        """Добавление вакансии в конец файла."""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Any]) -> None:
+        """Добавление нескольких вакансий одной дозаписью."""
+        if not self._listeners:
+            self._append(vacancy_to_dict(vacancy) for vacancy in vacancies)
+            return
+        records = [vacancy_to_dict(vacancy) for vacancy in vacancies]
+        self._append(records)
+        self._notify("add", records)
+
+    def upsert_vacancies(self, vacancies: Iterable[Any]) -> Dict[str, int]:
+        """Дозапись только новых и измененных вакансий; неизмененные не пишутся в журнал."""
+        stored = self._load()
+        result = {"added": 0, "updated": 0, "unchanged": 0}
+        changed: Dict[Any, Dict[str, Any]] = {}
+        for vacancy in vacancies:
+            record = vacancy_to_dict(vacancy)
+            vacancy_id = record["id"]
+            previous = changed.get(vacancy_id, stored.get(vacancy_id))
+            if previous == record:
+                result["unchanged"] += 1
+                continue
+            result["added" if previous is None else "updated"] += 1
+            changed[vacancy_id] = record
+
+        if changed:
+            self._append(changed.values())
+            self._notify("add", list(changed.values()))
+        return result
+
+    def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """Получение вакансий по указанным критериям."""
+        converter = self.converter
+        return [vacancy for vacancy in self._load().values() if match_criteria(vacancy, criteria, converter)]
+
+    def delete_vacancy_by_title(self, title: str) -> None:
+        """Удаление вакансий с указанным названием дозаписью пометок об удалении."""
+        self.delete_where(title=title)
+
+    def delete_where(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, **criteria: Any) -> int:
+        """Удаление подходящих вакансий одной дозаписью пометок об удалении."""
+        matches = record_filter(predicate, criteria, self.converter)
+        removed = [vacancy for vacancy in self._load().values() if matches(vacancy)]
+        if not removed:
+            return 0
+        self._append({"id": vacancy.get("id"), DELETED: True} for vacancy in removed)
+        self._notify("delete", removed)
+        return len(removed)
+
+    def compact(self) -> None:
+        """Перезапись файла только с актуальными записями (атомарно через временный файл)."""
+        self.refresh()
+        records = self._load()
+        tmp_path = f"{self.filename}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                for record in records.values():
+                    file.write(codec.dumps(record) + "\n")
+                # Данные должны оказаться на диске раньше, чем переименование заменит журнал
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.filename)
+        except IOError as e:
+            print(f"Ошибка при записи в файл: {e}")
+        self._signature = self._file_signature()
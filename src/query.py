@@ -0,0 +1,329 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.Filtered_vacancy import VacancyStorage
+from src.search_index import tokenize, vacancy_description, vacancy_title
+
+if TYPE_CHECKING:
+    from src.currency import CurrencyConverter
+
+# Сколько записей просматривает планировщик для оценки избирательности условий
+SAMPLE_SIZE = 512
+
+# Относительная стоимость проверки одного условия: разбиение текста на слова намного дороже сравнения
+COSTS = {"title_prefix": 1.0, "title_contains": 1.5, "salary": 1.0, "currency": 1.0, "area": 1.0, "keywords": 10.0}
+
+# Ключи памяти проверок одной записи, под которыми хранятся ее текст и слова
+TEXT = "text"
+TOKENS = "tokens"
+
+
+def normalize_text(text: str) -> str:
+    """Текст для сравнения без учета регистра, 'ё' как 'е' (как в search_index.tokenize)."""
+    return text.casefold().replace("ё", "е")
+
+
+class Predicate(NamedTuple):
+    """Одно условие запроса: вид ("title_prefix", "salary", ...) и неизменяемое значение."""
+
+    kind: str
+    value: Any
+
+    def matches(self, vacancy: Dict[str, Any], memo: Optional[Dict[Any, Any]] = None) -> bool:
+        """Проверка вакансии; memo - общая для условий одной записи память (например, ее слова)."""
+        return _MATCHERS[self.kind](self.value, vacancy, memo if memo is not None else {})
+
+    def __str__(self) -> str:
+        return f"{self.kind}{self.value!r}"
+
+
+def _match_title_prefix(prefix: str, vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    return normalize_text(vacancy_title(vacancy)).startswith(prefix)
+
+
+def _match_title_contains(text: str, vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    return text in normalize_text(vacancy_title(vacancy))
+
+
+def _match_salary(value: Tuple[Any, ...], vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    # Та же логика, что у критериев min_salary/max_salary в match_criteria, с пересчетом в базовую валюту
+    minimum, maximum, converter = value
+    salary = vacancy.get("salary")
+    if not isinstance(salary, dict):
+        salary = {}
+    currency = salary.get("currency")
+    if minimum is not None:
+        amount = salary.get("from", 0)
+        if amount is None:
+            return False
+        if converter is not None:
+            amount = converter.to_base(amount, currency)
+        if amount < minimum:
+            return False
+    if maximum is not None:
+        amount = salary.get("to", float("inf"))
+        if amount is None:
+            return False
+        if converter is not None:
+            amount = converter.to_base(amount, currency)
+        if amount > maximum:
+            return False
+    return True
+
+
+def _match_currency(codes: frozenset, vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    salary = vacancy.get("salary")
+    return isinstance(salary, dict) and salary.get("currency") in codes
+
+
+def _match_area(areas: frozenset, vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    area = vacancy.get("area")
+    if isinstance(area, dict):
+        return str(area.get("id")) in areas or normalize_text(area.get("name") or "") in areas
+    return isinstance(area, str) and normalize_text(area) in areas
+
+
+def _match_keywords(terms: Tuple[str, ...], vacancy: Dict[str, Any], memo: Dict[Any, Any]) -> bool:
+    # Каждое слово текста - его подстрока, поэтому дорогое разбиение на слова нужно,
+    # только если все слова запроса нашлись в тексте как подстроки
+    text = memo.get(TEXT)
+    if text is None:
+        text = memo[TEXT] = normalize_text(f"{vacancy_title(vacancy)}\n{vacancy_description(vacancy)}")
+    if not all(term.rstrip("*") in text for term in terms):
+        return False
+    tokens = memo.get(TOKENS)
+    if tokens is None:
+        tokens = memo[TOKENS] = set(tokenize(vacancy_title(vacancy))) | set(tokenize(vacancy_description(vacancy)))
+    for term in terms:
+        if term.endswith("*"):
+            prefix = term[:-1]
+            if not any(token.startswith(prefix) for token in tokens):
+                return False
+        elif term not in tokens:
+            return False
+    return True
+
+
+_MATCHERS: Dict[str, Callable[[Any, Dict[str, Any], Dict[Any, Any]], bool]] = {
+    "title_prefix": _match_title_prefix,
+    "title_contains": _match_title_contains,
+    "salary": _match_salary,
+    "currency": _match_currency,
+    "area": _match_area,
+    "keywords": _match_keywords,
+}
+
+
+class VacancyQuery:
+    """Составной запрос к хранилищу: все условия должны выполняться одновременно.
+
+    Запрос неизменяемый: каждый метод возвращает новый запрос с добавленным условием,
+    а запросы объединяются оператором &. Запросы с одинаковым набором условий равны
+    независимо от порядка их добавления, поэтому служат ключом кэша результатов.
+
+        VacancyQuery().title_prefix("python").salary(minimum=150000).keywords("django")
+    """
+
+    __slots__ = ("predicates",)
+
+    def __init__(self, predicates: Iterable[Predicate] = ()) -> None:
+        self.predicates = frozenset(predicates)
+
+    def where(self, kind: str, value: Any) -> "VacancyQuery":
+        """Запрос с дополнительным условием."""
+        if kind not in _MATCHERS:
+            raise ValueError(f"Неизвестное условие запроса: {kind!r}")
+        return VacancyQuery(self.predicates | {Predicate(kind, value)})
+
+    def title_prefix(self, prefix: str) -> "VacancyQuery":
+        """Название начинается с prefix (без учета регистра)."""
+        return self.where("title_prefix", normalize_text(prefix))
+
+    def title_contains(self, text: str) -> "VacancyQuery":
+        """Название содержит text (без учета регистра)."""
+        return self.where("title_contains", normalize_text(text))
+
+    def salary(
+        self,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+        converter: Optional["CurrencyConverter"] = None,
+    ) -> "VacancyQuery":
+        """Зарплата 'от' не меньше minimum и 'до' не больше maximum, как min_salary/max_salary хранилища.
+
+        С converter суммы сравниваются после пересчета в базовую валюту. Без него QueryEngine
+        подставляет курсы хранилища (storage.converter), а matches() сравнивает суммы как есть.
+        """
+        if minimum is None and maximum is None:
+            raise ValueError("Нужно указать хотя бы одну границу зарплаты: minimum или maximum")
+        return self.where("salary", (minimum, maximum, converter))
+
+    def currency(self, *codes: str) -> "VacancyQuery":
+        """Зарплата указана в одной из валют (коды api.hh.ru: RUR, USD, EUR...)."""
+        return self.where("currency", frozenset(code.upper() for code in codes))
+
+    def area(self, *areas: Any) -> "VacancyQuery":
+        """Регион вакансии ('area' записи: {"id", "name"} из ответа api.hh.ru) - по 'id' или названию."""
+        return self.where("area", frozenset(normalize_text(str(area)) for area in areas))
+
+    def keywords(self, *terms: str) -> "VacancyQuery":
+        """Все слова встречаются в названии или требованиях; слово с '*' на конце - префикс."""
+        normalized = []
+        for term in terms:
+            words = tokenize(term)
+            if term.endswith("*") and words:
+                words[-1] += "*"
+            normalized.extend(words)
+        return self.where("keywords", tuple(sorted(set(normalized))))
+
+    def __and__(self, other: "VacancyQuery") -> "VacancyQuery":
+        return VacancyQuery(self.predicates | other.predicates)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, VacancyQuery) and self.predicates == other.predicates
+
+    def __hash__(self) -> int:
+        return hash(self.predicates)
+
+    def __repr__(self) -> str:
+        return f"VacancyQuery({', '.join(sorted(map(str, self.predicates)))})"
+
+    def matches(self, vacancy: Dict[str, Any]) -> bool:
+        """Проверка одной вакансии без планировщика."""
+        memo: Dict[Any, Any] = {}
+        return all(predicate.matches(vacancy, memo) for predicate in self.predicates)
+
+
+class QueryEngine:
+    """Выполнение запросов VacancyQuery над хранилищем с планировщиком и LRU-кэшем результатов.
+
+    Планировщик проверяет каждое условие на выборке из SAMPLE_SIZE записей и выполняет условия
+    в порядке возрастания стоимости на отсеянную запись: первым идет самое избирательное и дешевое.
+    Результаты последних cache_size запросов хранятся в кэше; кэш и оценки сбрасываются по
+    событиям хранилища (add_listener), то есть при любой записи через него. Перед выполнением
+    запросов вызывается storage.refresh(), поэтому изменения файла извне (другим процессом
+    или другим объектом хранилища) тоже сбрасывают кэш.
+    Условия зарплаты без своих курсов сравниваются в базовой валюте по storage.converter,
+    как критерии min_salary/max_salary хранилища.
+    """
+
+    def __init__(self, storage: VacancyStorage, cache_size: int = 128) -> None:
+        self.storage = storage
+        self.cache_size = cache_size
+        self.stats = {"hits": 0, "misses": 0, "scans": 0}
+        self._cache: "OrderedDict[VacancyQuery, Tuple[Dict[str, Any], ...]]" = OrderedDict()
+        self._selectivity: Dict[Predicate, float] = {}
+        storage.add_listener(self.on_storage_change)
+
+    def on_storage_change(self, event: str, records: List[Dict[str, Any]]) -> None:
+        """Сброс кэша результатов и оценок избирательности при изменении хранилища."""
+        self._cache.clear()
+        self._selectivity.clear()
+
+    def selectivity(self, predicate: Predicate, records: Sequence[Dict[str, Any]]) -> float:
+        """Доля записей выборки, для которых выполняется условие."""
+        estimate = self._selectivity.get(predicate)
+        if estimate is None:
+            step = max(1, len(records) // SAMPLE_SIZE)
+            sample = records[::step][:SAMPLE_SIZE]
+            passed = sum(1 for record in sample if predicate.matches(record))
+            estimate = self._selectivity[predicate] = passed / len(sample) if sample else 1.0
+        return estimate
+
+    def plan(self, query: VacancyQuery, records: Optional[Sequence[Dict[str, Any]]] = None) -> List[Predicate]:
+        """Порядок проверки условий: по стоимости на одну отсеянную запись (cost / (1 - доля))."""
+        if records is None:
+            records = self.storage.get_vacancies()
+
+        def rank(predicate: Predicate) -> Tuple[float, str]:
+            rejected = 1.0 - self.selectivity(predicate, records)
+            return COSTS[predicate.kind] / max(rejected, 1e-6), str(predicate)
+
+        return sorted(query.predicates, key=rank)
+
+    def bind(self, query: VacancyQuery) -> VacancyQuery:
+        """Запрос, в котором условия зарплаты без converter получили курсы хранилища."""
+        converter = self.storage.converter
+        if converter is None:
+            return query
+        return VacancyQuery(
+            (
+                Predicate("salary", (*predicate.value[:2], converter))
+                if predicate.kind == "salary" and predicate.value[2] is None
+                else predicate
+            )
+            for predicate in query.predicates
+        )
+
+    def explain(self, query: VacancyQuery) -> List[Tuple[str, float]]:
+        """План запроса: условия в порядке проверки с оценкой доли подходящих записей."""
+        query = self.bind(query)
+        records = self.storage.get_vacancies()
+        return [(str(predicate), self.selectivity(predicate, records)) for predicate in self.plan(query, records)]
+
+    def execute(self, query: VacancyQuery) -> List[Dict[str, Any]]:
+        """Вакансии, подходящие под запрос, в порядке хранилища."""
+        return self.execute_many([query])[0]
+
+    def execute_many(self, queries: Sequence[VacancyQuery]) -> List[List[Dict[str, Any]]]:
+        """Выполнение нескольких запросов: все, которых нет в кэше, - за один проход по записям.
+
+        Результат каждого условия для записи вычисляется один раз и используется всеми
+        запросами пачки, в которых оно встречается.
+        """
+        # Событие "reload" от хранилища, измененного извне, сбрасывает кэш до его использования
+        self.storage.refresh()
+        queries = [self.bind(query) for query in queries]
+        results: Dict[VacancyQuery, Tuple[Dict[str, Any], ...]] = {}
+        pending = []
+        for query in dict.fromkeys(queries):
+            cached = self._cache.get(query)
+            if cached is None:
+                self.stats["misses"] += 1
+                pending.append(query)
+            else:
+                self.stats["hits"] += 1
+                self._cache.move_to_end(query)
+                results[query] = cached
+
+        if pending:
+            records = self.storage.get_vacancies()
+            for query, found in zip(pending, self._scan(pending, records)):
+                results[query] = found
+                self._remember(query, found)
+        return [list(results[query]) for query in queries]
+
+    def _scan(
+        self, queries: List[VacancyQuery], records: Sequence[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], ...]]:
+        self.stats["scans"] += 1
+        plans = [self.plan(query, records) for query in queries]
+        found: List[List[Dict[str, Any]]] = [[] for _ in queries]
+
+        if len(plans) == 1:
+            plan, matched = plans[0], found[0]
+            for record in records:
+                memo: Dict[Any, Any] = {}
+                if all(predicate.matches(record, memo) for predicate in plan):
+                    matched.append(record)
+            return [tuple(matched)]
+
+        for record in records:
+            memo = {}
+            outcomes: Dict[Predicate, bool] = {}
+            for plan, matched in zip(plans, found):
+                for predicate in plan:
+                    outcome = outcomes.get(predicate)
+                    if outcome is None:
+                        outcome = outcomes[predicate] = predicate.matches(record, memo)
+                    if not outcome:
+                        break
+                else:
+                    matched.append(record)
+        return [tuple(matched) for matched in found]
+
+    def _remember(self, query: VacancyQuery, found: Tuple[Dict[str, Any], ...]) -> None:
+        self._cache[query] = found
+        self._cache.move_to_end(query)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
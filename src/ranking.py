@@ -0,0 +1,74 @@
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SalaryKey = Callable[[Dict[str, Any]], float]
+
+
+def salary_key(field: str = "from", rates: Optional[Dict[str, float]] = None) -> SalaryKey:
+    """Функция-ключ для ранжирования вакансий по зарплате.
+
+    field - "from", "to" или "mid" (середина вилки, либо единственная указанная граница).
+    rates - множители для перевода в общую валюту по коду валюты; без них суммы сравниваются как есть.
+    Вакансии без зарплаты получают ключ 0.
+    """
+    if field not in ("from", "to", "mid"):
+        raise ValueError("Параметр 'field' должен быть 'from', 'to' или 'mid'")
+
+    def key(vacancy: Dict[str, Any]) -> float:
+        salary = vacancy.get("salary")
+        if not salary:
+            return 0
+        amount: float
+        if field == "mid":
+            salary_from, salary_to = salary.get("from"), salary.get("to")
+            if salary_from and salary_to:
+                amount = (salary_from + salary_to) / 2
+            else:
+                amount = salary_from or salary_to or 0
+        else:
+            amount = salary.get(field) or 0
+        if rates is not None and amount:
+            amount *= rates.get(salary.get("currency"), 1)
+        return amount
+
+    return key
+
+
+def top_n(vacancies: Iterable[Dict[str, Any]], n: int, key: Optional[SalaryKey] = None) -> List[Dict[str, Any]]:
+    """Выбор n вакансий с наибольшим ключом за O(len * log n).
+
+    vacancies может быть итератором: в памяти одновременно держится не больше n элементов.
+    При равных ключах сохраняется исходный порядок, как у sorted(..., reverse=True)[:n].
+    """
+    return heapq.nlargest(n, vacancies, key=key or salary_key())
+
+
+class TopN:
+    """Накопитель n лучших вакансий для потоковой обработки (например, по страницам)."""
+
+    def __init__(self, n: int, key: Optional[SalaryKey] = None) -> None:
+        self.n = n
+        self.key = key or salary_key()
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        # Убывающий счетчик: при равных ключах раньше добавленная вакансия считается больше
+        self._order = count(0, -1)
+
+    def push(self, vacancy: Dict[str, Any]) -> None:
+        """Добавление одной вакансии."""
+        if self.n <= 0:
+            return
+        entry = (self.key(vacancy), next(self._order), vacancy)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """Добавление нескольких вакансий."""
+        for vacancy in vacancies:
+            self.push(vacancy)
+
+    def result(self) -> List[Dict[str, Any]]:
+        """Текущие n лучших вакансий по убыванию ключа."""
+        return [vacancy for _, _, vacancy in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
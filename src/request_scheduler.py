@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+import requests
+
+# Ответы, после которых запрос имеет смысл повторить
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Частота запросов по умолчанию для команд приложения (запросов в секунду)
+DEFAULT_RATE = 5.0
+
+
+class TokenBucket:
+    """Адаптивный ограничитель частоты запросов (token bucket).
+
+    После ответа 429 скорость уменьшается вдвое, после каждого успешного ответа
+    понемногу растет обратно до max_rate, поэтому поток запросов держится около
+    допустимого сервером предела без чередования всплесков и отказов.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Параметр 'rate' должен быть больше 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Ожидание свободного токена."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def decrease(self) -> None:
+        """Снижение скорости после ответа 429."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+
+    def increase(self) -> None:
+        """Постепенное восстановление скорости после успешного ответа."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Разбор заголовка Retry-After (секунды или HTTP-дата) в количество секунд ожидания."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """Отправка запросов с ограничением частоты и повтором при 429/5xx и сетевых ошибках."""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        # Количество повторов одной страницы, после которого она считается неудавшейся
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+        self._jitter = jitter
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """Экспоненциальная задержка со случайным разбросом (full jitter)."""
+        return self._jitter() * min(self.backoff_max, self.backoff_base * 2.0**attempt)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def get(self, session: requests.Session, url: str, **kwargs: Any) -> Optional[requests.Response]:
+        """GET-запрос с повторами. Возвращает None, если бюджет повторов исчерпан."""
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self._count("requests")
+            try:
+                response = session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self.backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.increase()
+                    return response
+                if response.status_code == 429:
+                    self._count("throttled")
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.decrease()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = retry_after if retry_after is not None else self.backoff(attempt)
+
+            if attempt < self.max_retries:
+                self._count("retries")
+                self._sleep(min(delay, self.backoff_max))
+        self._count("failed")
+        return None
+
+
+def default_scheduler() -> RequestScheduler:
+    """Планировщик для команд приложения: не больше DEFAULT_RATE запросов в секунду и повторы при 429/5xx."""
+    return RequestScheduler(TokenBucket(rate=DEFAULT_RATE))
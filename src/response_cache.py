@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, cast
+
+from src import codec
+
+
+class HTTPResponseCache:
+    """Дисковый кэш ответов API с TTL, LRU-вытеснением по размеру и условной перепроверкой."""
+
+    def __init__(self, directory: str, ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evicted": 0,
+            "bytes_from_cache": 0,
+            "bytes_downloaded": 0,
+            "network_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+        # Порядок ключей - порядок использования: в начале давно не использованные записи
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(directory, name))
+                entries.append((stat.st_mtime, name[:-5], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """Ключ записи по URL и параметрам запроса."""
+        raw = json.dumps([url, sorted((str(k), str(v)) for k, v in params.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Получение записи кэша (свежей или устаревшей) с отметкой об использовании."""
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._path(key), "rb") as file:
+                    entry = cast(Dict[str, Any], codec.loads(file.read()))
+            except (json.JSONDecodeError, FileNotFoundError):
+                self._drop(key)
+                return None
+            self._index.move_to_end(key)
+            os.utime(self._path(key))
+            return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Проверка, что запись не старше TTL."""
+        return time.time() - float(entry["stored_at"]) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Заголовки If-None-Match / If-Modified-Since для перепроверки устаревшей записи."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self, entry: Dict[str, Any], revalidated: bool = False) -> None:
+        """Учет ответа, отданного из кэша."""
+        with self._lock:
+            self.stats["hits"] += 1
+            if revalidated:
+                self.stats["revalidated"] += 1
+            self.stats["bytes_from_cache"] += len(entry["body"].encode("utf-8"))
+
+    def record_download(self, size: int, seconds: float) -> None:
+        """Учет ответа, полученного из сети."""
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["bytes_downloaded"] += size
+            self.stats["network_seconds"] += seconds
+
+    def store(
+        self, key: str, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> None:
+        """Сохранение ответа в кэш."""
+        entry = {"url": url, "stored_at": time.time(), "etag": etag, "last_modified": last_modified, "body": body}
+        self._write(key, entry)
+
+    def refresh(self, key: str, entry: Dict[str, Any]) -> None:
+        """Продление записи после ответа 304 Not Modified."""
+        entry["stored_at"] = time.time()
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            tmp_path = f"{self._path(key)}.tmp"
+            try:
+                with open(tmp_path, "wb") as file:
+                    file.write(data)
+                os.replace(tmp_path, self._path(key))
+            except IOError as e:
+                print(f"Ошибка при записи в кэш: {e}")
+                return
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._evict()
+
+    def _drop(self, key: str) -> None:
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Удаление давно не использованных записей, пока кэш больше max_bytes."""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            self._drop(oldest)
+            self.stats["evicted"] += 1
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+    def clear(self) -> None:
+        """Удаление всех записей кэша."""
+        with self._lock:
+            for key in list(self._index):
+                self._drop(key)
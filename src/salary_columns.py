@@ -0,0 +1,210 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # NumPy - необязательная зависимость
+    HAS_NUMPY = False
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def numpy_available() -> bool:
+    """Установлен ли NumPy."""
+    return HAS_NUMPY
+
+
+class SalaryColumns:
+    """Колоночное представление зарплат вакансий в массивах NumPy.
+
+    salary_from/salary_to - float64, NaN для неуказанной границы; currency - коды валют
+    (индексы в списке currencies, -1 если валюта не указана); gross - признак зарплаты до вычета налогов.
+    Фильтры, выбор топ k и статистика выполняются векторно, без цикла по словарям.
+    Строки идут в порядке исходных записей; сами записи доступны через records.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]) -> None:
+        if not HAS_NUMPY:
+            raise ImportError("Для SalaryColumns нужен NumPy: pip install numpy")
+        size = len(records)
+        self.records = records
+        self.salary_from = np.full(size, np.nan)
+        self.salary_to = np.full(size, np.nan)
+        self.currency = np.full(size, -1, dtype=np.int16)
+        self.gross = np.zeros(size, dtype=bool)
+        # Граница, отсутствующая в словаре (или вся зарплата), в фильтрах match_criteria
+        # считается равной 0 для "от" и бесконечности для "до"; явное None не проходит фильтр
+        self.from_missing = np.zeros(size, dtype=bool)
+        self.to_missing = np.zeros(size, dtype=bool)
+        self.currencies: List[str] = []
+        ids: List[Any] = []
+        position: Dict[Any, int] = {}
+
+        codes: Dict[str, int] = {}
+        for row, record in enumerate(records):
+            ids.append(record.get("id"))
+            position[record.get("id")] = row
+            salary = record.get("salary")
+            if not isinstance(salary, dict):
+                salary = {}
+            if "from" in salary:
+                if salary["from"] is not None:
+                    self.salary_from[row] = salary["from"]
+            else:
+                self.from_missing[row] = True
+            if "to" in salary:
+                if salary["to"] is not None:
+                    self.salary_to[row] = salary["to"]
+            else:
+                self.to_missing[row] = True
+            currency = salary.get("currency")
+            if currency is not None:
+                code = codes.get(currency)
+                if code is None:
+                    code = codes[currency] = len(self.currencies)
+                    self.currencies.append(currency)
+                self.currency[row] = code
+            self.gross[row] = bool(salary.get("gross"))
+        self.ids: Sequence[Any] = ids
+        self._position: Optional[Dict[Any, int]] = position
+
+    @classmethod
+    def from_arrays(
+        cls,
+        records: Sequence[Dict[str, Any]],
+        salary_from: "np.ndarray",
+        salary_to: "np.ndarray",
+        currency: "np.ndarray",
+        currencies: List[str],
+        gross: "np.ndarray",
+        from_missing: "np.ndarray",
+        to_missing: "np.ndarray",
+        ids: Sequence[Any],
+    ) -> "SalaryColumns":
+        """Построение из готовых массивов без обхода записей (например, поверх файла src.snapshot).
+
+        Массивы используются как есть, без копирования; словарь 'id' -> строка строится при первом position().
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Для SalaryColumns нужен NumPy: pip install numpy")
+        columns = cls.__new__(cls)
+        columns.records = records
+        columns.salary_from = salary_from
+        columns.salary_to = salary_to
+        columns.currency = currency
+        columns.currencies = currencies
+        columns.gross = gross
+        columns.from_missing = from_missing
+        columns.to_missing = to_missing
+        columns.ids = ids
+        columns._position = None
+        return columns
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Any]) -> "SalaryColumns":
+        """Построение по объектам Vacancy или словарям в формате хранилища."""
+        return cls([vacancy if isinstance(vacancy, dict) else vacancy.to_dict() for vacancy in vacancies])
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def position(self, vacancy_id: Any) -> Optional[int]:
+        """Номер строки вакансии по 'id'."""
+        if self._position is None:
+            self._position = {record_id: row for row, record_id in enumerate(self.ids)}
+        return self._position.get(vacancy_id)
+
+    def take(self, rows: Iterable[int]) -> List[Dict[str, Any]]:
+        """Записи по номерам строк."""
+        return [self.records[row] for row in rows]
+
+    def amount(self, field: str = "from") -> "np.ndarray":
+        """Сумма для сравнения: "from", "to" или "mid" (середина вилки либо единственная граница)."""
+        if field == "from":
+            return self.salary_from
+        if field == "to":
+            return self.salary_to
+        if field == "mid":
+            mid = (self.salary_from + self.salary_to) / 2
+            mid = np.where(np.isnan(self.salary_from), self.salary_to, mid)
+            return np.where(np.isnan(self.salary_to), self.salary_from, mid)
+        raise ValueError("Параметр 'field' должен быть 'from', 'to' или 'mid'")
+
+    def filter_range(
+        self,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        factors: Optional["np.ndarray"] = None,
+    ) -> "np.ndarray":
+        """Номера строк, проходящих фильтры min_salary/max_salary так же, как в match_criteria.
+
+        factors - множители строк (например, CurrencyConverter.row_factors) для сравнения в одной валюте.
+        """
+        salary_from, salary_to = self.salary_from, self.salary_to
+        if factors is not None:
+            salary_from, salary_to = salary_from * factors, salary_to * factors
+        mask = np.ones(len(self), dtype=bool)
+        if min_salary is not None:
+            mask &= (salary_from >= min_salary) | (self.from_missing & (0 >= min_salary))
+        if max_salary is not None:
+            mask &= (salary_to <= max_salary) | (self.to_missing & (np.inf <= max_salary))
+        return np.flatnonzero(mask)
+
+    def top_k(self, k: int, field: str = "from", amounts: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Номера k строк с наибольшей суммой, по убыванию.
+
+        Вакансии без суммы считаются с нулем, при равных суммах сохраняется исходный порядок -
+        результат совпадает с ranking.top_n(records, k, salary_key(field)).
+        amounts - готовый массив сумм (например, пересчитанных в одну валюту) вместо field.
+        """
+        key = np.nan_to_num(self.amount(field) if amounts is None else amounts, nan=0.0)
+        size = len(key)
+        if k <= 0 or size == 0:
+            return np.empty(0, dtype=np.intp)
+        if k >= size:
+            return np.argsort(-key, kind="stable")
+
+        threshold = np.partition(key, size - k)[size - k]
+        above = np.flatnonzero(key > threshold)
+        ties = np.flatnonzero(key == threshold)[: k - len(above)]
+        rows = np.concatenate([above, ties])
+        return rows[np.argsort(-key[rows], kind="stable")]
+
+    def stats(
+        self,
+        field: str = "from",
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        bins: int = 10,
+        amounts: Optional["np.ndarray"] = None,
+    ) -> Dict[Optional[str], Dict[str, Any]]:
+        """Статистика summary по каждой валюте; ключ None - вакансии без валюты."""
+        values = self.amount(field) if amounts is None else amounts
+        known = ~np.isnan(values)
+        return {
+            self.currencies[code] if code >= 0 else None: self.summary(
+                values[known & (self.currency == code)], percentiles, bins
+            )
+            for code in np.unique(self.currency[known])
+        }
+
+    @staticmethod
+    def summary(
+        values: "np.ndarray", percentiles: Sequence[float] = DEFAULT_PERCENTILES, bins: int = 10
+    ) -> Dict[str, Any]:
+        """Количество, среднее, медиана, перцентили и гистограмма по суммам (NaN не учитываются).
+
+        Для сводки по всем валютам сразу передаются суммы в одной валюте:
+        summary(CurrencyConverter.column_amounts(columns)).
+        """
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return {"count": 0}
+        counts, edges = np.histogram(values, bins=bins)
+        return {
+            "count": int(values.size),
+            "mean": float(values.mean()),
+            "median": float(np.median(values)),
+            "percentiles": dict(zip(percentiles, np.percentile(values, percentiles).tolist())),
+            "histogram": {"counts": counts.tolist(), "edges": edges.tolist()},
+        }
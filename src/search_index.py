@@ -0,0 +1,144 @@
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.Filtered_vacancy import VacancyStorage
+
+HIGHLIGHT_PATTERN = re.compile(r"</?highlighttext>")
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def vacancy_title(vacancy: Dict[str, Any]) -> str:
+    """Название вакансии в формате хранилища ('title') или ответа API ('name')."""
+    return vacancy.get("title") or vacancy.get("name") or ""
+
+
+def vacancy_description(vacancy: Dict[str, Any]) -> str:
+    """Требования вакансии в формате хранилища ('description') или ответа API ('snippet')."""
+    if "description" in vacancy:
+        return vacancy["description"] or ""
+    return (vacancy.get("snippet") or {}).get("requirement") or ""
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбиение текста на слова: без тегов подсветки, без учета регистра, 'ё' как 'е'."""
+    text = HIGHLIGHT_PATTERN.sub(" ", text).casefold().replace("ё", "е")
+    return TOKEN_PATTERN.findall(text)
+
+
+class VacancySearchIndex:
+    """Инвертированный индекс по словам названий и требований вакансий.
+
+    Запрос - слова через пробел; слово с '*' на конце ищется по префиксу.
+    В режиме "and" вакансия должна содержать все слова, в режиме "or" - хотя бы одно.
+    Результаты возвращаются в порядке добавления вакансий в индекс.
+    """
+
+    def __init__(self, vacancies: Iterable[Dict[str, Any]] = ()) -> None:
+        self.clear()
+        self.add_many(vacancies)
+
+    def clear(self) -> None:
+        """Удаление всех вакансий из индекса."""
+        self._docs: Dict[int, Dict[str, Any]] = {}
+        self._doc_tokens: Dict[int, Set[str]] = {}
+        self._doc_by_id: Dict[Any, int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._terms: Optional[List[str]] = None
+        self._next_doc = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """Добавление вакансии; вакансия с тем же 'id' заменяется."""
+        vacancy_id = vacancy.get("id")
+        if vacancy_id is not None:
+            self.remove(vacancy_id)
+        doc = self._next_doc
+        self._next_doc += 1
+        tokens = set(tokenize(vacancy_title(vacancy)))
+        tokens.update(tokenize(vacancy_description(vacancy)))
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = {doc}
+                self._terms = None
+            else:
+                posting.add(doc)
+        self._docs[doc] = vacancy
+        self._doc_tokens[doc] = tokens
+        if vacancy_id is not None:
+            self._doc_by_id[vacancy_id] = doc
+
+    def add_many(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def remove(self, vacancy_id: Any) -> None:
+        """Удаление вакансии по 'id'."""
+        doc = self._doc_by_id.pop(vacancy_id, None)
+        if doc is None:
+            return
+        del self._docs[doc]
+        for token in self._doc_tokens.pop(doc):
+            posting = self._postings[token]
+            posting.discard(doc)
+            if not posting:
+                del self._postings[token]
+                self._terms = None
+
+    def _prefix_docs(self, prefix: str) -> Set[int]:
+        if self._terms is None:
+            self._terms = sorted(self._postings)
+        docs: Set[int] = set()
+        position = bisect_left(self._terms, prefix)
+        while position < len(self._terms) and self._terms[position].startswith(prefix):
+            docs |= self._postings[self._terms[position]]
+            position += 1
+        return docs
+
+    def search(self, query: str, mode: str = "and") -> List[Dict[str, Any]]:
+        """Поиск вакансий по словам запроса."""
+        if mode not in ("and", "or"):
+            raise ValueError("Параметр 'mode' должен быть 'and' или 'or'")
+        postings = []
+        for word in query.split():
+            is_prefix = word.endswith("*")
+            tokens = tokenize(word)
+            for i, token in enumerate(tokens):
+                if is_prefix and i == len(tokens) - 1:
+                    postings.append(self._prefix_docs(token))
+                else:
+                    postings.append(self._postings.get(token, set()))
+        if not postings:
+            return []
+
+        if mode == "and":
+            postings.sort(key=len)
+            docs = set(postings[0])
+            for posting in postings[1:]:
+                docs &= posting
+                if not docs:
+                    break
+        else:
+            docs = set().union(*postings)
+        return [self._docs[doc] for doc in sorted(docs)]
+
+    def on_storage_change(self, event: str, records: List[Dict[str, Any]]) -> None:
+        """Обновление индекса по событию хранилища ("add", "delete" или "reload")."""
+        if event == "reload":
+            self.clear()
+            self.add_many(records)
+        elif event == "add":
+            self.add_many(records)
+        elif event == "delete":
+            for record in records:
+                self.remove(record.get("id"))
+
+    @classmethod
+    def attach(cls, storage: VacancyStorage) -> "VacancySearchIndex":
+        """Построение индекса по хранилищу с последующим обновлением при его изменениях."""
+        index = cls(storage.get_vacancies())
+        storage.add_listener(index.on_storage_change)
+        return index
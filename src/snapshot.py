@@ -0,0 +1,414 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Union
+
+from src.currency import CurrencyConverter, default_converter, rates_path
+from src.Filtered_vacancy import VacancyStorage, match_criteria
+
+if TYPE_CHECKING:
+    from src.salary_columns import SalaryColumns
+
+# Формат снимка (все числа little-endian, разделы выровнены по 8 байт, чтобы столбцы
+# можно было читать как массивы прямо из отображенного файла):
+#   заголовок: MAGIC, версия, число записей и таблица разделов (смещение, размер);
+#   столбцы фиксированной ширины по одному значению на запись (SECTIONS до "offsets");
+#   offsets - uint64, для записи i строка j лежит в heap[offsets[i*F + j]:offsets[i*F + j + 1]];
+#   currencies - JSON-список кодов валют (индексы - значения столбца currency);
+#   heap - строки UTF-8 подряд.
+MAGIC = b"HHVSNAP1"
+VERSION = 1
+
+# Строковые поля записи; "extra" - JSON с остальными ключами записи и значениями, не попавшими в столбцы
+STRING_FIELDS = ("id", "title", "link", "description", "extra")
+RECORD_KEYS = ("id", "title", "link", "salary", "description")
+SALARY_KEYS = ("from", "to", "currency", "gross")
+
+# Столбцы: имя -> (код типа array, код типа NumPy)
+COLUMNS = {
+    "salary_from": ("d", "<f8"),
+    "salary_to": ("d", "<f8"),
+    "currency": ("h", "<i2"),
+    "gross": ("B", "?"),
+    "from_missing": ("B", "?"),
+    "to_missing": ("B", "?"),
+    # Биты строковых полей со значением None
+    "nulls": ("B", "u1"),
+    "kind": ("B", "u1"),
+}
+SECTIONS = tuple(COLUMNS) + ("offsets", "currencies", "heap")
+HEADER = struct.Struct("<8sIIQ" + "QQ" * len(SECTIONS))
+
+# Вид записи (столбец kind): как восстановить зарплату и всю запись
+KIND_NO_SALARY = 0  # 'salary' - None
+KIND_SALARY = 1  # 'salary' - словарь {"from", "to", "currency", "gross"}, восстанавливается из столбцов
+KIND_EXTRA_SALARY = 2  # 'salary' хранится в extra
+KIND_RAW = 3  # запись с другим набором ключей целиком хранится в extra
+
+# Коды типов столбцов для memoryview.cast
+ColumnFormat = Literal["B", "h", "Q", "d"]
+
+# Наибольшее целое, точно представимое в float64
+MAX_EXACT_INT = 2**53
+
+
+def _is_amount(value: Any) -> bool:
+    return value is None or (type(value) is int and abs(value) <= MAX_EXACT_INT)
+
+
+def _salary_kind(salary: Any) -> int:
+    if salary is None:
+        return KIND_NO_SALARY
+    if (
+        isinstance(salary, dict)
+        and tuple(salary) == SALARY_KEYS
+        and _is_amount(salary["from"])
+        and _is_amount(salary["to"])
+        and (salary["currency"] is None or isinstance(salary["currency"], str))
+        and isinstance(salary["gross"], bool)
+    ):
+        return KIND_SALARY
+    return KIND_EXTRA_SALARY
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def write_snapshot(path: str, source: Union[VacancyStorage, Iterable[Dict[str, Any]]]) -> int:
+    """Запись снимка вакансий из любого хранилища VacancyStorage или из записей в формате хранилища.
+
+    Файл пишется атомарно (временный файл + переименование). Возвращает количество записей.
+    """
+    records = source.get_vacancies() if isinstance(source, VacancyStorage) else source
+    if not isinstance(records, Sequence):
+        records = list(records)
+    count = len(records)
+    fields = len(STRING_FIELDS)
+
+    sizes = {name: count * array(typecode).itemsize for name, (typecode, _) in COLUMNS.items()}
+    sizes["offsets"] = (count * fields + 1) * 8
+    heap_start = HEADER.size
+    for name in COLUMNS:
+        heap_start = _align(heap_start) + sizes[name]
+    heap_start = _align(_align(heap_start) + sizes["offsets"])
+
+    columns: Dict[str, "array[Any]"] = {name: array(typecode) for name, (typecode, _) in COLUMNS.items()}
+    offsets = array("Q", [0])
+    currencies: List[str] = []
+    codes: Dict[str, int] = {}
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.seek(heap_start)
+            chunk: List[bytes] = []
+            chunk_size = 0
+            heap_size = 0
+            for record in records:
+                salary = record.get("salary")
+                kind = _salary_kind(salary)
+                if tuple(record)[: len(RECORD_KEYS)] != RECORD_KEYS:
+                    kind = KIND_RAW
+                # Столбцы зарплат заполняются так же, как в SalaryColumns
+                if not isinstance(salary, dict):
+                    salary = {}
+                amount_from = salary.get("from")
+                amount_to = salary.get("to")
+                columns["salary_from"].append(float(amount_from) if amount_from is not None else float("nan"))
+                columns["salary_to"].append(float(amount_to) if amount_to is not None else float("nan"))
+                columns["from_missing"].append("from" not in salary)
+                columns["to_missing"].append("to" not in salary)
+                columns["gross"].append(bool(salary.get("gross")))
+                currency = salary.get("currency")
+                if currency is None:
+                    columns["currency"].append(-1)
+                else:
+                    code = codes.get(currency)
+                    if code is None:
+                        code = codes[currency] = len(currencies)
+                        currencies.append(currency)
+                    columns["currency"].append(code)
+                columns["kind"].append(kind)
+
+                strings = [record.get(field) for field in STRING_FIELDS[:-1]]
+                if kind == KIND_RAW:
+                    extra = dict(record)
+                else:
+                    extra = {key: value for key, value in record.items() if key not in RECORD_KEYS}
+                    if kind == KIND_EXTRA_SALARY:
+                        extra["salary"] = record["salary"]
+                for position, value in enumerate(strings):
+                    if value is not None and not isinstance(value, str):
+                        # Например, числовой 'id': значение восстанавливается из extra
+                        extra[STRING_FIELDS[position]] = value
+                        strings[position] = None
+                strings.append(json.dumps(extra, ensure_ascii=False) if extra else None)
+
+                nulls = 0
+                for position, value in enumerate(strings):
+                    if value is None:
+                        nulls |= 1 << position
+                    else:
+                        data = value.encode("utf-8")
+                        chunk.append(data)
+                        chunk_size += len(data)
+                        heap_size += len(data)
+                    offsets.append(heap_size)
+                columns["nulls"].append(nulls)
+                if chunk_size >= 1 << 20:
+                    file.write(b"".join(chunk))
+                    chunk = []
+                    chunk_size = 0
+            file.write(b"".join(chunk))
+
+            currencies_data = json.dumps(currencies).encode("utf-8")
+            currencies_start = _align(heap_start + heap_size)
+            file.write(b"\0" * (currencies_start - heap_start - heap_size))
+            file.write(currencies_data)
+
+            table: List[int] = []
+            file.seek(HEADER.size)
+            position = HEADER.size
+            for name, values in list(columns.items()) + [("offsets", offsets)]:
+                start = _align(position)
+                file.write(b"\0" * (start - position))
+                if sys.byteorder != "little":
+                    values.byteswap()
+                values.tofile(file)
+                table.extend((start, sizes[name]))
+                position = start + sizes[name]
+            table.extend((currencies_start, len(currencies_data), heap_start, heap_size))
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, VERSION, fields, count, *table))
+            # Данные должны оказаться на диске раньше, чем переименование заменит прежний снимок
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+
+class VacancySnapshot(Sequence):
+    """Снимок вакансий, открытый через mmap: записи и столбцы читаются лениво, без копирования.
+
+    Открытие читает только заголовок; запись собирается из строк в файле при обращении
+    snapshot[i], а salary_columns() возвращает массивы NumPy прямо поверх отображенного файла.
+    Снимок доступен только для чтения; закрывается через close() или with.
+    """
+
+    def __init__(self, path: str, converter: Optional[CurrencyConverter] = None) -> None:
+        self.path = path
+        # Курсы для критериев min_salary/max_salary, как в хранилищах (по умолчанию - из каталога снимка)
+        if converter is None:
+            converter = default_converter(rates_path(os.path.dirname(os.path.abspath(path))))
+        self.converter = converter
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"Файл {path} не является снимком вакансий")
+        magic, version, fields, count, *table = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or fields != len(STRING_FIELDS):
+            self._mmap.close()
+            raise ValueError(f"Файл {path} не является снимком вакансий версии {VERSION}")
+        self._count = int(count)
+        # Раздел: (начало, конец) в файле
+        self._sections = {name: (table[2 * i], table[2 * i] + table[2 * i + 1]) for i, name in enumerate(SECTIONS)}
+        self._view = memoryview(self._mmap)
+        self._heap_start = self._sections["heap"][0]
+        self._offsets = self._column("offsets", "Q")
+        self._nulls = self._column("nulls", "B")
+        self._kind = self._column("kind", "B")
+        self._salary_from = self._column("salary_from", "d")
+        self._salary_to = self._column("salary_to", "d")
+        self._currency = self._column("currency", "h")
+        self._gross = self._column("gross", "B")
+        self._currencies: Optional[List[str]] = None
+        self._positions: Optional[Dict[Any, int]] = None
+        self._salary_columns: Optional["SalaryColumns"] = None
+
+    def _column(self, name: str, typecode: ColumnFormat) -> "memoryview[Any]":
+        start, end = self._sections[name]
+        if sys.byteorder != "little":
+            # Столбцы записаны little-endian: на big-endian платформах читается переставленная копия
+            values = array(typecode, self._view[start:end].tobytes())
+            values.byteswap()
+            return memoryview(values)
+        return self._view[start:end].cast(typecode)
+
+    def close(self) -> None:
+        for view in (
+            self._offsets,
+            self._nulls,
+            self._kind,
+            self._salary_from,
+            self._salary_to,
+            self._currency,
+            self._gross,
+            self._view,
+        ):
+            view.release()
+        self._salary_columns = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # На файл еще ссылаются массивы NumPy: отображение закроется вместе с ними
+            pass
+
+    def __enter__(self) -> "VacancySnapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def currencies(self) -> List[str]:
+        if self._currencies is None:
+            start, end = self._sections["currencies"]
+            self._currencies = json.loads(self._mmap[start:end])
+        return self._currencies
+
+    def string(self, row: int, field: str) -> Optional[str]:
+        """Одно строковое поле записи без сборки всей записи."""
+        position = STRING_FIELDS.index(field)
+        if self._nulls[row] >> position & 1:
+            return None
+        index = row * len(STRING_FIELDS) + position
+        start = self._heap_start + self._offsets[index]
+        end = self._heap_start + self._offsets[index + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def __getitem__(self, row):  # type: ignore[override]
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(self._count))]
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("Номер записи снимка вне диапазона")
+
+        fields = len(STRING_FIELDS)
+        first = row * fields
+        last = first + fields + 1
+        bounds = [self._heap_start + offset for offset in self._offsets[first:last].tolist()]
+        nulls = self._nulls[row]
+        values = [
+            None if nulls >> i & 1 else self._mmap[start:end].decode("utf-8")
+            for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+        ]
+        extra = json.loads(values[4]) if values[4] is not None else {}
+        kind = self._kind[row]
+        if kind == KIND_RAW:
+            return extra
+
+        record: Dict[str, Any] = {
+            "id": values[0],
+            "title": values[1],
+            "link": values[2],
+            "salary": None,
+            "description": values[3],
+        }
+        if kind == KIND_SALARY:
+            record["salary"] = self._salary(row)
+        record.update(extra)
+        return record
+
+    def _salary(self, row: int) -> Dict[str, Any]:
+        amount_from = self._salary_from[row]
+        amount_to = self._salary_to[row]
+        currency = self._currency[row]
+        return {
+            "from": None if amount_from != amount_from else int(amount_from),
+            "to": None if amount_to != amount_to else int(amount_to),
+            "currency": self.currencies[currency] if currency >= 0 else None,
+            "gross": bool(self._gross[row]),
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(self._count):
+            yield self[row]
+
+    @property
+    def ids(self) -> "_FieldView":
+        """Ленивая последовательность 'id' записей."""
+        return _FieldView(self, "id")
+
+    def get_vacancy(self, vacancy_id: Any) -> Optional[Dict[str, Any]]:
+        """Вакансия по 'id'; словарь 'id' -> номер строится при первом вызове."""
+        if self._positions is None:
+            self._positions = {record_id: row for row, record_id in enumerate(self.ids)}
+        row = self._positions.get(vacancy_id)
+        return self[row] if row is not None else None
+
+    def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """Вакансии по критериям title, min_salary, max_salary (как в хранилищах).
+
+        Собираются только подходящие записи: название сравнивается без сборки записи,
+        зарплата проверяется по столбцам, если установлен NumPy.
+        """
+        rows: Iterable[int] = range(self._count)
+        if "min_salary" in criteria or "max_salary" in criteria:
+            columns = self.salary_columns()
+            if columns is not None:
+                factors = self.converter.row_factors(columns) if self.converter is not None else None
+                rows = columns.filter_range(criteria.get("min_salary"), criteria.get("max_salary"), factors).tolist()
+        if "title" in criteria:
+            title = criteria["title"]
+            rows = [row for row in rows if self.string(row, "title") == title]
+        records = [self[row] for row in rows]
+        return [record for record in records if match_criteria(record, criteria, self.converter)]
+
+    def salary_columns(self) -> Optional["SalaryColumns"]:
+        """Столбцы зарплат поверх файла (без копирования) или None, если NumPy не установлен."""
+        from src.salary_columns import SalaryColumns, numpy_available
+
+        if not numpy_available():
+            return None
+        if self._salary_columns is None:
+            import numpy as np
+
+            arrays = {}
+            for name, (_, dtype) in COLUMNS.items():
+                start, _ = self._sections[name]
+                arrays[name] = np.frombuffer(self._mmap, dtype=dtype, count=self._count, offset=start)
+            self._salary_columns = SalaryColumns.from_arrays(
+                self,
+                salary_from=arrays["salary_from"],
+                salary_to=arrays["salary_to"],
+                currency=arrays["currency"],
+                currencies=self.currencies,
+                gross=arrays["gross"],
+                from_missing=arrays["from_missing"],
+                to_missing=arrays["to_missing"],
+                ids=self.ids,
+            )
+        return self._salary_columns
+
+
+class _FieldView(Sequence):
+    """Одно строковое поле всех записей снимка как последовательность."""
+
+    def __init__(self, snapshot: VacancySnapshot, field: str) -> None:
+        self._snapshot = snapshot
+        self._field = field
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __getitem__(self, row):  # type: ignore[override]
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Номер записи снимка вне диапазона")
+        return self._snapshot.string(row, self._field)
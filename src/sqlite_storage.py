@@ -0,0 +1,420 @@
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src import codec
+from src.currency import CurrencyConverter
+from src.Filtered_vacancy import VacancyStorage, content_hash, record_filter, vacancy_to_dict
+from src.Vacancy import area_from_api
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    link TEXT,
+    salary_from REAL,
+    salary_to REAL,
+    salary TEXT,
+    description TEXT,
+    area TEXT,
+    salary_from_base REAL,
+    salary_to_base REAL,
+    hash TEXT
+);
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Индексы создаются после _migrate: в старых таблицах столбцов salary_*_base еще нет
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_vacancies_title ON vacancies (title);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from_base ON vacancies (salary_from_base);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to_base ON vacancies (salary_to_base);
+"""
+
+
+def _base_amounts(salary: Any, converter: Optional[CurrencyConverter]) -> Tuple[Any, Any]:
+    """Границы зарплаты в базовой валюте (без converter - как есть)."""
+    if not isinstance(salary, dict):
+        return None, None
+    amount_from, amount_to = salary.get("from"), salary.get("to")
+    if converter is None:
+        return amount_from, amount_to
+    currency = salary.get("currency")
+    return converter.to_base(amount_from, currency), converter.to_base(amount_to, currency)
+
+
+def _to_row(record: Dict[str, Any], converter: Optional[CurrencyConverter]) -> Tuple[Any, ...]:
+    salary = record.get("salary")
+    salary_dict = salary if isinstance(salary, dict) else {}
+    area = record.get("area")
+    return (
+        record.get("id"),
+        record.get("title"),
+        record.get("link"),
+        salary_dict.get("from"),
+        salary_dict.get("to"),
+        codec.dumps(salary),
+        record.get("description"),
+        codec.dumps(area) if area is not None else None,
+        *_base_amounts(salary, converter),
+        content_hash(record),
+    )
+
+
+# Столбцы строки _to_row. Список указывается в INSERT явно: в таблицах, обновленных _migrate,
+# добавленные столбцы стоят в другом порядке
+ROW_COLUMNS = (
+    "id",
+    "title",
+    "link",
+    "salary_from",
+    "salary_to",
+    "salary",
+    "description",
+    "area",
+    "salary_from_base",
+    "salary_to_base",
+    "hash",
+)
+ROW_VALUES = f"INTO vacancies ({', '.join(ROW_COLUMNS)}) VALUES ({', '.join('?' * len(ROW_COLUMNS))})"
+INSERT_OR_REPLACE = f"INSERT OR REPLACE {ROW_VALUES}"
+# Столбцы, обновляемые при изменении содержимого вакансии (id и rowid остаются прежними)
+UPSERT = f"INSERT {ROW_VALUES} ON CONFLICT(id) DO UPDATE SET " + ", ".join(
+    f"{column} = excluded.{column}" for column in ROW_COLUMNS[1:]
+)
+# Столбцы, из которых _from_row собирает запись
+RECORD_COLUMNS = "id, title, link, salary, description, area"
+
+# Предел числа параметров в одном запросе SQLite (SQLITE_MAX_VARIABLE_NUMBER в старых версиях)
+MAX_VARIABLES = 999
+
+
+def _from_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    vacancy_id, title, link, salary, description, area = row
+    record = {
+        "id": vacancy_id,
+        "title": title,
+        "link": link,
+        "salary": codec.loads(salary),
+        "description": description,
+    }
+    if area is not None:
+        record["area"] = codec.loads(area)
+    return record
+
+
+def _where(criteria: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Условие WHERE по критериям title, min_salary, max_salary (в базовой валюте) и его параметры."""
+    # Индекс используется только для одного, самого избирательного условия: точное название,
+    # затем нижняя граница зарплаты. Унарный "+" запрещает SQLite использовать индекс для
+    # остальных условий - без статистики планировщик часто выбирает менее избирательный.
+    conditions = []
+    params: List[Any] = []
+    indexed = False
+    if "title" in criteria:
+        conditions.append("title = ?")
+        params.append(criteria["title"])
+        indexed = True
+    if "min_salary" in criteria:
+        conditions.append("+salary_from_base >= ?" if indexed else "salary_from_base >= ?")
+        params.append(criteria["min_salary"])
+        indexed = True
+    if "max_salary" in criteria:
+        conditions.append("+salary_to_base <= ?" if indexed else "salary_to_base <= ?")
+        params.append(criteria["max_salary"])
+    if not conditions:
+        return "", params
+    return " WHERE " + " AND ".join(conditions), params
+
+
+class SQLiteVacancyStorage(VacancyStorage):
+    """Хранилище вакансий в SQLite с индексами по id, названию и границам зарплаты.
+
+    Критерии title/min_salary/max_salary выполняются запросом по индексам, без чтения
+    всех записей; запись идет в режиме WAL пачками в одной транзакции. Для каждой записи
+    хранится хеш содержимого (столбец hash), по которому upsert_vacancies пропускает
+    неизмененные вакансии.
+
+    Границы зарплаты для критериев min_salary/max_salary хранятся пересчитанными в базовую
+    валюту (столбцы salary_from_base/salary_to_base) по курсам на момент открытия хранилища;
+    если курсы изменились с прошлого открытия, столбцы пересчитываются.
+    """
+
+    def __init__(self, filename: str, batch_size: int = 10000, converter: Optional[CurrencyConverter] = None):
+        super().__init__(converter)
+        self.filename = os.path.join("../data", filename)
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(self.filename)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self._migrate()
+        self.connection.executescript(INDEXES)
+        # Курсы фиксируются при открытии, чтобы все строки были пересчитаны по одной таблице
+        self._base_converter = self.converter
+        self._update_base_amounts()
+        self._data_version = self._read_data_version()
+
+    def _migrate(self) -> None:
+        """Добавление столбцов hash, area и salary_*_base в таблицу, созданную прежней версией схемы."""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(vacancies)")}
+        added = {"hash": "TEXT", "area": "TEXT", "salary_from_base": "REAL", "salary_to_base": "REAL"}
+        with self.connection:
+            for column, column_type in added.items():
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE vacancies ADD COLUMN {column} {column_type}")
+            # Индексы по исходным суммам больше не используются в запросах
+            self.connection.execute("DROP INDEX IF EXISTS idx_vacancies_salary_from")
+            self.connection.execute("DROP INDEX IF EXISTS idx_vacancies_salary_to")
+
+    def _update_base_amounts(self) -> None:
+        """Пересчет столбцов salary_*_base, если курсы отличаются от тех, по которым они записаны."""
+        converter = self._base_converter
+        rates = codec.dumps(sorted(converter.multipliers.items()) if converter is not None else None)
+        row = self.connection.execute("SELECT value FROM settings WHERE key = 'rates'").fetchone()
+        if row is not None and row[0] == rates:
+            return
+        rows = [
+            (*_base_amounts(codec.loads(salary), converter), rowid)
+            for rowid, salary in self.connection.execute("SELECT rowid, salary FROM vacancies")
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE vacancies SET salary_from_base = ?, salary_to_base = ? WHERE rowid = ?", rows
+            )
+            self.connection.execute("INSERT OR REPLACE INTO settings VALUES ('rates', ?)", (rates,))
+
+    def _read_data_version(self) -> int:
+        # Номер меняется при фиксации транзакций другими соединениями, но не этим
+        return int(self.connection.execute("PRAGMA data_version").fetchone()[0])
+
+    def refresh(self) -> None:
+        """Событие "reload" для подписчиков, если базу изменило другое соединение (PRAGMA data_version)."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            if self._listeners:
+                self._notify("reload", self.get_vacancies())
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_vacancy(self, vacancy: Any) -> None:
+        """Добавление вакансии (запись с тем же 'id' заменяется)."""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Any]) -> None:
+        """Добавление вакансий пачками по batch_size в одной транзакции."""
+        self.add_records(vacancy_to_dict(vacancy) for vacancy in vacancies)
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Добавление уже подготовленных словарей в формате хранилища."""
+        rows: List[Tuple[Any, ...]] = []
+        # Записи для подписчиков собираются, только если они есть
+        added: Optional[List[Dict[str, Any]]] = [] if self._listeners else None
+        with self.connection:
+            for record in records:
+                if added is not None:
+                    added.append(record)
+                rows.append(_to_row(record, self._base_converter))
+                if len(rows) >= self.batch_size:
+                    self._insert(rows)
+                    rows = []
+            if rows:
+                self._insert(rows)
+        if added:
+            self._notify("add", added)
+
+    def _insert(self, rows: List[Tuple[Any, ...]]) -> None:
+        self.connection.executemany(INSERT_OR_REPLACE, rows)
+
+    def upsert_vacancies(self, vacancies: Iterable[Any]) -> Dict[str, int]:
+        """Добавление новых и обновление измененных вакансий пачками по batch_size.
+
+        Хеши сохраненных записей выбираются одним запросом на пачку; неизмененные вакансии
+        не записываются, измененные обновляются на месте (порядок вставки сохраняется).
+        """
+        result = {"added": 0, "updated": 0, "unchanged": 0}
+        changed: List[Dict[str, Any]] = []
+        batch: List[Dict[str, Any]] = []
+        with self.connection:
+            for vacancy in vacancies:
+                batch.append(vacancy_to_dict(vacancy))
+                if len(batch) >= self.batch_size:
+                    changed.extend(self._upsert_batch(batch, result))
+                    batch = []
+            if batch:
+                changed.extend(self._upsert_batch(batch, result))
+        if changed:
+            self._notify("add", changed)
+        return result
+
+    def _upsert_batch(self, records: List[Dict[str, Any]], result: Dict[str, int]) -> List[Dict[str, Any]]:
+        hashes = self._stored_hashes(list({record["id"] for record in records}))
+        rows: Dict[Any, Tuple[Any, ...]] = {}
+        changed: Dict[Any, Dict[str, Any]] = {}
+        for record in records:
+            row = _to_row(record, self._base_converter)
+            vacancy_id, digest = row[0], row[-1]
+            previous = hashes.get(vacancy_id)
+            if previous == digest:
+                result["unchanged"] += 1
+                continue
+            result["added" if previous is None else "updated"] += 1
+            hashes[vacancy_id] = digest
+            rows[vacancy_id] = row
+            changed[vacancy_id] = record
+        if rows:
+            self.connection.executemany(UPSERT, list(rows.values()))
+        return list(changed.values()) if self._listeners else []
+
+    def _stored_hashes(self, ids: List[Any]) -> Dict[Any, str]:
+        """Хеши содержимого сохраненных вакансий с указанными 'id'.
+
+        Для записей без хеша (сохраненных до появления столбца hash) он вычисляется по самой записи.
+        """
+        hashes = {}
+        for start in range(0, len(ids), MAX_VARIABLES):
+            end = start + MAX_VARIABLES
+            chunk = ids[start:end]
+            query = f"SELECT hash, {RECORD_COLUMNS} FROM vacancies " f"WHERE id IN ({', '.join('?' * len(chunk))})"
+            for digest, *row in self.connection.execute(query, chunk):
+                hashes[row[0]] = digest or content_hash(_from_row(row))
+        return hashes
+
+    def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """Получение вакансий по критериям: title, min_salary, max_salary."""
+        where, params = _where(criteria)
+        query = f"SELECT rowid, {RECORD_COLUMNS} FROM vacancies" + where
+        # Сортировка по rowid в SQL отключила бы поиск по индексу, поэтому порядок вставки
+        # восстанавливается после выборки
+        rows = sorted(self.connection.execute(query, params))
+        return [_from_row(row[1:]) for row in rows]
+
+    def get_vacancy(self, vacancy_id: str) -> Optional[Dict[str, Any]]:
+        """Получение вакансии по 'id'."""
+        row = self.connection.execute(f"SELECT {RECORD_COLUMNS} FROM vacancies WHERE id = ?", (vacancy_id,)).fetchone()
+        return _from_row(row) if row else None
+
+    def delete_vacancy_by_title(self, title: str) -> None:
+        """Удаление вакансий по названию."""
+        self.delete_where(title=title)
+
+    def delete_many(self, ids: Optional[Iterable[Any]] = None, titles: Optional[Iterable[str]] = None) -> int:
+        """Удаление вакансий по спискам 'id' и названий в одной транзакции, запросами по индексам."""
+        deleted = 0
+        # Удаляемые записи читаются, только если есть подписчики
+        removed: Optional[List[Dict[str, Any]]] = [] if self._listeners else None
+        with self.connection:
+            for column, values in (("id", ids), ("title", titles)):
+                values = list(dict.fromkeys(values or ()))
+                for start in range(0, len(values), MAX_VARIABLES):
+                    end = start + MAX_VARIABLES
+                    chunk = values[start:end]
+                    where = f" WHERE {column} IN ({', '.join('?' * len(chunk))})"
+                    deleted += self._delete(where, chunk, removed)
+        if removed:
+            self._notify("delete", removed)
+        return deleted
+
+    def delete_where(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, **criteria: Any) -> int:
+        """Удаление подходящих вакансий в одной транзакции.
+
+        Критерии без predicate выполняются одним запросом DELETE; с predicate записи,
+        подходящие под критерии, проверяются в Python и удаляются по 'id'.
+        """
+        record_filter(predicate, criteria)
+        if predicate is not None:
+            return self.delete_many(
+                ids=[vacancy["id"] for vacancy in self.get_vacancies(**criteria) if predicate(vacancy)]
+            )
+
+        where, params = _where(criteria)
+        removed: Optional[List[Dict[str, Any]]] = [] if self._listeners else None
+        with self.connection:
+            deleted = self._delete(where, params, removed)
+        if removed:
+            self._notify("delete", removed)
+        return deleted
+
+    def _delete(self, where: str, params: List[Any], removed: Optional[List[Dict[str, Any]]]) -> int:
+        if removed is not None:
+            query = f"SELECT {RECORD_COLUMNS} FROM vacancies" + where
+            removed.extend(_from_row(row) for row in self.connection.execute(query, params))
+        return self.connection.execute("DELETE FROM vacancies" + where, params).rowcount
+
+    def count(self) -> int:
+        return int(self.connection.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0])
+
+
+def _read_json_records(path: str) -> Optional[List[Any]]:
+    """Записи из JSON-файла: формата хранилища или ответа api.hh.ru; None, если файл не прочитан.
+
+    Из массива, обрезанного на середине записи, читаются все полные записи.
+    """
+    try:
+        with open(path, "rb") as file:
+            text = file.read()
+    except OSError as e:
+        print(f"Файл {path} пропущен: {e}")
+        return None
+    try:
+        data = codec.loads(text)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        try:
+            data = codec.loads_array_prefix(text)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            data = []
+        if not data:
+            print(f"Файл {path} пропущен: {e}")
+            return None
+        print(f"Файл {path} поврежден ({e}), прочитано полных записей: {len(data)}")
+    if isinstance(data, dict):
+        data = data.get("items", [])
+    if not isinstance(data, list):
+        print(f"Файл {path} пропущен: нет списка вакансий")
+        return None
+    return data
+
+
+def _iter_records(data: List[Any]) -> Iterator[Dict[str, Any]]:
+    for record in data:
+        if not isinstance(record, dict) or "id" not in record:
+            continue
+        if "name" in record:
+            # Формат ответа api.hh.ru
+            converted = {
+                "id": record["id"],
+                "title": record["name"],
+                "link": record.get("alternate_url"),
+                "salary": record.get("salary"),
+                "description": (record.get("snippet") or {}).get("requirement"),
+            }
+            area = area_from_api(record.get("area"))
+            if area is not None:
+                converted["area"] = area
+            yield converted
+        else:
+            yield record
+
+
+def migrate_json_to_sqlite(paths: Iterable[str], storage: SQLiteVacancyStorage) -> Dict[str, int]:
+    """Перенос вакансий из JSON-файлов в SQLite.
+
+    Возвращает число перенесенных ("migrated") и пропущенных ("skipped") файлов
+    и количество вакансий в хранилище ("count").
+    """
+    report = {"migrated": 0, "skipped": 0, "count": 0}
+    for path in paths:
+        data = _read_json_records(path)
+        if data is None:
+            report["skipped"] += 1
+            continue
+        storage.add_records(_iter_records(data))
+        report["migrated"] += 1
+    report["count"] = storage.count()
+    return report
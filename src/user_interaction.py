@@ -1,9 +1,15 @@
-import json
 import os
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
-from src.API_HH import HHVacancyAPI
+from src import instrumentation, ranking
+from src.currency import default_salary_key
+from src.json_writer import write_json
+from src.ranking import SalaryKey
+
+if TYPE_CHECKING:
+    from src.API_HH import VacancyAPI
+    from src.search_index import VacancySearchIndex
 
 
 class UserInteraction:
@@ -32,52 +38,67 @@ class UserInteraction:
         return text
 
     @staticmethod
-    def display_top_vacancies(vacancies: List[Dict[str, Any]], top_n: int) -> List[Dict[str, Any]]:
-        """Вывод топ N вакансий по зарплате."""
-
-        def get_salary_from(vacancy: Dict[str, Any]) -> Any:
-            """Получение значения 'from' зарплаты или 0, если не указана."""
-            return vacancy["salary"]["from"] if vacancy["salary"] and vacancy["salary"].get("from") else 0
+    def print_vacancies(vacancies: Iterable[Dict[str, Any]]) -> None:
+        """Вывод вакансий в консоль."""
+        with instrumentation.span("ui.print_vacancies"):
+            for i, vacancy in enumerate(vacancies, 1):
+                salary = UserInteraction.format_salary(vacancy["salary"])
+                description = UserInteraction.remove_highlight_tags(vacancy["snippet"]["requirement"])
+                print(f"Вакансия {i}:")
+                print(f"  Название: {vacancy['name']}")
+                print(f"  Зарплата: {salary}")
+                print(f"  Ссылка: {vacancy['alternate_url']}")
+                print(f"  Описание: {description}")
+                print("-" * 40)
 
-        # Отсортировать вакансии по зарплате
-        sorted_vacancies = sorted(vacancies, key=get_salary_from, reverse=True)
-        top_vacancies = sorted_vacancies[:top_n]
+    @staticmethod
+    def select_top_vacancies(
+        vacancies: Iterable[Dict[str, Any]], top_n: int, key: Optional[SalaryKey] = None
+    ) -> List[Dict[str, Any]]:
+        """Выбор топ N вакансий по зарплате.
 
-        for i, vacancy in enumerate(top_vacancies, 1):
-            salary = UserInteraction.format_salary(vacancy["salary"])
-            description = UserInteraction.remove_highlight_tags(vacancy["snippet"]["requirement"])
-            print(f"Вакансия {i}:")
-            print(f"  Название: {vacancy['name']}")
-            print(f"  Зарплата: {salary}")
-            print(f"  Ссылка: {vacancy['alternate_url']}")
-            print(f"  Описание: {description}")
-            print("-" * 40)
+        По умолчанию - по нижней границе, пересчитанной в рубли по таблице курсов data/currency_rates.json.
+        """
+        with instrumentation.span("ui.select_top_vacancies"):
+            return ranking.top_n(vacancies, top_n, key or default_salary_key())
 
+    @staticmethod
+    def display_top_vacancies(vacancies: Iterable[Dict[str, Any]], top_n: int) -> List[Dict[str, Any]]:
+        """Вывод топ N вакансий по зарплате."""
+        top_vacancies = UserInteraction.select_top_vacancies(vacancies, top_n)
+        UserInteraction.print_vacancies(top_vacancies)
         return top_vacancies
 
     @staticmethod
-    def search_vacancies_by_description(vacancies: List[Dict[str, Any]], keyword: str) -> List[Dict[str, Any]]:
-        """Поиск вакансий по ключевому слову в описании."""
+    def search_vacancies_by_description(
+        vacancies: List[Dict[str, Any]], keyword: str, index: Optional["VacancySearchIndex"] = None
+    ) -> List[Dict[str, Any]]:
+        """Поиск вакансий по ключевому слову в описании.
+
+        Если передан индекс (VacancySearchIndex), поиск идет по нему - по словам названия и требований, -
+        а из vacancies выбираются вакансии, найденные в индексе (по 'id').
+        """
+        if index is not None:
+            found_ids = {vacancy.get("id") for vacancy in index.search(keyword)}
+            filtered_vacancies = [vacancy for vacancy in vacancies if vacancy.get("id") in found_ids]
+            UserInteraction.print_vacancies(filtered_vacancies)
+            return filtered_vacancies
         filtered_vacancies = [
             vacancy
             for vacancy in vacancies
             if vacancy["snippet"]["requirement"] and keyword.lower() in vacancy["snippet"]["requirement"].lower()
         ]
-        for i, vacancy in enumerate(filtered_vacancies, 1):
-            salary = UserInteraction.format_salary(vacancy["salary"])
-            description = UserInteraction.remove_highlight_tags(vacancy["snippet"]["requirement"])
-            print(f"Вакансия {i}:")
-            print(f"  Название: {vacancy['name']}")
-            print(f"  Зарплата: {salary}")
-            print(f"  Ссылка: {vacancy['alternate_url']}")
-            print(f"  Описание: {description}")
-            print("-" * 40)
-
+        UserInteraction.print_vacancies(filtered_vacancies)
         return filtered_vacancies
 
     @staticmethod
-    def save_to_json_result(data: Any, filename: str) -> None:
-        """Сохранение данных в JSON файл"""
+    def save_to_json_result(
+        data: Any, filename: str, indent: Optional[int] = 4, compression: Optional[str] = None
+    ) -> None:
+        """Сохранение данных в JSON файл
+
+        Запись потоковая и атомарная (json_writer.write_json): значения data могут быть итераторами.
+        """
         directory = "data"
 
         # Создаем директорию 'data', если ее нет
@@ -86,19 +107,30 @@ class UserInteraction:
 
         filepath = os.path.join(directory, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        write_json(filepath, data, indent=indent, ensure_ascii=False, compression=compression)
 
     @classmethod
-    def user_interaction(cls) -> None:
+    def user_interaction(cls, hh_api: Optional["VacancyAPI"] = None) -> None:
         """Функция для взаимодействия с пользователем через консоль."""
-        hh_api = HHVacancyAPI()
+        if hh_api is None:
+            # Клиент API и requests импортируются только при запуске диалога, а не при импорте модуля
+            from src.API_HH import HHVacancyAPI
+            from src.request_scheduler import default_scheduler
+            from src.response_cache import HTTPResponseCache
+
+            # Повторный запуск с тем же запросом отдается из кэша без обращения к сети
+            hh_api = HHVacancyAPI(
+                cache=HTTPResponseCache(os.path.join("data", "cache")), scheduler=default_scheduler()
+            )
 
         # Получение поискового запроса от пользователя
         keyword = input("Введите поисковый запрос для поиска вакансий: ")
 
         # Получение вакансий по запросу
         vacancies = hh_api.get_vacancies(keyword)
+        failed_pages = getattr(hh_api, "failed_pages", [])
+        if failed_pages:
+            print(f"Не удалось загрузить страницы {failed_pages}, результаты неполные.")
 
         if not vacancies:
             print("Вакансии не найдены.")
@@ -112,7 +144,8 @@ class UserInteraction:
             return
 
         # Показать топ N вакансий по зарплате
-        top_vacancies = cls.display_top_vacancies(vacancies, top_n)
+        top_vacancies = cls.select_top_vacancies(vacancies, top_n)
+        cls.print_vacancies(top_vacancies)
 
         # Поиск вакансий с ключевым словом в описании среди топ N вакансий
         description_keyword = input("Введите ключевое слово для поиска в описании вакансий: ")
@@ -0,0 +1,40 @@
+import os
+import shutil
+
+import pytest
+
+from src.Vacancy import Vacancy
+
+
+@pytest.fixture
+def make_vacancy():
+    """Фабрика вакансий (Vacancy) для тестов хранилищ."""
+
+    def make(vacancy_id, title="Python Developer", salary=None):
+        return Vacancy(
+            id=vacancy_id,
+            title=title,
+            link=f"https://hh.ru/vacancy/{vacancy_id}",
+            salary=salary,
+            description="Описание вакансии",
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_record():
+    """Фабрика записей хранилища (словарей) для тестов поиска и колонок зарплат."""
+
+    def make(vacancy_id, title="Python Developer", salary=None, description=""):
+        return {"id": vacancy_id, "title": title, "link": "", "salary": salary, "description": description}
+
+    return make
+
+
+@pytest.fixture
+def rates_file(tmpdir):
+    """Копия таблицы курсов data/currency_rates.json в tmpdir - каталоге данных хранилищ теста."""
+    path = str(tmpdir.join("currency_rates.json"))
+    shutil.copyfile(os.path.join(os.path.dirname(__file__), "..", "data", "currency_rates.json"), path)
+    return path
@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def make_item(index: int) -> Dict[str, Any]:
+    """Создание вакансии в формате ответа api.hh.ru."""
+    return {
+        "id": str(index),
+        "name": f"Python Developer {index}",
+        "alternate_url": f"https://hh.ru/vacancy/{index}",
+        "salary": {"from": 100000 + index, "to": None, "currency": "RUR", "gross": False},
+        "snippet": {"requirement": f"Опыт работы с <highlighttext>Python</highlighttext> {index}"},
+        "published_at": "2024-07-26T12:00:00+0300",
+        "area": {"id": "1", "name": "Москва"},
+    }
+
+
+class MockHHServer:
+    """Локальная замена api.hh.ru для тестов и бенчмарков."""
+
+    def __init__(self, found: int = 100, latency: float = 0.0, rate_limit: Optional[float] = None) -> None:
+        self.found = found
+        self.latency = latency
+        # Допустимое число запросов в секунду; сверх него сервер отвечает 429
+        self.rate_limit = rate_limit
+        self.throttled = 0
+        self._recent: List[float] = []
+        self.requests: List[Dict[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/vacancies"
+
+    def page_response(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Формирование страницы выдачи по параметрам запроса."""
+        page = int(params.get("page", 0))
+        per_page = int(params.get("per_page", 20))
+        start = page * per_page
+        end = min(start + per_page, self.found)
+        return {
+            "items": [make_item(i) for i in range(start, end)],
+            "found": self.found,
+            "pages": (self.found + per_page - 1) // per_page,
+            "page": page,
+            "per_page": per_page,
+        }
+
+    def _allow(self) -> bool:
+        """Проверка лимита запросов за последнюю секунду."""
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self._recent = [moment for moment in self._recent if now - moment < 1.0]
+        if len(self._recent) >= self.rate_limit:
+            self.throttled += 1
+            return False
+        self._recent.append(now)
+        return True
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Заголовки и тело уходят отдельными пакетами: без TCP_NODELAY ответ ждет задержанного ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                with server._lock:
+                    allowed = server._allow()
+                if not allowed:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                with server._lock:
+                    server.requests.append(params)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.in_flight -= 1
+                body = json.dumps(server.page_response(params)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "MockHHServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,6 +1,11 @@
+import asyncio
+
 import pytest
+import requests
 import requests_mock
-from src.API_HH import HHVacancyAPI
+
+from src.API_HH import AsyncHHVacancyAPI, HHVacancyAPI
+from tests.mock_hh_server import MockHHServer
 
 
 @pytest.fixture
@@ -42,9 +47,176 @@ def test_get_vacancies_success(hh_api):
     assert vacancies[1]["salary"]["from"] == 200000
 
 
+def test_network_error_without_scheduler_is_raised(hh_api):
+    with requests_mock.Mocker() as m:
+        m.get("https://api.hh.ru/vacancies", exc=requests.ConnectionError)
+        with pytest.raises(requests.ConnectionError):
+            hh_api.get_vacancies("Python")
+
+
 def test_get_vacancies_invalid_params(hh_api):
     hh_api.params["page"] = "invalid"
     keyword = "Python Developer"
 
     with pytest.raises(ValueError):
         hh_api.get_vacancies(keyword)
+
+
+def test_get_vacancies_concurrent_keeps_page_order():
+    api = HHVacancyAPI(max_workers=4)
+    url = "https://api.hh.ru/vacancies"
+
+    def page_callback(request, context):
+        page = int(request.qs["page"][0])
+        # Вакансия "1" повторяется на второй странице и должна быть отброшена
+        items = [{"id": str(page * 2)}, {"id": str(page * 2 + 1)}] + ([{"id": "1"}] if page == 1 else [])
+        return {"items": items, "pages": 3, "found": 6}
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=page_callback)
+        vacancies = api.get_vacancies("Python Developer")
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2", "3", "4", "5"]
+    assert m.call_count == 3
+
+
+def test_get_vacancies_concurrent_mock_server():
+    api = HHVacancyAPI(max_workers=3)
+    with MockHHServer(found=95) as server:
+        api.url = server.url
+        vacancies = api.get_vacancies("Python Developer")
+
+    assert [vacancy["id"] for vacancy in vacancies] == [str(i) for i in range(95)]
+    assert len(server.requests) == 5
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError):
+        HHVacancyAPI(max_workers=0)
+
+
+def test_async_get_vacancies_many():
+    api = AsyncHHVacancyAPI(max_connections=3)
+    keywords = ["Python", "Java", "Go", "Python"]
+    with MockHHServer(found=45, latency=0.01) as server:
+        api.url = server.url
+        results = api.get_vacancies_many(keywords)
+
+    assert list(results) == ["Python", "Java", "Go"]
+    for vacancies in results.values():
+        assert [vacancy["id"] for vacancy in vacancies] == [str(i) for i in range(45)]
+    assert sorted(request["text"] for request in server.requests) == sorted(["Python", "Java", "Go"] * 3)
+    assert server.max_in_flight <= 3
+
+
+def test_async_failed_pages_and_resume():
+    api = AsyncHHVacancyAPI(max_connections=2)
+    failing = {("Python", "1"), ("Java", "0")}
+
+    def page_callback(request, context):
+        key = (request.qs["text"][0].capitalize(), request.qs["page"][0])
+        if key in failing:
+            context.status_code = 503
+            return {}
+        return {"items": [{"id": f"{key[0]}-{key[1]}"}], "pages": 3}
+
+    with requests_mock.Mocker() as m:
+        m.get("https://api.hh.ru/vacancies", json=page_callback)
+        results = api.get_vacancies_many(["Python", "Java"])
+        assert [vacancy["id"] for vacancy in results["Python"]] == ["Python-0", "Python-2"]
+        assert results["Java"] == []
+        assert api.failed_keyword_pages == {"Python": [1], "Java": [0]}
+
+        failing.clear()
+        calls_before = m.call_count
+        results = api.resume_many()
+
+    # Для Python догружается одна страница, для Java - первая и по ее метаданным остальные
+    assert m.call_count - calls_before == 4
+    assert [vacancy["id"] for vacancy in results["Python"]] == ["Python-0", "Python-1", "Python-2"]
+    assert [vacancy["id"] for vacancy in results["Java"]] == ["Java-0", "Java-1", "Java-2"]
+    assert api.failed_keyword_pages == {}
+
+
+def test_async_resume_single_keyword():
+    api = AsyncHHVacancyAPI()
+    failing = {"page": "1"}
+
+    def page_callback(request, context):
+        page = request.qs["page"][0]
+        if page == failing["page"]:
+            context.status_code = 500
+            return {}
+        return {"items": [{"id": page}], "pages": 3}
+
+    with requests_mock.Mocker() as m:
+        m.get("https://api.hh.ru/vacancies", json=page_callback)
+        assert [vacancy["id"] for vacancy in api.get_vacancies("Python")] == ["0", "2"]
+        assert api.failed_pages == [1]
+
+        failing["page"] = None
+        vacancies = api.resume()
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2"]
+    assert api.failed_pages == []
+
+
+def test_async_get_vacancies_sync_wrapper():
+    api = AsyncHHVacancyAPI()
+    with MockHHServer(found=5) as server:
+        api.url = server.url
+        vacancies = api.get_vacancies("Python")
+
+    assert len(vacancies) == 5
+
+
+def test_async_api_in_incremental_sync(tmpdir):
+    from src.Filtered_vacancy import JSONVacancyStorage
+    from src.incremental_sync import IncrementalSync
+
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    sync = IncrementalSync(AsyncHHVacancyAPI(), storage, str(tmpdir.join("sync_state.json")))
+    with MockHHServer(found=3) as server:
+        sync.api.url = server.url
+        assert sync.sync("Python")["added"] == 3
+        sync.sync("Python")
+
+    assert "date_from" not in server.requests[0]
+    assert server.requests[-1]["date_from"] == sync.load_state()["Python"]
+
+
+def test_async_sync_wrapper_inside_event_loop():
+    async def main():
+        AsyncHHVacancyAPI().get_vacancies("Python")
+
+    with pytest.raises(RuntimeError, match="aget_vacancies"):
+        asyncio.run(main())
+
+
+def test_iter_vacancies_is_lazy(hh_api):
+    url = "https://api.hh.ru/vacancies"
+    hh_api.params["per_page"] = 2
+
+    def page_callback(request, context):
+        page = int(request.qs["page"][0])
+        return {"items": [{"id": str(page * 2)}, {"id": str(page * 2 + 1)}] if page < 3 else []}
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=page_callback)
+        vacancies = hh_api.iter_vacancies("Python Developer")
+        assert m.call_count == 0
+
+        assert next(vacancies)["id"] == "0"
+        assert m.call_count == 1
+
+        assert [vacancy["id"] for vacancy in vacancies] == ["1", "2", "3", "4", "5"]
+        assert m.call_count == 4
+
+
+def test_iter_vacancies_concurrent_order():
+    api = HHVacancyAPI(max_workers=2)
+    with MockHHServer(found=95, latency=0.005) as server:
+        api.url = server.url
+        ids = [vacancy["id"] for vacancy in api.iter_vacancies("Python Developer")]
+
+    assert ids == [str(i) for i in range(95)]
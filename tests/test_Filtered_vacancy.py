@@ -1,6 +1,8 @@
+import json
+
 import pytest
 
-from src.Filtered_vacancy import JSONVacancyStorage
+from src.Filtered_vacancy import JSONVacancyStorage, ingest_vacancies
 from src.Vacancy import Vacancy
 
 
@@ -64,3 +66,111 @@ def test_delete_vacancy(storage):
     storage.add_vacancy(vacancy)
 
     storage.delete_vacancy_by_title("Software Engineer")
+
+
+def test_ingest_vacancies_in_batches(storage):
+    """Тестирование потоковой записи вакансий пачками."""
+    items = (
+        {
+            "id": str(i),
+            "name": f"Python Developer {i}",
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "salary": None,
+            "snippet": {"requirement": "Python"},
+        }
+        for i in range(5)
+    )
+    seen = []
+
+    result = ingest_vacancies(storage, items, batch_size=2, on_vacancy=lambda vacancy: seen.append(vacancy.id))
+
+    assert result == {"fetched": 5, "added": 5, "updated": 0, "unchanged": 0}
+    assert seen == ["0", "1", "2", "3", "4"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["0", "1", "2", "3", "4"]
+
+
+def test_repeated_queries_use_cache(storage):
+    """Тестирование того, что повторные запросы не читают файл."""
+    storage.add_vacancy(
+        Vacancy(id="1", title="Software Engineer", link="http://example.com/vacancy1", salary=None, description="")
+    )
+    disk_loads = storage.stats["disk_loads"]
+
+    assert storage.get_vacancies(title="Software Engineer")[0]["id"] == "1"
+    assert storage.get_vacancy("1")["title"] == "Software Engineer"
+    storage.delete_vacancy_by_title("Data Scientist")
+    assert len(storage.get_vacancies()) == 1
+
+    assert storage.stats["disk_loads"] == disk_loads
+    assert storage.stats["cache_hits"] >= 4
+
+
+def test_cache_invalidated_by_external_write(storage):
+    """Тестирование перечитывания файла после записи другим процессом."""
+    assert storage.get_vacancies() == []
+    disk_loads = storage.stats["disk_loads"]
+    with open(storage.filename, "w") as file:
+        json.dump([{"id": "2", "title": "Data Scientist", "salary": None}], file)
+
+    assert storage.get_vacancies(title="Data Scientist")[0]["id"] == "2"
+    assert storage.stats["disk_loads"] == disk_loads + 1
+
+
+def test_upsert_skips_unchanged(storage):
+    """Тестирование того, что upsert без изменений не перезаписывает файл."""
+    vacancies = [
+        Vacancy(id="1", title="Software Engineer", link="http://example.com/vacancy1", salary=None, description=""),
+        Vacancy(id="2", title="Data Scientist", link="http://example.com/vacancy2", salary=None, description=""),
+    ]
+    assert storage.upsert_vacancies(vacancies) == {"added": 2, "updated": 0, "unchanged": 0}
+    writes = storage.stats["writes"]
+
+    assert storage.upsert_vacancies(vacancies) == {"added": 0, "updated": 0, "unchanged": 2}
+    assert storage.stats["writes"] == writes
+
+    changed = Vacancy(
+        id="1", title="Software Engineer", link="http://example.com/vacancy1", salary=None, description="Go"
+    )
+    assert storage.upsert_vacancies([changed]) == {"added": 0, "updated": 1, "unchanged": 0}
+    assert [vacancy["description"] for vacancy in storage.get_vacancies()] == ["Go", ""]
+    assert storage.stats["writes"] == writes + 1
+
+
+def test_upsert_collapses_duplicate_ids(storage):
+    """Тестирование сведения повторов одного 'id', записанных через add_vacancies."""
+    storage.add_vacancies(
+        [
+            {"id": "1", "title": "Python", "salary": None},
+            {"id": "2", "title": "Java", "salary": None},
+            {"id": "1", "title": "Python Senior", "salary": None},
+        ]
+    )
+    result = storage.upsert_vacancies([{"id": "2", "title": "Java", "salary": None}])
+
+    assert result == {"added": 0, "updated": 0, "unchanged": 1}
+    assert [vacancy["title"] for vacancy in storage.get_vacancies()] == ["Python Senior", "Java"]
+
+
+def test_delete_many_and_where(storage):
+    """Тестирование массового удаления за одну перезапись файла."""
+    storage.add_vacancies(
+        [
+            {"id": "1", "title": "Python", "salary": {"from": 100000, "to": None}},
+            {"id": "2", "title": "Java", "salary": None},
+            {"id": "3", "title": "Go", "salary": {"from": 300000, "to": None}},
+            {"id": "4", "title": "Java", "salary": None},
+        ]
+    )
+    writes = storage.stats["writes"]
+
+    assert storage.delete_many(ids=["1", "5"], titles=["Java"]) == 3
+    assert storage.stats["writes"] == writes + 1
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["3"]
+
+    assert storage.delete_where(min_salary=400000) == 0
+    assert storage.stats["writes"] == writes + 1
+    assert storage.delete_where(lambda vacancy: vacancy["title"].startswith("G"), min_salary=200000) == 1
+    assert storage.get_vacancies() == []
+
+    with pytest.raises(ValueError):
+        storage.delete_where()
@@ -1,4 +1,4 @@
-from src.Vacancy import Vacancy, extract_salary_amount
+from src.Vacancy import NO_SALARY, Vacancy, extract_salary_amount
 
 
 def test_extract_salary_amount():
@@ -47,3 +47,57 @@ def test_vacancy_comparisons():
         description="Junior developer role",
     )
     assert vacancy1 == vacancy1_2
+
+
+def test_vacancy_normalizes_salary_dict():
+    """Тестирование разбора зарплаты из словаря HH."""
+    vacancy = Vacancy(
+        id="1",
+        title="Python Developer",
+        link="http://example.com",
+        salary={"from": None, "to": 150000, "currency": "RUR", "gross": False},
+        description="",
+    )
+    assert (vacancy.salary_from, vacancy.salary_to, vacancy.currency) == (None, 150000, "RUR")
+    assert vacancy.sort_key == 150000
+    assert not hasattr(vacancy, "__dict__")
+
+
+def test_vacancy_sorting():
+    """Тестирование сортировки вакансий по зарплате."""
+    vacancies = [
+        Vacancy(id="1", title="", link="", salary="от 3000", description=""),
+        Vacancy(id="2", title="", link="", salary=None, description=""),
+        Vacancy(id="3", title="", link="", salary={"from": 1000, "to": 2000}, description=""),
+        Vacancy(id="4", title="", link="", salary="до 2000", description=""),
+    ]
+    assert [vacancy.id for vacancy in sorted(vacancies)] == ["3", "4", "1", "2"]
+
+
+def test_vacancy_from_api():
+    """Тестирование создания вакансий из ответа API."""
+    item = {
+        "id": "1",
+        "name": "Python Developer",
+        "alternate_url": "https://hh.ru/vacancy/1",
+        "salary": None,
+        "snippet": {"requirement": "Python"},
+    }
+    vacancies = Vacancy.from_api_many([item, {**item, "area": {"id": "1", "name": "Москва", "url": "https://api"}}])
+
+    assert vacancies[0].to_dict() == {
+        "id": "1",
+        "title": "Python Developer",
+        "link": "https://hh.ru/vacancy/1",
+        "salary": None,
+        "description": "Python",
+    }
+    assert vacancies[0].sort_key == NO_SALARY
+    assert vacancies[1].to_dict()["area"] == {"id": "1", "name": "Москва"}
+
+
+def test_salary_fields_match_codec():
+    from src import codec
+    from src.Vacancy import SALARY_FIELDS
+
+    assert SALARY_FIELDS == codec.SALARY_FIELDS
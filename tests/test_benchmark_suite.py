@@ -0,0 +1,39 @@
+from benchmarks.suite import compare, measure
+
+
+def result(best):
+    return {"best": best, "median": best, "number": 1, "repeat": 1}
+
+
+def test_compare_reports_only_regressions_over_threshold_and_min_delta():
+    baseline = {"a[1]": result(0.010), "b[1]": result(0.010), "c[1]": result(0.0001), "d[1]": result(0.010)}
+    results = {
+        # На 50% медленнее и больше чем на min_delta - замедление
+        "a[1]": result(0.015),
+        # На 20% медленнее - в пределах threshold
+        "b[1]": result(0.012),
+        # В 3 раза медленнее, но всего на 0.2 мс - меньше min_delta
+        "c[1]": result(0.0003),
+        # Быстрее базовой линии
+        "d[1]": result(0.005),
+        # Нет в базовой линии
+        "e[1]": result(1.0),
+    }
+
+    regressions = compare(results, baseline, threshold=0.25, min_delta=0.0005)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("a[1]:") and "x1.50" in regressions[0]
+
+
+def test_compare_threshold_is_exclusive():
+    assert compare({"a[1]": result(0.0125)}, {"a[1]": result(0.010)}, threshold=0.25, min_delta=0) == []
+    assert compare({"a[1]": result(0.0126)}, {"a[1]": result(0.010)}, threshold=0.25, min_delta=0) != []
+
+
+def test_measure_resets_before_each_call():
+    calls = []
+    measured = measure(lambda: calls.append("call"), repeat=3, reset=lambda: calls.append("reset"))
+
+    assert calls == ["reset", "call"] * 3
+    assert measured["number"] == 1 and measured["repeat"] == 3
@@ -0,0 +1,163 @@
+import json
+import subprocess
+import sys
+
+import pytest
+import requests_mock
+
+from src.cli import build_parser, main
+
+URL = "https://api.hh.ru/vacancies"
+ITEMS = [
+    {
+        "id": str(i),
+        "name": title,
+        "alternate_url": f"https://hh.ru/vacancy/{i}",
+        "salary": None,
+        "snippet": {"requirement": "Python"},
+        "published_at": "2024-07-26T12:00:00+0300",
+    }
+    for i, title in enumerate(["Python Developer", "Middle React developer [CMDB]", "Python Developer"])
+]
+
+
+def test_import_has_no_side_effects():
+    """Импорт модулей не должен обращаться к сети и загружать requests."""
+    code = (
+        "import sys; import src.Vacancy, src.Filtered_vacancy, src.user_interaction, src.cli; "
+        "print('requests' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_data_dir_default_is_the_same_for_all_commands():
+    parser = build_parser()
+    commands = [["storage-demo"], ["sync", "Python"], ["migrate-sqlite"], ["ingest", "page.json"], ["snapshot"]]
+    assert {parser.parse_args(command).data_dir for command in commands} == {"data"}
+
+
+def test_storage_demo(tmpdir, capsys):
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={"items": ITEMS})
+        main(["storage-demo", "--data-dir", str(tmpdir)])
+
+    assert "Получена вакансия: Python Developer" in capsys.readouterr().out
+    with open(tmpdir.join("filtered_vacancies.json")) as file:
+        assert [vacancy["id"] for vacancy in json.load(file)] == ["0", "2"]
+    with open(tmpdir.join("remaining_vacancies.json")) as file:
+        assert [vacancy["id"] for vacancy in json.load(file)] == ["0", "2"]
+
+
+def test_storage_demo_twice_keeps_store_size(tmpdir, capsys):
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={"items": ITEMS})
+        main(["storage-demo", "--data-dir", str(tmpdir), "--delete-title", ""])
+        main(["storage-demo", "--data-dir", str(tmpdir), "--delete-title", ""])
+
+    assert "Получено 3, новых 0, обновлено 0, без изменений 3" in capsys.readouterr().out
+    with open(tmpdir.join("vacancies.json")) as file:
+        assert [vacancy["id"] for vacancy in json.load(file)] == ["0", "1", "2"]
+
+
+def test_sync(tmpdir, capsys):
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={"items": ITEMS})
+        main(["sync", "Python", "--data-dir", str(tmpdir)])
+
+    assert "Python: получено 3, новых 3, обновлено 0" in capsys.readouterr().out
+    assert tmpdir.join("sync_state.json").exists()
+
+
+@pytest.fixture
+def fast_scheduler(monkeypatch):
+    """Планировщик команд без ожидания между повторами."""
+    from src import request_scheduler
+
+    monkeypatch.setattr(
+        request_scheduler, "default_scheduler", lambda: request_scheduler.RequestScheduler(sleep=lambda _: None)
+    )
+
+
+def test_sync_retries_and_reports_failed_pages(tmpdir, capsys, fast_scheduler):
+    def page_callback(request, context):
+        if request.qs["text"] == ["java"]:
+            context.status_code = 503
+            return {}
+        return {"items": ITEMS}
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, [{"status_code": 429, "json": {}}, {"json": page_callback}])
+        with pytest.raises(SystemExit) as error:
+            main(["sync", "Python", "Java", "--data-dir", str(tmpdir)])
+
+    assert error.value.code == 1
+    out = capsys.readouterr().out
+    # Ответ 429 повторен планировщиком, запрос Java не загружен и после повторов
+    assert "Python: получено 3" in out
+    assert "Java: не удалось загрузить страницы [0], результаты неполные" in out
+    with open(tmpdir.join("sync_state.json")) as file:
+        assert list(json.load(file)) == ["Python"]
+
+
+def test_migrate_sqlite_reports_skipped_files(tmpdir, capsys):
+    tmpdir.join("vacancies.json").write(json.dumps([{"id": "1", "title": "Python", "salary": None}])[:-1])
+    tmpdir.join("broken.json").write("{")
+
+    with pytest.raises(SystemExit) as error:
+        main(["migrate-sqlite", "--data-dir", str(tmpdir)])
+
+    assert error.value.code == 1
+    assert "Перенесено файлов: 1, пропущено: 1, вакансий в хранилище: 1" in capsys.readouterr().out
+
+
+def test_ingest(tmpdir, capsys):
+    dump = tmpdir.join("page.json")
+    dump.write_text(json.dumps({"items": ITEMS}), encoding="utf-8")
+    main(["ingest", str(dump), "--workers", "1", "--storage", "jsonl", "--data-dir", str(tmpdir)])
+
+    assert (
+        "вакансий: 3, повторов: 0, некорректных: 0, новых: 3, обновлено: 0, без изменений: 0"
+        in capsys.readouterr().out
+    )
+    assert len(tmpdir.join("vacancies.jsonl").readlines()) == 3
+
+
+def test_profile_and_metrics(tmpdir, capsys):
+    dump = tmpdir.join("page.json")
+    dump.write_text(json.dumps({"items": ITEMS}), encoding="utf-8")
+    profile = tmpdir.join("run.prof")
+    metrics = tmpdir.join("metrics.prom")
+    main(
+        [
+            "--profile",
+            str(profile),
+            "--metrics",
+            f"prometheus:{metrics}",
+            "ingest",
+            str(dump),
+            "--workers",
+            "1",
+            "--storage",
+            "json",
+            "--data-dir",
+            str(tmpdir),
+        ]
+    )
+
+    assert "function calls" in capsys.readouterr().out
+    assert profile.exists()
+    assert "storage.cache_hits" in metrics.read()
+
+
+def test_snapshot(tmpdir, capsys):
+    from src.snapshot import VacancySnapshot
+
+    dump = tmpdir.join("page.json")
+    dump.write_text(json.dumps({"items": ITEMS}), encoding="utf-8")
+    main(["ingest", str(dump), "--workers", "1", "--storage", "sqlite", "--data-dir", str(tmpdir)])
+    main(["snapshot", "--storage", "sqlite", "--data-dir", str(tmpdir)])
+
+    assert "вакансий 3" in capsys.readouterr().out
+    with VacancySnapshot(str(tmpdir.join("vacancies.snap"))) as snapshot:
+        assert [vacancy["title"] for vacancy in snapshot][:2] == ["Python Developer", "Middle React developer [CMDB]"]
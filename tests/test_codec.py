@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from src import codec
+from tests.mock_hh_server import make_item
+
+
+@pytest.fixture(params=codec.available_backends())
+def backend(request):
+    previous = codec.get_backend()
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+def make_page():
+    item = make_item(1)
+    item["employer"] = {"id": "1740", "name": "Яндекс", "logo_urls": {"90": "https://hhcdn.ru/90.png"}}
+    item["salary"]["extra"] = "лишнее поле"
+    item["snippet"]["responsibility"] = None
+    item["area"]["url"] = "https://api.hh.ru/areas/1"
+    return {"items": [item, {**make_item(2), "salary": None}], "found": 2, "pages": 1, "page": 0, "per_page": 100}
+
+
+def test_decode_vacancy_page(backend):
+    page = codec.decode_vacancy_page(json.dumps(make_page(), ensure_ascii=False).encode("utf-8"))
+
+    assert page["found"] == 2 and page["pages"] == 1
+    first, second = page["items"]
+    assert set(first) == {"id", "name", "alternate_url", "salary", "snippet", "area", "published_at"}
+    assert first["area"] == {"id": "1", "name": "Москва"}
+    assert first["salary"] == {"from": 100001, "to": None, "currency": "RUR", "gross": False}
+    assert isinstance(first["salary"]["from"], int)
+    assert first["snippet"] == {
+        "requirement": "Опыт работы с <highlighttext>Python</highlighttext> 1",
+        "responsibility": None,
+    }
+    assert second["salary"] is None
+
+
+def test_loads_dumps(backend):
+    value = {"id": "1", "title": "Разработчик", "salary": {"from": 1.5, "to": None}, "tags": [True, None]}
+    text = codec.dumps(value)
+    assert "Разработчик" in text
+    assert codec.loads(text) == value
+    assert codec.loads(text.encode("utf-8")) == value
+
+
+def test_invalid_json(backend):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"id": ')
+    with pytest.raises(json.JSONDecodeError):
+        codec.decode_vacancy_page(b"[1, 2")
+
+
+def test_loads_array_prefix():
+    assert codec.loads_array_prefix(b'[{"id": "1"}, {"id": "2"}]') == [{"id": "1"}, {"id": "2"}]
+    assert codec.loads_array_prefix('[\n  {"id": "1"},\n  {"id": "2", "ti') == [{"id": "1"}]
+    assert codec.loads_array_prefix("[") == []
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads_array_prefix('{"items": []}')
+
+
+def test_set_backend_unknown():
+    with pytest.raises(ValueError):
+        codec.set_backend("simplejson")
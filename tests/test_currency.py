@@ -0,0 +1,167 @@
+import json
+import os
+
+import pytest
+
+from src.currency import DEFAULT_RATES_PATH, CurrencyConverter, default_salary_key
+from src.ranking import top_n
+from src.user_interaction import UserInteraction
+
+VACANCIES = [
+    {"id": "1", "salary": {"from": 1000000, "to": None, "currency": "KZT"}},
+    {"id": "2", "salary": {"from": 300000, "to": None, "currency": "RUR"}},
+    {"id": "3", "salary": {"from": 3000, "to": 5000, "currency": "USD"}},
+    {"id": "4", "salary": {"from": 150000, "to": None, "currency": None}},
+    {"id": "5", "salary": None},
+]
+
+
+@pytest.fixture
+def converter():
+    return CurrencyConverter({"RUR": 1.0, "KZT": 5.0, "USD": 0.01})
+
+
+def test_to_base(converter):
+    assert converter.to_base(1000000, "KZT") == 200000
+    assert converter.to_base(3000, "USD") == 300000
+    assert converter.to_base(100, None) == 100
+    assert converter.to_base(100, "XXX") == 100
+    assert converter.to_base(None, "USD") is None
+    assert converter.normalize_salary({"from": 500, "to": None, "currency": "KZT", "gross": True}) == {
+        "from": 100,
+        "to": None,
+        "currency": "RUR",
+        "gross": True,
+    }
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        CurrencyConverter({"USD": 0})
+
+
+def test_ranking_in_base_currency(converter):
+    assert [vacancy["id"] for vacancy in top_n(VACANCIES, 5)] == ["1", "2", "4", "3", "5"]
+    ranked = top_n(VACANCIES, 5, converter.salary_key())
+    assert [vacancy["id"] for vacancy in ranked] == ["2", "3", "1", "4", "5"]
+
+
+def test_from_file_cached(tmpdir):
+    path = str(tmpdir.join("rates.json"))
+    with open(path, "w") as file:
+        json.dump({"base": "RUR", "rates": {"USD": 0.01}}, file)
+    converter = CurrencyConverter.from_file(path)
+    assert CurrencyConverter.from_file(path) is converter
+    assert converter.rates == {"USD": 0.01, "RUR": 1.0}
+
+    with open(path, "w") as file:
+        json.dump({"base": "RUR", "rates": {"USD": 0.02}}, file)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert CurrencyConverter.from_file(path).rates["USD"] == 0.02
+
+
+def test_default_rates_file():
+    converter = CurrencyConverter.from_file(DEFAULT_RATES_PATH)
+    assert converter.base == "RUR"
+    assert converter.to_base(1000000, "KZT") < 300000
+
+
+def test_default_salary_key_without_file(tmpdir, capsys):
+    key = default_salary_key(path=str(tmpdir.join("missing.json")))
+    assert key(VACANCIES[0]) == 1000000
+    assert "Курсы валют не загружены" in capsys.readouterr().out
+    # Предупреждение выводится один раз
+    default_salary_key(path=str(tmpdir.join("missing.json")))
+    assert capsys.readouterr().out == ""
+
+
+def open_storage(kind, tmpdir, converter):
+    from src.Filtered_vacancy import JSONVacancyStorage
+    from src.jsonl_storage import JSONLVacancyStorage
+    from src.sqlite_storage import SQLiteVacancyStorage
+
+    if kind == "json":
+        return JSONVacancyStorage(str(tmpdir.join("vacancies.json")), converter=converter)
+    if kind == "jsonl":
+        return JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")), converter=converter)
+    return SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")), converter=converter)
+
+
+@pytest.mark.parametrize("kind", ["json", "jsonl", "sqlite"])
+def test_storage_salary_criteria_normalized(tmpdir, converter, kind):
+    storage = open_storage(kind, tmpdir, converter)
+    storage.add_vacancies(VACANCIES)
+
+    # 1 000 000 KZT - это 200 000 в базовой валюте
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=250000)] == ["2", "3"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(max_salary=600000)] == ["3"]
+    assert storage.delete_where(min_salary=250000) == 2
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1", "4", "5"]
+
+
+@pytest.mark.parametrize("kind", ["json", "jsonl", "sqlite"])
+def test_storage_uses_rates_file_in_its_directory(tmpdir, rates_file, monkeypatch, kind):
+    storage = open_storage(kind, tmpdir, None)
+    storage.add_vacancies(VACANCIES)
+    if kind == "sqlite":
+        storage.close()
+
+    # Файл курсов берется из каталога хранилища, а не из текущего каталога
+    monkeypatch.chdir(tmpdir.mkdir("elsewhere"))
+    storage = open_storage(kind, tmpdir, None)
+    assert storage.converter is not None
+    assert "1" not in [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=300000)]
+    if kind == "sqlite":
+        storage.close()
+
+
+def test_sqlite_keeps_rates_when_opened_elsewhere(tmpdir, rates_file, monkeypatch):
+    def stored_rates(storage):
+        return storage.connection.execute("SELECT value FROM settings WHERE key = 'rates'").fetchone()[0]
+
+    storage = open_storage("sqlite", tmpdir, None)
+    storage.add_vacancies(VACANCIES)
+    rates = stored_rates(storage)
+    storage.close()
+
+    monkeypatch.chdir(tmpdir.mkdir("elsewhere"))
+    storage = open_storage("sqlite", tmpdir, None)
+    # Те же курсы из каталога базы: суммы в базовой валюте не пересчитываются без курсов
+    assert rates != "null" and stored_rates(storage) == rates
+    storage.close()
+
+
+def test_sqlite_base_amounts_follow_rates(tmpdir, converter):
+    storage = open_storage("sqlite", tmpdir, converter)
+    storage.add_vacancies(VACANCIES)
+    storage.close()
+
+    # Открытие с другими курсами пересчитывает суммы в базовой валюте
+    storage = open_storage("sqlite", tmpdir, CurrencyConverter({"KZT": 2.0, "USD": 0.01}))
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=250000)] == ["1", "2", "3"]
+    storage.close()
+
+
+def test_snapshot_salary_criteria_normalized(tmpdir, converter):
+    from src.snapshot import VacancySnapshot, write_snapshot
+
+    path = str(tmpdir.join("vacancies.snap"))
+    write_snapshot(path, VACANCIES)
+    with VacancySnapshot(path, converter=converter) as snapshot:
+        assert [vacancy["id"] for vacancy in snapshot.get_vacancies(min_salary=250000)] == ["2", "3"]
+
+
+def test_select_top_vacancies_normalized():
+    assert [vacancy["id"] for vacancy in UserInteraction.select_top_vacancies(VACANCIES, 2)] == ["2", "3"]
+
+
+def test_salary_columns_normalized(converter):
+    pytest.importorskip("numpy")
+    from src.salary_columns import SalaryColumns
+
+    columns = SalaryColumns(VACANCIES)
+    amounts = converter.column_amounts(columns)
+    assert [columns.ids[row] for row in columns.top_k(3, amounts=amounts)] == ["2", "3", "1"]
+    rows = columns.filter_range(min_salary=250000, factors=converter.row_factors(columns))
+    assert [columns.ids[row] for row in rows] == ["2", "3"]
+    assert columns.summary(amounts)["median"] == 250000
@@ -0,0 +1,88 @@
+import requests_mock
+
+from src.API_HH import HHVacancyAPI
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.incremental_sync import IncrementalSync
+
+URL = "https://api.hh.ru/vacancies"
+
+
+def make_item(vacancy_id, published_at, salary_from=100000):
+    return {
+        "id": vacancy_id,
+        "name": f"Python Developer {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": {"from": salary_from, "to": None, "currency": "RUR", "gross": False},
+        "snippet": {"requirement": "Python"},
+        "published_at": published_at,
+    }
+
+
+def test_sync_fetches_only_new_items(tmpdir):
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    sync = IncrementalSync(HHVacancyAPI(), storage, str(tmpdir.join("sync_state.json")))
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            URL,
+            json={"items": [make_item("1", "2024-07-26T10:00:00+0300"), make_item("2", "2024-07-26T12:00:00+0300")]},
+        )
+        first = sync.sync("Python")
+        assert "date_from" not in m.last_request.qs
+
+        m.get(
+            URL,
+            json={
+                "items": [
+                    make_item("2", "2024-07-26T12:00:00+0300", salary_from=150000),
+                    make_item("3", "2024-07-27T09:00:00+0300"),
+                ]
+            },
+        )
+        second = sync.sync("Python")
+        assert m.last_request.qs["date_from"] == ["2024-07-26t12:00:00+0300"]
+
+    assert first == {"fetched": 2, "added": 2, "updated": 0, "unchanged": 0, "failed_pages": []}
+    assert second == {"fetched": 2, "added": 1, "updated": 1, "unchanged": 0, "failed_pages": []}
+    stored = storage.get_vacancies()
+    assert [vacancy["id"] for vacancy in stored] == ["1", "2", "3"]
+    assert stored[1]["salary"]["from"] == 150000
+    assert sync.load_state() == {"Python": "2024-07-27T09:00:00+0300"}
+
+
+def test_failed_middle_page_does_not_advance_state(tmpdir):
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    sync = IncrementalSync(HHVacancyAPI(max_workers=2), storage, str(tmpdir.join("sync_state.json")))
+    pages = {
+        "0": [make_item("1", "2024-07-26T10:00:00+0300")],
+        "1": [make_item("2", "2024-07-26T11:00:00+0300")],
+        "2": [make_item("3", "2024-07-26T13:00:00+0300")],
+    }
+    failing = {"page": "1"}
+
+    def page_callback(request, context):
+        page = request.qs["page"][0]
+        if page == failing["page"]:
+            context.status_code = 503
+            return {}
+        return {"items": pages[page], "pages": 3}
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=page_callback)
+        first = sync.sync("Python")
+        # Страница 1 запрашивается дважды: в первом проходе и в resume()
+        assert [request.qs["page"] for request in m.request_history].count(["1"]) == 2
+
+        failing["page"] = None
+        second = sync.sync("Python")
+        assert "date_from" not in m.last_request.qs
+
+    assert first == {"fetched": 2, "added": 2, "updated": 0, "unchanged": 0, "failed_pages": [1]}
+    assert second == {"fetched": 3, "added": 1, "updated": 0, "unchanged": 2, "failed_pages": []}
+    assert sync.load_state() == {"Python": "2024-07-26T13:00:00+0300"}
+
+
+def test_latest_published_at_ignores_invalid_dates():
+    items = [{"published_at": "bad"}, {"published_at": "2024-07-26T10:00:00+0300"}, {}]
+    assert IncrementalSync.latest_published_at(items, None) == "2024-07-26T10:00:00+0300"
+    assert IncrementalSync.latest_published_at([], "2024-07-27T10:00:00+0300") == "2024-07-27T10:00:00+0300"
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from src.ingest import ingest_dumps, iter_dump_items, normalize_item, parse_dump
+from src.jsonl_storage import JSONLVacancyStorage
+from src.sqlite_storage import SQLiteVacancyStorage
+from tests.mock_hh_server import make_item
+
+
+def write_dump(tmpdir, name, data):
+    path = tmpdir.join(name)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def dumps(tmpdir):
+    return [
+        write_dump(
+            tmpdir,
+            "page.json",
+            {"items": [make_item(1), make_item(2), make_item(1), {"id": "9", "name": "Без ссылки"}]},
+        ),
+        write_dump(tmpdir, "pages.json", [{"items": [make_item(3)]}, {"items": [make_item(2), make_item(4)]}]),
+        write_dump(tmpdir, "items.json", [make_item(5), {"id": "6"}]),
+        str(tmpdir.join("missing.json")),
+    ]
+
+
+def test_normalize_item():
+    item = make_item(7)
+    item["salary"] = {"from": None, "to": 200000, "currency": "USD", "gross": True}
+    record = normalize_item(item)
+    assert record == {
+        "id": "7",
+        "title": "Python Developer 7",
+        "link": "https://hh.ru/vacancy/7",
+        "salary": {"from": None, "to": 200000, "currency": "USD", "gross": True},
+        "description": "Опыт работы с <highlighttext>Python</highlighttext> 7",
+        "area": {"id": "1", "name": "Москва"},
+    }
+    assert normalize_item({**item, "salary": None, "snippet": None})["salary"] is None
+    # Лишние поля зарплаты отбрасываются
+    assert normalize_item({**item, "salary": {"from": 1, "mode": "month"}})["salary"] == {"from": 1}
+
+
+def test_dump_and_api_records_match(tmpdir):
+    from src.Filtered_vacancy import ingest_vacancies
+
+    storage = JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")))
+    dump = [write_dump(tmpdir, "page.json", {"items": [make_item(1)]})]
+
+    assert ingest_dumps(dump, storage, workers=1)["added"] == 1
+    # Та же вакансия из API и снова из файла не считается измененной
+    assert ingest_vacancies(storage, [make_item(1)])["unchanged"] == 1
+    assert ingest_dumps(dump, storage, workers=1)["unchanged"] == 1
+
+
+def test_iter_dump_items():
+    assert [item["id"] for item in iter_dump_items({"items": [make_item(1)]})] == ["1"]
+    assert [item["id"] for item in iter_dump_items([make_item(1), "мусор", {"id": "2"}])] == ["1"]
+    with pytest.raises(ValueError):
+        list(iter_dump_items(42))
+    with pytest.raises(ValueError):
+        list(iter_dump_items({"items": None}))
+
+
+def test_parse_dump(dumps):
+    records, duplicates, invalid, error = parse_dump(dumps[0])
+    assert [record["id"] for record in records] == ["1", "2"]
+    assert (duplicates, invalid) == (1, 1)
+    assert error is None
+
+    records, duplicates, invalid, error = parse_dump(dumps[3])
+    assert records == [] and duplicates == 0 and invalid == 0
+    assert "missing.json пропущен" in error
+
+
+@pytest.mark.parametrize("data", [42, {"items": None}, [{"items": [make_item(1)]}, {"items": 5}]])
+def test_unexpected_structure_skips_file(tmpdir, data, capsys):
+    storage = JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")))
+    paths = [write_dump(tmpdir, "bad.json", data), write_dump(tmpdir, "page.json", {"items": [make_item(2)]})]
+    report = ingest_dumps(paths, storage, workers=1)
+
+    assert "bad.json пропущен" in capsys.readouterr().out
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["2"]
+    assert report["parsed"] == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_dumps(tmpdir, dumps, workers, capsys):
+    storage = JSONLVacancyStorage(str(tmpdir.join(f"vacancies_{workers}.jsonl")))
+    report = ingest_dumps(dumps, storage, workers=workers, batch_size=2)
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1", "2", "3", "4", "5"]
+    assert report["files"] == 4
+    assert report["parsed"] == 8
+    assert report["duplicates"] == 2
+    assert report["invalid"] == 1
+    assert (report["added"], report["updated"], report["unchanged"]) == (5, 0, 0)
+    assert report["records_per_second"] > 0
+    assert "missing.json пропущен" in capsys.readouterr().out
+
+
+def test_ingest_into_sqlite(tmpdir, dumps):
+    storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    ingest_dumps(dumps[:2], storage, workers=1)
+    assert storage.count() == 4
+    assert storage.get_vacancy("3")["description"] == "Опыт работы с <highlighttext>Python</highlighttext> 3"
+
+    report = ingest_dumps(dumps[:2], storage, workers=1)
+    assert (report["added"], report["updated"], report["unchanged"]) == (0, 0, 4)
+    storage.close()
@@ -0,0 +1,111 @@
+import json
+import logging
+
+import pytest
+
+from src import instrumentation
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.Vacancy import Vacancy
+
+
+class ListSink(instrumentation.Sink):
+    def __init__(self):
+        self.events = []
+        self.summaries = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def flush(self, snapshot):
+        self.summaries.append(snapshot)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    yield
+    instrumentation.disable()
+
+
+def test_disabled_is_noop():
+    assert not instrumentation.is_enabled()
+    with instrumentation.span("noop"):
+        instrumentation.count("noop")
+    assert instrumentation.snapshot() == {"counters": {}, "spans": {}}
+    assert instrumentation.flush() is None
+
+
+def test_spans_and_counters():
+    sink = ListSink()
+    instrumentation.enable(sink)
+    with instrumentation.span("work"):
+        instrumentation.count("items", 3)
+    with instrumentation.span("work"):
+        instrumentation.count("items")
+
+    summary = instrumentation.flush()
+    assert summary["counters"] == {"items": 4}
+    assert summary["spans"]["work"]["count"] == 2
+    assert summary["spans"]["work"]["total"] >= summary["spans"]["work"]["max"] > 0
+    assert [event["span"] for event in sink.events] == ["work", "work"]
+    assert sink.summaries == [summary]
+
+
+def test_span_records_on_exception():
+    instrumentation.enable()
+    with pytest.raises(RuntimeError):
+        with instrumentation.span("failing"):
+            raise RuntimeError
+    assert instrumentation.snapshot()["spans"]["failing"]["count"] == 1
+
+
+def test_jsonl_sink(tmpdir):
+    path = str(tmpdir.join("metrics.jsonl"))
+    sink = instrumentation.make_sink(f"jsonl:{path}")
+    instrumentation.enable(sink)
+    with instrumentation.span("work"):
+        instrumentation.count("items")
+    instrumentation.flush()
+    sink.close()
+
+    with open(path, encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+    assert lines[0]["span"] == "work"
+    assert lines[1]["summary"]["counters"] == {"items": 1}
+
+
+def test_prometheus_sink(tmpdir):
+    path = str(tmpdir.join("metrics.prom"))
+    instrumentation.enable(instrumentation.make_sink(f"prometheus:{path}"))
+    with instrumentation.span("storage.json.load"):
+        instrumentation.count("storage.file_loads")
+    instrumentation.flush()
+
+    text = tmpdir.join("metrics.prom").read()
+    assert 'hh_vacancy_counter_total{name="storage.file_loads"} 1' in text
+    assert 'hh_vacancy_span_seconds_count{span="storage.json.load"} 1' in text
+
+
+def test_log_sink(caplog):
+    instrumentation.enable(instrumentation.make_sink("log"))
+    with caplog.at_level(logging.INFO, logger="src.instrumentation"):
+        instrumentation.count("items", 2)
+        instrumentation.flush()
+    assert "items = 2" in caplog.text
+
+
+def test_make_sink_unknown():
+    with pytest.raises(ValueError):
+        instrumentation.make_sink("statsd")
+    with pytest.raises(ValueError):
+        instrumentation.make_sink("jsonl")
+
+
+def test_storage_counters(tmpdir):
+    instrumentation.enable()
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    storage.add_vacancies([Vacancy("1", "Python", "", None, ""), Vacancy("2", "Java", "", None, "")])
+    storage.get_vacancies()
+
+    counters = instrumentation.snapshot()["counters"]
+    assert counters["storage.records_scanned"] == 2
+    assert counters["storage.cache_hits"] >= 1
@@ -0,0 +1,96 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from src.json_writer import iter_json_chunks, write_json
+
+RECORDS = [
+    {"id": "1", "title": "Python Developer", "salary": {"from": 100000, "to": None}, "tags": ["a", "б"]},
+    {"id": "2", "title": 'Строка с "кавычками"\nи переводом', "salary": None, "tags": []},
+]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        RECORDS,
+        [],
+        {},
+        {"search_keyword": "python", "top_vacancies": RECORDS, "empty": [], "nested": {"a": {}}},
+        "строка",
+        42,
+    ],
+)
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_matches_json_dumps(data, ensure_ascii):
+    assert "".join(iter_json_chunks(data, 4, ensure_ascii)) == json.dumps(data, indent=4, ensure_ascii=ensure_ascii)
+    compact = "".join(iter_json_chunks(data, None, ensure_ascii))
+    assert compact == json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii)
+
+
+def test_iterators_are_streamed():
+    data = {"top_vacancies": iter(RECORDS), "empty": iter([])}
+    expected = json.dumps({"top_vacancies": RECORDS, "empty": []}, indent=4)
+    assert "".join(iter_json_chunks(data)) == expected
+    assert "".join(iter_json_chunks(record for record in RECORDS)) == json.dumps(RECORDS, indent=4)
+
+
+def test_write_json(tmpdir):
+    path = str(tmpdir.join("result.json"))
+    write_json(path, iter(RECORDS), ensure_ascii=False)
+    with open(path, encoding="utf-8") as file:
+        assert file.read() == json.dumps(RECORDS, indent=4, ensure_ascii=False)
+
+
+def test_write_json_gzip(tmpdir):
+    path = str(tmpdir.join("result.json.gz"))
+    write_json(path, RECORDS, indent=None, compression="gzip")
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert json.load(file) == RECORDS
+
+
+def test_write_json_zstd(tmpdir):
+    zstandard = pytest.importorskip("zstandard")
+    path = str(tmpdir.join("result.json.zst"))
+    write_json(path, RECORDS, compression="zstd")
+    with zstandard.open(path, "rt", encoding="utf-8") as file:
+        assert json.load(file) == RECORDS
+
+
+def test_write_json_unknown_compression(tmpdir):
+    with pytest.raises(ValueError):
+        write_json(str(tmpdir.join("result.json")), RECORDS, compression="bz2")
+
+
+def test_write_json_is_atomic(tmpdir):
+    path = str(tmpdir.join("result.json"))
+    write_json(path, RECORDS)
+
+    def broken():
+        yield RECORDS[0]
+        raise RuntimeError("сбой при формировании данных")
+
+    with pytest.raises(RuntimeError):
+        write_json(path, broken())
+    with open(path) as file:
+        assert json.load(file) == RECORDS
+    assert tmpdir.listdir() == [tmpdir.join("result.json")]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_write_json_fsyncs_complete_file_before_replace(tmpdir, monkeypatch, compression):
+    path = str(tmpdir.join("result.json"))
+    synced = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        # На момент fsync файл уже полностью записан, а переименования еще не было
+        synced.append((os.fstat(fd).st_size, os.path.exists(path)))
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    write_json(path, RECORDS, compression=compression)
+
+    assert synced == [(os.path.getsize(path), False)]
@@ -0,0 +1,84 @@
+import pytest
+
+from src.jsonl_storage import JSONLVacancyStorage
+
+
+@pytest.fixture
+def storage(tmpdir):
+    return JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")))
+
+
+def test_add_and_get(storage, make_vacancy):
+    storage.add_vacancy(make_vacancy("1", salary={"from": 100000, "to": 150000}))
+    storage.add_vacancies([make_vacancy("2", "Data Scientist"), make_vacancy("3")])
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1", "2", "3"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(title="Data Scientist")] == ["2"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=90000)] == ["1"]
+
+
+def test_add_appends_without_rewrite(storage, make_vacancy):
+    storage.add_vacancy(make_vacancy("1"))
+    with open(storage.filename) as file:
+        first_line = file.readline()
+    storage.add_vacancy(make_vacancy("2"))
+
+    with open(storage.filename) as file:
+        lines = file.readlines()
+    assert lines[0] == first_line
+    assert len(lines) == 2
+
+
+def test_delete_and_compact(storage, make_vacancy):
+    storage.add_vacancies([make_vacancy("1"), make_vacancy("2", "Data Scientist"), make_vacancy("3")])
+    storage.delete_vacancy_by_title("Python Developer")
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["2"]
+    with open(storage.filename) as file:
+        assert len(file.readlines()) == 5
+
+    storage.compact()
+    with open(storage.filename) as file:
+        assert len(file.readlines()) == 1
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["2"]
+
+
+def test_truncated_line_is_ignored(storage, make_vacancy):
+    storage.add_vacancy(make_vacancy("1"))
+    with open(storage.filename, "a") as file:
+        file.write('{"id": "2", "tit')
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1"]
+
+    storage.add_vacancy(make_vacancy("3"))
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1", "3"]
+
+
+def test_upsert_appends_only_changed(storage, make_vacancy):
+    storage.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+
+    result = storage.upsert_vacancies([make_vacancy("1"), make_vacancy("2", "Data Scientist"), make_vacancy("3")])
+
+    assert result == {"added": 1, "updated": 1, "unchanged": 1}
+    with open(storage.filename) as file:
+        assert len(file.readlines()) == 4
+    assert [vacancy["title"] for vacancy in storage.get_vacancies()] == [
+        "Python Developer",
+        "Data Scientist",
+        "Python Developer",
+    ]
+
+
+def test_delete_many_and_where(storage, make_vacancy):
+    storage.add_vacancies(
+        [
+            make_vacancy("1", salary={"from": 100000, "to": None}),
+            make_vacancy("2", "Data Scientist"),
+            make_vacancy("3", "Go Developer", salary={"from": 300000, "to": None}),
+        ]
+    )
+
+    assert storage.delete_many(ids=["1"], titles=["Data Scientist", "Java"]) == 2
+    with open(storage.filename) as file:
+        assert len(file.readlines()) == 5
+    assert storage.delete_where(lambda vacancy: "Go" in vacancy["title"], min_salary=200000) == 1
+    assert storage.get_vacancies() == []
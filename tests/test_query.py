@@ -0,0 +1,222 @@
+import json
+
+import pytest
+
+from src.currency import CurrencyConverter
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.query import QueryEngine, VacancyQuery
+from src.sqlite_storage import SQLiteVacancyStorage
+
+RECORDS = [
+    {
+        "id": "1",
+        "title": "Python Developer",
+        "salary": {"from": 150000, "to": 250000, "currency": "RUR"},
+        "description": "Опыт с Django и PostgreSQL",
+        "area": {"id": "1", "name": "Москва"},
+    },
+    {
+        "id": "2",
+        "title": "Senior Python Developer",
+        "salary": {"from": 3000, "to": None, "currency": "USD"},
+        "description": "FastAPI, asyncio",
+        "area": {"id": "2", "name": "Санкт-Петербург"},
+    },
+    {
+        "id": "3",
+        "title": "Java Developer",
+        "salary": {"from": 200000, "to": 300000, "currency": "RUR"},
+        "description": "Spring",
+        "area": {"id": "1", "name": "Москва"},
+    },
+    {"id": "4", "title": "Python-разработчик", "salary": None, "description": "Django REST", "area": "Казань"},
+]
+
+
+@pytest.fixture
+def storage(tmpdir):
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    storage.add_vacancies(RECORDS)
+    return storage
+
+
+def ids(vacancies):
+    return [vacancy["id"] for vacancy in vacancies]
+
+
+def test_predicates(storage):
+    engine = QueryEngine(storage)
+    query = VacancyQuery()
+
+    assert ids(engine.execute(query.title_prefix("python"))) == ["1", "4"]
+    assert ids(engine.execute(query.title_contains("PYTHON"))) == ["1", "2", "4"]
+    assert ids(engine.execute(query.salary(minimum=160000))) == ["3"]
+    assert ids(engine.execute(query.salary(maximum=260000))) == ["1"]
+    assert ids(engine.execute(query.currency("usd"))) == ["2"]
+    assert ids(engine.execute(query.area("москва", "Казань"))) == ["1", "3", "4"]
+    assert ids(engine.execute(query.area(2))) == ["2"]
+    assert ids(engine.execute(query.keywords("django"))) == ["1", "4"]
+    assert ids(engine.execute(query.keywords("djan*", "postgresql"))) == ["1"]
+    assert ids(engine.execute(query)) == ["1", "2", "3", "4"]
+
+
+def test_salary_in_base_currency(storage):
+    converter = CurrencyConverter({"USD": 0.01})
+    query = VacancyQuery().salary(minimum=250000, converter=converter)
+    assert ids(QueryEngine(storage).execute(query)) == ["2"]
+
+
+@pytest.mark.parametrize("kind", ["json", "sqlite"])
+def test_salary_uses_storage_converter_by_default(tmpdir, kind):
+    records = [
+        {"id": "1", "title": "Python", "salary": {"from": 1000000, "to": None, "currency": "KZT"}},
+        {"id": "2", "title": "Python", "salary": {"from": 300000, "to": None, "currency": "RUR"}},
+    ]
+    converter = CurrencyConverter({"KZT": 5.0})
+    if kind == "json":
+        storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")), converter=converter)
+    else:
+        storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")), converter=converter)
+    storage.add_vacancies(records)
+
+    # 1 000 000 KZT - это 200 000 в базовой валюте: запрос совпадает с критерием хранилища
+    query = VacancyQuery().salary(minimum=250000)
+    assert ids(QueryEngine(storage).execute(query)) == ids(storage.get_vacancies(min_salary=250000)) == ["2"]
+    assert query.matches(records[0])
+    if kind == "sqlite":
+        storage.close()
+
+
+def test_query_equality_and_composition():
+    first = VacancyQuery().title_prefix("Python").keywords("django")
+    second = VacancyQuery().keywords("Django") & VacancyQuery().title_prefix("python")
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.matches(RECORDS[0])
+    assert not first.matches(RECORDS[1])
+    with pytest.raises(ValueError):
+        VacancyQuery().salary()
+
+
+def test_planner_puts_selective_predicate_first(storage):
+    engine = QueryEngine(storage)
+    query = VacancyQuery().title_contains("developer").currency("USD")
+    plan = engine.plan(query)
+    assert plan[0].kind == "currency"
+    assert [selectivity for _, selectivity in engine.explain(query)] == [0.25, 0.75]
+
+
+def test_cache_invalidated_by_writes(storage):
+    engine = QueryEngine(storage, cache_size=2)
+    query = VacancyQuery().title_prefix("python")
+
+    assert ids(engine.execute(query)) == ["1", "4"]
+    assert ids(engine.execute(query)) == ["1", "4"]
+    assert engine.stats == {"hits": 1, "misses": 1, "scans": 1}
+
+    storage.add_vacancy({"id": "5", "title": "Python Lead", "salary": None, "description": ""})
+    assert ids(engine.execute(query)) == ["1", "4", "5"]
+    storage.delete_many(ids=["1"])
+    assert ids(engine.execute(query)) == ["4", "5"]
+    assert engine.stats["misses"] == 3
+
+
+def test_cache_is_lru(storage):
+    engine = QueryEngine(storage, cache_size=2)
+    queries = [VacancyQuery().currency(code) for code in ("RUR", "USD", "EUR")]
+    engine.execute(queries[0])
+    engine.execute(queries[1])
+    engine.execute(queries[0])
+    engine.execute(queries[2])
+
+    engine.execute(queries[0])
+    assert engine.stats["hits"] == 2
+    engine.execute(queries[1])
+    assert engine.stats["misses"] == 4
+
+
+def test_execute_many_single_pass(storage):
+    engine = QueryEngine(storage)
+    queries = [
+        VacancyQuery().keywords("django"),
+        VacancyQuery().keywords("django").area("Москва"),
+        VacancyQuery().currency("RUR"),
+        VacancyQuery().keywords("django"),
+    ]
+    results = engine.execute_many(queries)
+
+    assert [ids(found) for found in results] == [["1", "4"], ["1"], ["1", "3"], ["1", "4"]]
+    assert engine.stats["scans"] == 1
+    assert [ids(found) for found in engine.execute_many(queries)] == [ids(found) for found in results]
+    assert engine.stats["scans"] == 1
+
+
+def test_sqlite_storage(tmpdir):
+    storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    storage.add_records(RECORDS)
+    engine = QueryEngine(storage)
+
+    assert ids(engine.execute(VacancyQuery().title_prefix("python").keywords("django"))) == ["1", "4"]
+    storage.upsert_vacancies([{**RECORDS[3], "description": "Flask"}])
+    assert ids(engine.execute(VacancyQuery().title_prefix("python").keywords("django"))) == ["1"]
+    storage.close()
+
+
+def test_cache_invalidated_by_external_writes(storage, tmpdir):
+    engine = QueryEngine(storage)
+    query = VacancyQuery().title_prefix("python")
+    assert ids(engine.execute(query)) == ["1", "4"]
+
+    # Файл меняет другой объект хранилища (как другой процесс); к storage до запроса никто не обращается
+    other = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    other.add_vacancy({"id": "5", "title": "Python Lead", "salary": None, "description": ""})
+
+    assert ids(engine.execute(query)) == ["1", "4", "5"]
+    assert engine.stats["misses"] == 2
+
+
+@pytest.mark.parametrize("kind", ["jsonl", "sqlite"])
+def test_cache_invalidated_by_external_writes_in_other_storages(tmpdir, kind):
+    from src.jsonl_storage import JSONLVacancyStorage
+
+    def open_storage():
+        if kind == "jsonl":
+            return JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")))
+        return SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+
+    storage = open_storage()
+    storage.add_vacancies(RECORDS)
+    engine = QueryEngine(storage)
+    query = VacancyQuery().title_prefix("python")
+    assert ids(engine.execute(query)) == ["1", "4"]
+
+    other = open_storage()
+    other.delete_many(ids=["1"])
+
+    assert ids(engine.execute(query)) == ["4"]
+    # Собственная запись после внешней тоже видна
+    storage.add_vacancy({"id": "5", "title": "Python Lead", "salary": None, "description": ""})
+    assert ids(engine.execute(query)) == ["4", "5"]
+
+
+@pytest.mark.parametrize("kind", ["json", "jsonl", "sqlite"])
+def test_area_on_ingested_store(tmpdir, kind):
+    from src.ingest import ingest_dumps
+    from src.jsonl_storage import JSONLVacancyStorage
+    from tests.mock_hh_server import make_item
+
+    items = [make_item(1), {**make_item(2), "area": {"id": "2", "name": "Санкт-Петербург", "url": "https://api"}}]
+    dump = tmpdir.join("page.json")
+    dump.write_text(json.dumps({"items": items}, ensure_ascii=False), encoding="utf-8")
+    if kind == "json":
+        storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    elif kind == "jsonl":
+        storage = JSONLVacancyStorage(str(tmpdir.join("vacancies.jsonl")))
+    else:
+        storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    ingest_dumps([str(dump)], storage, workers=1)
+    engine = QueryEngine(storage)
+
+    assert ids(engine.execute(VacancyQuery().area("Москва"))) == ["1"]
+    assert ids(engine.execute(VacancyQuery().area(2))) == ["2"]
+    assert ids(engine.execute(VacancyQuery().area("Казань"))) == []
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from src.ranking import TopN, salary_key, top_n
+
+
+def make_vacancy(vacancy_id, salary_from=None, salary_to=None, currency="RUR"):
+    salary = None
+    if salary_from is not None or salary_to is not None:
+        salary = {"from": salary_from, "to": salary_to, "currency": currency}
+    return {"id": vacancy_id, "salary": salary}
+
+
+def test_salary_key_fields():
+    vacancy = make_vacancy("1", 100, 200)
+    assert salary_key("from")(vacancy) == 100
+    assert salary_key("to")(vacancy) == 200
+    assert salary_key("mid")(vacancy) == 150
+    assert salary_key("mid")(make_vacancy("2", salary_to=300)) == 300
+    assert salary_key()(make_vacancy("3")) == 0
+    assert salary_key(rates={"USD": 90})(make_vacancy("4", 1000, currency="USD")) == 90000
+    with pytest.raises(ValueError):
+        salary_key("max")
+
+
+def test_top_n_matches_full_sort():
+    rng = random.Random(1)
+    vacancies = [make_vacancy(str(i), rng.choice([None, 100, 200, 300])) for i in range(200)]
+    key = salary_key()
+    expected = sorted(vacancies, key=key, reverse=True)[:10]
+
+    assert top_n(iter(vacancies), 10) == expected
+
+    accumulator = TopN(10)
+    accumulator.extend(vacancies[:50])
+    accumulator.extend(iter(vacancies[50:]))
+    assert accumulator.result() == expected
+
+
+def test_top_n_empty_and_zero():
+    assert top_n([], 5) == []
+    accumulator = TopN(0)
+    accumulator.push(make_vacancy("1", 100))
+    assert accumulator.result() == []
@@ -0,0 +1,102 @@
+import requests
+import requests_mock
+
+from src.API_HH import HHVacancyAPI
+from src.request_scheduler import RequestScheduler, TokenBucket, parse_retry_after
+
+URL = "https://api.hh.ru/vacancies"
+
+
+class FakeClock:
+    """Управляемые часы: sleep сдвигает время вместо ожидания."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+    for _ in range(6):
+        bucket.acquire()
+    # Два токена доступны сразу, остальные четыре - по одному каждые 0.5 с
+    assert clock.now == 2.0
+
+
+def test_token_bucket_adapts_rate():
+    bucket = TokenBucket(rate=10, min_rate=1)
+    bucket.decrease()
+    bucket.decrease()
+    assert bucket.rate == 2.5
+    for _ in range(100):
+        bucket.increase()
+    assert bucket.rate == 10
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_scheduler_retries_with_retry_after():
+    clock = FakeClock()
+    scheduler = RequestScheduler(max_retries=3, sleep=clock.sleep, jitter=lambda: 1.0)
+    with requests_mock.Mocker() as m:
+        m.get(
+            URL,
+            [
+                {"status_code": 429, "headers": {"Retry-After": "2"}},
+                {"status_code": 503},
+                {"json": {"items": []}, "status_code": 200},
+            ],
+        )
+        response = scheduler.get(requests.Session(), URL)
+
+    assert response.status_code == 200
+    assert clock.sleeps == [2.0, 1.0]
+    assert scheduler.stats == {"requests": 3, "retries": 2, "throttled": 1, "failed": 0}
+
+
+def test_scheduler_gives_up_after_budget():
+    scheduler = RequestScheduler(max_retries=2, sleep=lambda seconds: None)
+    with requests_mock.Mocker() as m:
+        m.get(URL, status_code=500)
+        assert scheduler.get(requests.Session(), URL) is None
+        assert m.call_count == 3
+    assert scheduler.stats["failed"] == 1
+
+
+def test_resume_refetches_only_failed_pages():
+    api = HHVacancyAPI(max_workers=2)
+    failing = {"page": "1"}
+
+    def page_callback(request, context):
+        page = request.qs["page"][0]
+        if page == failing["page"]:
+            context.status_code = 500
+            return {}
+        return {"items": [{"id": page}], "pages": 3}
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=page_callback)
+        vacancies = api.get_vacancies("Python")
+        assert [vacancy["id"] for vacancy in vacancies] == ["0", "2"]
+        assert api.failed_pages == [1]
+
+        failing["page"] = None
+        calls_before = m.call_count
+        vacancies = api.resume()
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2"]
+    assert m.call_count - calls_before == 1
+    assert api.failed_pages == []
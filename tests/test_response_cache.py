@@ -0,0 +1,60 @@
+import os
+import time
+
+import requests_mock
+
+from src.API_HH import HHVacancyAPI
+from src.response_cache import HTTPResponseCache
+
+URL = "https://api.hh.ru/vacancies"
+PAGE = {"items": [{"id": "1", "name": "Python Developer"}], "pages": 1}
+
+
+def test_warm_run_served_from_cache(tmpdir):
+    cache = HTTPResponseCache(str(tmpdir))
+    api = HHVacancyAPI(cache=cache)
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=PAGE)
+        first = api.get_vacancies("Python")
+        second = HHVacancyAPI(cache=HTTPResponseCache(str(tmpdir))).get_vacancies("Python")
+
+    assert first == second
+    assert m.call_count == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["bytes_downloaded"] > 0
+
+
+def test_stale_entry_revalidated_with_etag(tmpdir):
+    cache = HTTPResponseCache(str(tmpdir), ttl=0)
+    api = HHVacancyAPI(cache=cache)
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=PAGE, headers={"ETag": '"v1"'})
+        api.get_vacancies("Python")
+        m.get(URL, status_code=304)
+        vacancies = api.get_vacancies("Python")
+
+    assert vacancies == PAGE["items"]
+    assert m.request_history[-1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats["revalidated"] == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_lru_eviction_by_size(tmpdir):
+    probe = HTTPResponseCache(str(tmpdir.mkdir("probe")))
+    probe.store(probe.make_key(URL, {"page": 0}), URL, "x" * 120)
+    max_bytes = probe.size_bytes * 3 + 20
+    cache = HTTPResponseCache(str(tmpdir.mkdir("cache")), max_bytes=max_bytes)
+    for i in range(3):
+        cache.store(cache.make_key(URL, {"page": i}), URL, "x" * 120)
+        time.sleep(0.01)
+    # Первая запись использована последней и не должна быть вытеснена
+    cache.get(cache.make_key(URL, {"page": 0}))
+    cache.store(cache.make_key(URL, {"page": 3}), URL, "x" * 120)
+
+    assert cache.size_bytes <= max_bytes
+    assert cache.get(cache.make_key(URL, {"page": 0})) is not None
+    assert cache.get(cache.make_key(URL, {"page": 1})) is None
+    assert cache.stats["evicted"] >= 1
+    assert len(os.listdir(cache.directory)) == 3
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from src.Filtered_vacancy import JSONVacancyStorage, match_criteria
+from src.ranking import salary_key, top_n
+
+np = pytest.importorskip("numpy")
+
+from src.salary_columns import SalaryColumns  # noqa: E402
+
+
+@pytest.fixture
+def records(make_record):
+    return [
+        make_record("1", salary={"from": 100000, "to": 150000, "currency": "RUR", "gross": True}),
+        make_record("2", salary={"from": None, "to": 80000, "currency": "RUR", "gross": False}),
+        make_record("3", salary={"from": 1000000, "to": None, "currency": "KZT", "gross": False}),
+        make_record("4"),
+        make_record("5", salary={"from": 100000, "to": 200000, "currency": "RUR", "gross": False}),
+        make_record("6", salary={"to": 90000, "currency": "USD"}),
+    ]
+
+
+@pytest.fixture
+def columns(records):
+    return SalaryColumns(records)
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [{"min_salary": 90000}, {"max_salary": 150000}, {"min_salary": 0}, {"min_salary": 0, "max_salary": 200000}],
+)
+def test_filter_range_matches_match_criteria(columns, records, criteria):
+    rows = columns.filter_range(criteria.get("min_salary"), criteria.get("max_salary"))
+    assert columns.take(rows) == [record for record in records if match_criteria(record, criteria)]
+
+
+@pytest.mark.parametrize("field", ["from", "to", "mid"])
+@pytest.mark.parametrize("k", [0, 1, 2, 3, 6, 10])
+def test_top_k_matches_ranking(columns, records, field, k):
+    assert columns.take(columns.top_k(k, field)) == top_n(records, k, salary_key(field))
+
+
+def test_columns_and_ids(columns):
+    assert columns.currencies == ["RUR", "KZT", "USD"]
+    assert columns.currency.tolist() == [0, 0, 1, -1, 0, 2]
+    assert columns.gross.tolist() == [True, False, False, False, False, False]
+    assert columns.position("5") == 4
+    assert columns.position("missing") is None
+
+
+def test_stats(columns):
+    stats = columns.stats("from", bins=2)
+    assert set(stats) == {"RUR", "KZT"}
+    assert stats["RUR"]["count"] == 2
+    assert stats["RUR"]["median"] == 100000
+    assert stats["RUR"]["percentiles"][50] == 100000
+    assert sum(stats["RUR"]["histogram"]["counts"]) == 2
+    assert columns.stats("to")["USD"]["mean"] == 90000
+
+
+def test_json_storage_uses_columns(tmpdir, records):
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    with open(storage.filename, "w") as file:
+        json.dump(records, file)
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=90000)] == ["1", "3", "5"]
+    columns = storage.salary_columns()
+    assert storage.salary_columns() is columns
+
+    storage.delete_vacancy_by_title("Python Developer")
+    assert storage.salary_columns() is not columns
+    assert storage.get_vacancies(min_salary=0) == []
@@ -0,0 +1,86 @@
+import pytest
+
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.search_index import VacancySearchIndex, tokenize
+from src.sqlite_storage import SQLiteVacancyStorage
+from src.Vacancy import Vacancy
+
+
+@pytest.fixture
+def index(make_record):
+    return VacancySearchIndex(
+        [
+            make_record("1", "Python Developer", description="Опыт работы с <highlighttext>Django</highlighttext>"),
+            make_record("2", "Java Developer", description="Знание Spring и SQL"),
+            make_record("3", "Аналитик данных", description="Python, SQL, Ёмкие отчеты"),
+        ]
+    )
+
+
+def ids(vacancies):
+    return [vacancy["id"] for vacancy in vacancies]
+
+
+def test_tokenize():
+    assert tokenize("Опыт с <highlighttext>Python</highlighttext>, ЁЛКА!") == ["опыт", "с", "python", "елка"]
+
+
+def test_search_and_or(index):
+    assert ids(index.search("python")) == ["1", "3"]
+    assert ids(index.search("python sql")) == ["3"]
+    assert ids(index.search("django spring", mode="or")) == ["1", "2"]
+    assert ids(index.search("емкие")) == ["3"]
+    assert index.search("golang") == []
+    assert index.search("") == []
+    with pytest.raises(ValueError):
+        index.search("python", mode="not")
+
+
+def test_search_prefix(index):
+    assert ids(index.search("dev*")) == ["1", "2"]
+    assert ids(index.search("анал* sql")) == ["3"]
+
+
+def test_search_api_format():
+    index = VacancySearchIndex([{"id": "1", "name": "Тестировщик", "snippet": {"requirement": "Знание Python"}}])
+    assert ids(index.search("тестировщик python")) == ["1"]
+
+
+def test_remove_and_replace(index, make_record):
+    index.remove("1")
+    assert ids(index.search("python")) == ["3"]
+    assert index.search("django") == []
+
+    index.add(make_record("3", "Аналитик", description="Excel"))
+    assert index.search("python") == []
+    assert ids(index.search("excel")) == ["3"]
+    assert len(index) == 2
+
+
+def test_attach_json_storage(tmpdir):
+    storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    storage.add_vacancy(Vacancy("1", "Python Developer", "", None, "Django"))
+    index = VacancySearchIndex.attach(storage)
+    assert ids(index.search("django")) == ["1"]
+
+    storage.add_vacancies([Vacancy("2", "Python Developer", "", None, "Flask")])
+    assert ids(index.search("python")) == ["1", "2"]
+
+    storage.upsert_vacancies([Vacancy("1", "Python Developer", "", None, "FastAPI")])
+    assert index.search("django") == []
+    assert ids(index.search("fastapi")) == ["1"]
+
+    storage.delete_vacancy_by_title("Python Developer")
+    assert index.search("python") == []
+
+
+def test_attach_sqlite_storage(tmpdir):
+    storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    index = VacancySearchIndex.attach(storage)
+    storage.add_vacancies([Vacancy("1", "Python Developer", "", None, "Django"), Vacancy("2", "QA", "", None, None)])
+    assert ids(index.search("django")) == ["1"]
+
+    storage.delete_vacancy_by_title("Python Developer")
+    assert index.search("django") == []
+    assert ids(index.search("qa")) == ["2"]
+    storage.close()
@@ -0,0 +1,106 @@
+import json
+import sys
+
+import pytest
+
+from src.Filtered_vacancy import JSONVacancyStorage
+from src.snapshot import VacancySnapshot, write_snapshot
+from src.sqlite_storage import SQLiteVacancyStorage
+
+RECORDS = [
+    {
+        "id": "1",
+        "title": "Python Developer",
+        "link": "https://hh.ru/vacancy/1",
+        "salary": {"from": 150000, "to": 250000, "currency": "RUR", "gross": False},
+        "description": "Опыт с <highlighttext>Django</highlighttext>",
+    },
+    {"id": "2", "title": "Аналитик", "link": "https://hh.ru/vacancy/2", "salary": None, "description": None},
+    {
+        "id": "3",
+        "title": "Data Engineer",
+        "link": "https://hh.ru/vacancy/3",
+        "salary": {"from": None, "to": 4000, "currency": "USD", "gross": True},
+        "description": "",
+        "area": {"id": "1", "name": "Москва"},
+    },
+    {"id": "4", "title": "Go", "link": "", "salary": {"from": 1.5, "to": None}, "description": "d"},
+    {"id": 5, "title": "Без ссылки", "salary": "от 100000"},
+]
+
+
+@pytest.fixture
+def snapshot(tmpdir, rates_file):
+    path = str(tmpdir.join("vacancies.snap"))
+    assert write_snapshot(path, RECORDS) == len(RECORDS)
+    with VacancySnapshot(path) as snapshot:
+        yield snapshot
+
+
+def test_round_trip(snapshot):
+    assert len(snapshot) == len(RECORDS)
+    records = list(snapshot)
+    assert records == RECORDS
+    # Порядок ключей тоже сохраняется: запись в JSON дает тот же текст
+    assert json.dumps(records, ensure_ascii=False) == json.dumps(RECORDS, ensure_ascii=False)
+    assert snapshot[-1] == RECORDS[-1]
+    assert snapshot[1:3] == RECORDS[1:3]
+    with pytest.raises(IndexError):
+        snapshot[len(RECORDS)]
+
+
+def test_big_endian_round_trip(tmpdir, rates_file, monkeypatch):
+    # Писатель переставляет байты столбцов на big-endian платформах, читатель - обратно
+    monkeypatch.setattr(sys, "byteorder", "big")
+    path = str(tmpdir.join("vacancies.snap"))
+    write_snapshot(path, RECORDS)
+    with VacancySnapshot(path) as snapshot:
+        assert list(snapshot) == RECORDS
+        assert snapshot.string(0, "title") == "Python Developer"
+
+
+def test_lookups(snapshot):
+    assert snapshot.string(0, "title") == "Python Developer"
+    assert snapshot.string(1, "description") is None
+    assert snapshot.get_vacancy("3") == RECORDS[2]
+    assert snapshot.get_vacancy("9") is None
+    assert [vacancy["id"] for vacancy in snapshot.get_vacancies(title="Аналитик")] == ["2"]
+    # 4000 USD по курсам data/currency_rates.json - около 351 000 в рублях
+    assert [vacancy["id"] for vacancy in snapshot.get_vacancies(max_salary=5000)] == []
+    assert [vacancy["id"] for vacancy in snapshot.get_vacancies(max_salary=400000)] == ["1", "3"]
+    assert [vacancy["id"] for vacancy in snapshot.get_vacancies(min_salary=100000)] == ["1"]
+
+
+def test_salary_columns_are_zero_copy(snapshot):
+    np = pytest.importorskip("numpy")
+    columns = snapshot.salary_columns()
+
+    assert not columns.salary_from.flags.owndata
+    assert not columns.salary_from.flags.writeable
+    assert np.isnan(columns.salary_from[1])
+    assert columns.currencies == ["RUR", "USD"]
+    assert columns.currency.tolist() == [0, -1, 1, -1, -1]
+    assert columns.from_missing.tolist() == [False, True, False, False, True]
+    assert columns.position("3") == 2
+    assert [columns.ids[row] for row in columns.top_k(2)] == ["1", "4"]
+
+
+def test_write_from_storages(tmpdir):
+    json_storage = JSONVacancyStorage(str(tmpdir.join("vacancies.json")))
+    json_storage.add_vacancies(RECORDS[:4])
+    sqlite_storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    sqlite_storage.add_records(RECORDS[:4])
+
+    for storage in (json_storage, sqlite_storage):
+        path = str(tmpdir.join("storage.snap"))
+        write_snapshot(path, storage)
+        with VacancySnapshot(path) as snapshot:
+            assert list(snapshot) == storage.get_vacancies()
+    sqlite_storage.close()
+
+
+def test_invalid_file(tmpdir):
+    path = tmpdir.join("vacancies.json")
+    path.write("[]" * 100)
+    with pytest.raises(ValueError):
+        VacancySnapshot(str(path))
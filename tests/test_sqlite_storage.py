@@ -0,0 +1,144 @@
+import json
+import sqlite3
+
+import pytest
+
+from src.sqlite_storage import SQLiteVacancyStorage, migrate_json_to_sqlite
+
+
+@pytest.fixture
+def storage(tmpdir):
+    storage = SQLiteVacancyStorage(str(tmpdir.join("vacancies.db")))
+    yield storage
+    storage.close()
+
+
+def test_add_and_get_by_criteria(storage, make_vacancy):
+    storage.add_vacancies(
+        [
+            make_vacancy("1", salary={"from": 100000, "to": 150000, "currency": "RUR", "gross": False}),
+            make_vacancy("2", "Data Scientist", salary={"from": 90000, "to": None}),
+            make_vacancy("3"),
+        ]
+    )
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["1", "2", "3"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(title="Python Developer")] == ["1", "3"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(min_salary=95000)] == ["1"]
+    assert [vacancy["id"] for vacancy in storage.get_vacancies(max_salary=160000)] == ["1"]
+    assert storage.get_vacancy("1")["salary"] == {"from": 100000, "to": 150000, "currency": "RUR", "gross": False}
+    assert storage.get_vacancy("3")["salary"] is None
+
+
+def test_delete_by_title(storage, make_vacancy):
+    storage.add_vacancies([make_vacancy("1"), make_vacancy("2", "Data Scientist")])
+    storage.delete_vacancy_by_title("Python Developer")
+
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["2"]
+
+
+def test_wal_mode(storage):
+    assert storage.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_migrate_json_to_sqlite(storage, tmpdir):
+    stored = tmpdir.join("vacancies.json")
+    stored.write(json.dumps([{"id": "1", "title": "Python", "link": "l", "salary": None, "description": "d"}]))
+    api_page = tmpdir.join("page.json")
+    api_page.write(
+        json.dumps(
+            {
+                "items": [
+                    {
+                        "id": "2",
+                        "name": "Java",
+                        "alternate_url": "https://hh.ru/vacancy/2",
+                        "salary": {"from": 1},
+                        "snippet": {"requirement": "Java"},
+                    }
+                ]
+            }
+        )
+    )
+    broken = tmpdir.join("broken.json")
+    broken.write("[{")
+
+    assert migrate_json_to_sqlite([str(stored), str(api_page), str(broken)], storage) == {
+        "migrated": 2,
+        "skipped": 1,
+        "count": 2,
+    }
+    assert storage.get_vacancy("2")["title"] == "Java"
+
+
+def test_migrate_truncated_json(storage, tmpdir):
+    # Файл обрезан на середине третьей записи, как data/vacancies.json
+    records = [{"id": str(i), "title": "Python", "link": "l", "salary": None, "description": "d"} for i in range(3)]
+    text = json.dumps(records, indent=4)
+    truncated = tmpdir.join("vacancies.json")
+    truncated.write(text[: text.rindex('"title"')])
+
+    assert migrate_json_to_sqlite([str(truncated)], storage) == {"migrated": 1, "skipped": 0, "count": 2}
+    assert [vacancy["id"] for vacancy in storage.get_vacancies()] == ["0", "1"]
+
+
+def test_upsert_by_content_hash(storage, make_vacancy):
+    storage.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+
+    result = storage.upsert_vacancies([make_vacancy("1"), make_vacancy("2", "Data Scientist"), make_vacancy("3")])
+
+    assert result == {"added": 1, "updated": 1, "unchanged": 1}
+    assert [vacancy["title"] for vacancy in storage.get_vacancies()] == [
+        "Python Developer",
+        "Data Scientist",
+        "Python Developer",
+    ]
+    assert storage.upsert_vacancies([make_vacancy("2", "Data Scientist")])["unchanged"] == 1
+
+
+def test_hash_column_added_to_old_table(tmpdir, make_vacancy):
+    path = str(tmpdir.join("old.db"))
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE vacancies (id TEXT PRIMARY KEY, title TEXT, link TEXT, salary_from REAL, salary_to REAL, "
+        "salary TEXT, description TEXT)"
+    )
+    connection.execute(
+        "INSERT INTO vacancies VALUES ('1', 'Python Developer', 'https://hh.ru/vacancy/1', NULL, NULL, 'null', "
+        "'Описание вакансии')"
+    )
+    connection.commit()
+    connection.close()
+
+    storage = SQLiteVacancyStorage(path)
+    assert storage.upsert_vacancies([make_vacancy("1")]) == {"added": 0, "updated": 0, "unchanged": 1}
+    # Столбец area добавлен в конец старой таблицы
+    storage.upsert_vacancies([{**make_vacancy("2").to_dict(), "area": {"id": "1", "name": "Москва"}}])
+    assert storage.get_vacancy("2")["area"] == {"id": "1", "name": "Москва"}
+    assert "area" not in storage.get_vacancy("1")
+    storage.close()
+
+
+def test_delete_many_and_where(storage, make_vacancy):
+    storage.add_vacancies(
+        [
+            make_vacancy("1", salary={"from": 100000, "to": None}),
+            make_vacancy("2", "Data Scientist"),
+            make_vacancy("3", "Go Developer", salary={"from": 300000, "to": None}),
+            make_vacancy("4", "Data Scientist"),
+        ]
+    )
+    removed = []
+    storage.add_listener(lambda event, records: removed.extend(record["id"] for record in records))
+
+    assert storage.delete_many(ids=["1", "9"], titles=["Data Scientist"]) == 3
+    assert sorted(removed) == ["1", "2", "4"]
+    assert storage.delete_where(max_salary=50000) == 0
+    assert storage.delete_where(lambda vacancy: vacancy["id"] == "3", min_salary=200000) == 1
+    assert storage.count() == 0
+
+
+def test_delete_many_in_chunks(storage, make_vacancy):
+    storage.add_vacancies(make_vacancy(str(i)) for i in range(2500))
+    assert storage.delete_many(ids=[str(i) for i in range(0, 2500, 2)]) == 1250
+    assert storage.count() == 1250
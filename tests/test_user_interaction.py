@@ -56,3 +56,30 @@ def test_search_vacancies_by_description(capfd, sample_vacancies):
     assert "Вакансия 1:" in captured.out
     assert "Вакансия 2:" not in captured.out
     assert "Вакансия 3:" not in captured.out
+
+
+def test_search_vacancies_by_description_with_index(sample_vacancies):
+    from src.search_index import VacancySearchIndex
+
+    vacancies = [dict(vacancy, id=str(i)) for i, vacancy in enumerate(sample_vacancies)]
+    # В индексе есть вакансии, которых нет среди переданных: они не должны попасть в результат
+    index = VacancySearchIndex(vacancies + [{"id": "9", "title": "Python Developer", "description": "Знание"}])
+
+    found = UserInteraction.search_vacancies_by_description(vacancies[1:], "знание", index=index)
+
+    assert found == vacancies[1:]
+
+
+def test_user_interaction_reports_failed_pages(monkeypatch, capsys, sample_vacancies):
+    class PartialAPI:
+        failed_pages = [2]
+
+        def get_vacancies(self, keyword):
+            return sample_vacancies
+
+    answers = iter(["Python", "1", "Python"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+    monkeypatch.setattr(UserInteraction, "save_to_json_result", lambda *args, **kwargs: None)
+    UserInteraction.user_interaction(PartialAPI())
+
+    assert "Не удалось загрузить страницы [2], результаты неполные." in capsys.readouterr().out